@@ -3,20 +3,123 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import time
 import itertools
+import importlib
 import requests
 
 from importlib.metadata import PackageNotFoundError, version
 from urllib.parse import urlencode
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from calendar import timegm
 
+from contextlib import aclosing
 from enum import Enum
-from typing import Generator, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
 
 from . import _feed
+from ._arxivid import ArxivId
+from ._bulk import IdLookup
+from ._cursor import Cursor, _Checkpointer
 from ._feed import ParsedFeed
+from ._hooks import ClientHooks, ClientStats, LatencyHistogram
+from ._ratelimit import InMemoryRateLimiter, RateLimiter
+from ._resultset import ResultSet
+from ._retry import RetryPolicy, _parse_retry_after
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ._batch import ParquetWriter, ResultBatch
+    from ._cache import PageCache, ResponseCache
+    from ._queue import LeaseLostError, Worker, WorkQueue, WorkUnit
+    from ._ratelimit import SQLiteRateLimiter
+    from ._serialize import ResultReader, ResultWriter
+    from ._shard import Shard, ShardPlanner
+    from ._standin import StandInServer
+
+
+__all__ = [
+    "Result",
+    "ArxivId",
+    "SortCriterion",
+    "SortOrder",
+    "Search",
+    "Client",
+    "AsyncClient",
+    "IdLookup",
+    "ResultBatch",
+    "ResultSet",
+    "ResultWriter",
+    "ResultReader",
+    "ParquetWriter",
+    "Cursor",
+    "ShardPlanner",
+    "Shard",
+    "WorkQueue",
+    "WorkUnit",
+    "Worker",
+    "RateLimiter",
+    "InMemoryRateLimiter",
+    "SQLiteRateLimiter",
+    "ResponseCache",
+    "PageCache",
+    "RetryPolicy",
+    "ClientHooks",
+    "ClientStats",
+    "LatencyHistogram",
+    "StandInServer",
+    "ArxivError",
+    "UnexpectedEmptyPageError",
+    "HTTPError",
+    "LeaseLostError",
+]
+
+_LAZY_IMPORTS = {
+    "ParquetWriter": "_batch",
+    "ResultBatch": "_batch",
+    "PageCache": "_cache",
+    "ResponseCache": "_cache",
+    "LeaseLostError": "_queue",
+    "Worker": "_queue",
+    "WorkQueue": "_queue",
+    "WorkUnit": "_queue",
+    "SQLiteRateLimiter": "_ratelimit",
+    "ResultReader": "_serialize",
+    "ResultWriter": "_serialize",
+    "Shard": "_shard",
+    "ShardPlanner": "_shard",
+    "StandInServer": "_standin",
+}
+"""
+Public names imported from their modules on first access, so `import arxiv`
+doesn't pay for SQLite, `http.server` and the other dependencies of features
+a program may never use.
+"""
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +133,9 @@ _USER_AGENT = f"arxiv.py/{__version__}"
 
 _DEFAULT_TIME = datetime.min
 
+_RESULT_SCHEMA_VERSION = 1
+"""Version of the `Result.to_dict` schema."""
+
 
 class Result:
     """
@@ -39,6 +145,28 @@ class Result:
     Returned](https://arxiv.org/help/api/user-manual#_details_of_atom_results_returned).
     """
 
+    # Slots rather than per-instance `__dict__`s here and in `Author` and
+    # `Link` save a few hundred bytes per result, which adds up for jobs
+    # holding millions of them.
+    __slots__ = (
+        "entry_id",
+        "updated",
+        "published",
+        "title",
+        "authors",
+        "summary",
+        "comment",
+        "journal_ref",
+        "doi",
+        "primary_category",
+        "categories",
+        "links",
+        "pdf_url",
+        "_entry",
+        "_fields",
+        "_arxiv_id",
+    )
+
     entry_id: str
     """A url of the form `https://arxiv.org/abs/{id}`."""
     updated: datetime
@@ -72,6 +200,13 @@ class Result:
     pdf_url: str | None
     """The URL of a PDF version of this result if present among links."""
 
+    _entry: _feed._Entry
+    """A lazy result's raw fields; see `Result._lazy`."""
+    _fields: frozenset[str]
+    """The fields a projected result has; see `Result._projected`."""
+    _arxiv_id: ArxivId
+    """The cached `Result.arxiv_id`."""
+
     def __init__(
         self,
         entry_id: str,
@@ -108,10 +243,89 @@ class Result:
         # Calculated members
         self.pdf_url = Result._get_pdf_url(self.links)
 
+    @classmethod
+    def _lazy(cls, entry: _feed._Entry) -> Result:
+        """
+        Constructs a result that decodes its `_feed._LAZY_FIELDS` from `entry`
+        only when they're first accessed.
+        """
+        result = cls.__new__(cls)
+        result._entry = entry
+        result.entry_id = entry.entry_id
+        result.summary = entry.summary or ""
+        result.comment = entry.comment
+        result.journal_ref = entry.journal_ref
+        result.doi = entry.doi
+        result.primary_category = entry.primary_category
+        result.categories = entry.categories
+        return result
+
+    @classmethod
+    def _projected(cls, entry: _feed._Entry, fields: frozenset[str]) -> Result:
+        """
+        Constructs a result with only the specified `fields`, decoded from an
+        `entry` read with them.
+        """
+        result = cls.__new__(cls)
+        result._fields = fields
+        for name in fields:
+            setattr(result, name, _feed._decode_field(entry, name))
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for unset attributes: a lazy result's undecoded fields,
+        # or fields a projected result wasn't parsed with. Unset private
+        # attributes (`_entry`, `_fields`) raise below, so this never recurses.
+        entry = getattr(self, "_entry", None) if name in _feed._LAZY_FIELDS else None
+        if entry is None:
+            fields = getattr(self, "_fields", None) if name in _feed._FIELD_TAGS else None
+            if fields is not None:
+                raise AttributeError(
+                    "Result field {!r} wasn't among the requested fields {}".format(
+                        name, sorted(fields)
+                    )
+                )
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, name)
+            )
+        if name == "pdf_url":
+            value = Result._get_pdf_url(self.links)
+        else:
+            value = _feed._decode_field(entry, name)
+        setattr(self, name, value)
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles a lazy result as its raw entry, and any other result as its
+        # field values, without recomputing `pdf_url` when unpickled.
+        state = getattr(self, "__dict__", None) or None
+        entry = getattr(self, "_entry", None)
+        if entry is not None:
+            return (type(self)._lazy, (entry,), state)
+        fields = getattr(self, "_fields", None)
+        names = (
+            _feed._FIELD_TAGS if fields is None else [n for n in _feed._FIELD_TAGS if n in fields]
+        )
+        values = tuple(getattr(self, name) for name in names)
+        return (_restore_result, (type(self), values, fields), state)
+
+    def __setstate__(self, state: Any) -> None:
+        _set_slots(self, state)
+
     def __str__(self) -> str:
         return self.entry_id
 
     def __repr__(self) -> str:
+        fields = getattr(self, "_fields", None)
+        if fields is not None:
+            return "{}({})".format(
+                _classname(self),
+                ", ".join(
+                    "{}={}".format(name, repr(getattr(self, name)))
+                    for name in _feed._FIELD_TAGS
+                    if name in fields
+                ),
+            )
         return (
             "{}(entry_id={}, updated={}, published={}, title={}, authors={}, "
             "summary={}, comment={}, journal_ref={}, doi={}, "
@@ -137,6 +351,67 @@ class Result:
             return self.entry_id == other.entry_id
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.entry_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns a JSON-serializable representation of this result, including a
+        schema `version`. Timestamps are ISO 8601 strings. A result fetched
+        with `fields` includes only those fields.
+        """
+        fields = getattr(self, "_fields", None)
+        data: dict[str, Any] = {"version": _RESULT_SCHEMA_VERSION}
+        for name in _feed._FIELD_TAGS:
+            if fields is not None and name not in fields:
+                continue
+            value = getattr(self, name)
+            if name == "updated" or name == "published":
+                value = value.isoformat()
+            elif name == "authors":
+                value = [{"name": a.name, "affiliation": a.affiliation} for a in value]
+            elif name == "links":
+                value = [
+                    {
+                        "href": link.href,
+                        "title": link.title,
+                        "rel": link.rel,
+                        "content_type": link.content_type,
+                    }
+                    for link in value
+                ]
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Result:
+        """
+        Reconstructs a result from the output of `Result.to_dict`. If `data`
+        lacks some fields, the result has only those present, like a result
+        fetched with `fields`.
+        """
+        if data.get("version") != _RESULT_SCHEMA_VERSION:
+            raise ValueError("Unsupported result version: {}".format(data.get("version")))
+        if "entry_id" not in data:
+            raise ValueError("Result data lacks entry_id")
+        result = cls.__new__(cls)
+        present = [name for name in _feed._FIELD_TAGS if name in data]
+        for name in present:
+            value = data[name]
+            if name == "updated" or name == "published":
+                value = datetime.fromisoformat(value)
+            elif name == "authors":
+                value = [Result.Author(a["name"], a["affiliation"]) for a in value]
+            elif name == "links":
+                value = [
+                    Result.Link(link["href"], link["title"], link["rel"], link["content_type"])
+                    for link in value
+                ]
+            setattr(result, name, value)
+        if len(present) < len(_feed._FIELD_TAGS):
+            result._fields = frozenset(present)
+        return result
+
     def get_short_id(self) -> str:
         """
         Returns the short ID for this result.
@@ -154,6 +429,20 @@ class Result:
         """
         return self.entry_id.split("arxiv.org/abs/")[-1]
 
+    @property
+    def arxiv_id(self) -> ArxivId:
+        """
+        This result's parsed `ArxivId`, computed on first access. Unlike
+        `get_short_id`, it's parsed once per result, so repeated lookups of
+        its base ID or version (e.g. when joining or sorting results) are
+        cheap.
+        """
+        try:
+            return self._arxiv_id
+        except AttributeError:
+            self._arxiv_id = ArxivId(self.entry_id)
+            return self._arxiv_id
+
     def source_url(self) -> str | None:
         """
         Derives a URL for the source tarfile for this result.
@@ -193,6 +482,8 @@ class Result:
         A light inner class for representing a result's authors.
         """
 
+        __slots__ = ("name", "affiliation")
+
         name: str
         """The author's name."""
         affiliation: list[str]
@@ -212,6 +503,12 @@ class Result:
             self.name = name
             self.affiliation = affiliation or []
 
+        def __reduce__(self) -> tuple[Any, ...]:
+            return (type(self), (self.name, self.affiliation))
+
+        def __setstate__(self, state: Any) -> None:
+            _set_slots(self, state)
+
         def __str__(self) -> str:
             return self.name
 
@@ -232,6 +529,8 @@ class Result:
         A light inner class for representing a result's links.
         """
 
+        __slots__ = ("href", "title", "rel", "content_type")
+
         href: str
         """The link's `href` attribute."""
         title: str | None
@@ -256,6 +555,12 @@ class Result:
             self.rel = rel
             self.content_type = content_type
 
+        def __reduce__(self) -> tuple[Any, ...]:
+            return (type(self), (self.href, self.title, self.rel, self.content_type))
+
+        def __setstate__(self, state: Any) -> None:
+            _set_slots(self, state)
+
         def __str__(self) -> str:
             return self.href
 
@@ -406,6 +711,31 @@ class Search:
             "sortOrder": self.sort_order.value,
         }
 
+    def _to_dict(self) -> dict[str, Any]:
+        """
+        Returns a JSON-serializable representation of this search.
+        """
+        return {
+            "query": self.query,
+            "id_list": self.id_list,
+            "max_results": self.max_results,
+            "sort_by": self.sort_by.value,
+            "sort_order": self.sort_order.value,
+        }
+
+    @classmethod
+    def _from_dict(cls, data: dict[str, Any]) -> Search:
+        """
+        Reconstructs a search from the output of `Search._to_dict`.
+        """
+        return cls(
+            query=data["query"],
+            id_list=data["id_list"],
+            max_results=data["max_results"],
+            sort_by=SortCriterion(data["sort_by"]),
+            sort_order=SortOrder(data["sort_order"]),
+        )
+
 
 class Client:
     """
@@ -413,6 +743,10 @@ class Client:
 
     This class obscures pagination and retry logic, and exposes
     `Client.results`.
+
+    A `Client` is safe to share between threads: its requests are scheduled
+    into successive slots at least `delay_seconds` apart by its
+    `rate_limiter`, and they share one `requests.Session` connection pool.
     """
 
     query_url_format = "https://export.arxiv.org/api/query?{}"
@@ -437,11 +771,77 @@ class Client:
     """
     Number of times to retry a failing API request before raising an Exception.
     """
+    retry_policy: RetryPolicy
+    """
+    Decides which failures to retry and how long to back off before each
+    retry, within `num_retries`.
+    """
+    rate_limiter: RateLimiter
+    """
+    Schedules this client's requests `delay_seconds` apart. By default, each
+    client has its own `InMemoryRateLimiter`; pass a shared limiter (e.g. a
+    `SQLiteRateLimiter`) to make several clients or processes share a budget.
+    """
+    cache: ResponseCache | None
+    """
+    An optional on-disk cache of raw API responses. Pages found in the cache
+    are served without a request or a rate-limit sleep.
+    """
+    page_cache: PageCache | None
+    """
+    An optional in-memory cache of parsed pages, which may be shared between
+    clients. Pages found in it are served without a request or parsing.
+    """
+    prefetch: int
+    """
+    Number of pages to fetch ahead of the consumer on a background thread.
+    With `prefetch=1`, page N+1 is requested (still respecting
+    `delay_seconds`) while the caller processes page N. Zero disables
+    prefetching.
+    """
+    stream: bool
+    """
+    Whether to parse each page incrementally as it downloads, yielding each
+    result as soon as its entry arrives. Streaming keeps memory flat for large
+    page sizes and shortens the time to the first result. Streaming clients
+    don't use `cache`, `page_cache`, or `prefetch`.
+    """
+    lazy: bool
+    """
+    Whether results decode their `updated`, `published`, `title`, `authors`,
+    `links` and `pdf_url` fields only when first accessed. Lazy results cut
+    parsing time for jobs that only inspect a few fields (e.g. `entry_id` and
+    `updated`); comparing results or calling `get_short_id` decodes nothing.
+    """
+    hooks: list[ClientHooks]
+    """
+    Observers notified as each request moves through its stages: rate-limit
+    sleep, the HTTP request, parsing, and retries.
+    """
+    stats: ClientStats
+    """
+    Counters and per-stage latency histograms for this client's requests,
+    aggregated from the same notifications as `hooks`.
+    """
 
-    _last_request_dt: datetime | None
     _session: requests.Session
+    _pool: _feed._ValuePool
+    """Canonical instances of values repeated across this client's results."""
 
-    def __init__(self, page_size: int = 100, delay_seconds: float = 3.0, num_retries: int = 3):
+    def __init__(
+        self,
+        page_size: int = 100,
+        delay_seconds: float = 3.0,
+        num_retries: int = 3,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        page_cache: PageCache | None = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        hooks: Iterable[ClientHooks] = (),
+        lazy: bool = False,
+    ):
         """
         Constructs an arXiv API client with the specified options.
 
@@ -453,8 +853,17 @@ class Client:
         self.page_size = page_size
         self.delay_seconds = delay_seconds
         self.num_retries = num_retries
-        self._last_request_dt = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or InMemoryRateLimiter()
+        self.cache = cache
+        self.page_cache = page_cache
+        self.prefetch = prefetch
+        self.stream = stream
+        self.lazy = lazy
+        self.hooks = list(hooks)
+        self.stats = ClientStats()
         self._session = requests.Session()
+        self._pool = _feed._ValuePool()
 
     def __str__(self) -> str:
         return f"Client(page_size={self.page_size}, delay={self.delay_seconds}s, retries={self.num_retries})"
@@ -467,7 +876,15 @@ class Client:
             repr(self.num_retries),
         )
 
-    def results(self, search: Search, offset: int = 0) -> Iterator[Result]:
+    def results(
+        self,
+        search: Search,
+        offset: int = 0,
+        resume_from: Cursor | None = None,
+        on_checkpoint: Callable[[Cursor], None] | None = None,
+        checkpoint_every: int = 1,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[Result]:
         """
         Uses this client configuration to fetch one page of the search results
         at a time, yielding the parsed `Result`s, until `max_results` results
@@ -479,97 +896,696 @@ class Client:
         When `offset` is greater than or equal to `search.max_results`, the full
         result set is discarded.
 
+        For long runs, pass `on_checkpoint` to receive a `Cursor` each time
+        `checkpoint_every` pages have been fully consumed. Passing a saved
+        cursor as `resume_from` (instead of an `offset`) continues the run
+        where that cursor left off.
+
+        Pass `fields` to parse only the named `Result` attributes (plus
+        `entry_id`, which is always parsed), e.g. `["entry_id", "updated"]`.
+        The feed elements behind other fields are skipped entirely, which
+        speeds up parsing and shrinks each result; accessing an unparsed field
+        raises `AttributeError`. `fields` overrides `self.lazy`.
+
         For more on using generators, see
         [Generators](https://wiki.python.org/moin/Generators).
         """
+        projection = _feed._projection(fields) if fields is not None else None
+        seen_ids: frozenset[str] = frozenset()
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1: {}".format(checkpoint_every))
+        if resume_from is not None:
+            if offset:
+                raise ValueError("Pass either offset or resume_from, not both")
+            if resume_from.search._to_dict() != search._to_dict():
+                raise ValueError("Cursor is for a different search: {}".format(resume_from.search))
+            offset = resume_from.offset
+            seen_ids = frozenset(resume_from.last_seen_ids)
         limit = search.max_results - offset if search.max_results else None
         if limit and limit < 0:
             return iter(())
-        return itertools.islice(self._results(search, offset), limit)
+        checkpointer = None
+        if on_checkpoint is not None:
+            checkpointer = _Checkpointer(search, on_checkpoint, checkpoint_every)
+        results: Iterator[Result] = self._results(search, offset, checkpointer, projection)
+        if seen_ids:
+            results = (r for r in results if r.entry_id not in seen_ids)
+        return itertools.islice(results, limit)
+
+    def batches(self, search: Search, offset: int = 0) -> Iterator[ResultBatch]:
+        """
+        Like `results`, but yields each page of results as a columnar
+        `ResultBatch`, built without constructing a `Result` per entry. Batches
+        have up to `self.page_size` rows; the last is truncated so the batches
+        hold at most `max_results` results in all.
+
+        Batches are always fetched whole-page: this doesn't stream, even if
+        `self.stream` is set.
+
+        ```python
+        for batch in client.batches(search):
+            columns = batch.to_numpy()
+        ```
+        """
+        limit = search.max_results - offset if search.max_results else None
+        if limit is not None and limit <= 0:
+            return iter(())
+        return self._batches(search, offset, limit)
+
+    def _batches(
+        self, search: Search, offset: int, limit: int | None
+    ) -> Generator[ResultBatch, None, None]:
+        pages = self._pages(search, offset, columnar=True)
+        if self.prefetch > 0:
+            pages = self._prefetch(pages)
+        for feed in pages:
+            assert feed.batch is not None
+            if limit is not None and len(feed.batch) >= limit:
+                yield feed.batch._head(limit)
+                pages.close()
+                return
+            if limit is not None:
+                limit -= len(feed.batch)
+            yield feed.batch
+
+    def fetch_ids(
+        self,
+        ids: Iterable[str],
+        batch_size: int | None = None,
+        ordered: bool = True,
+        max_id_list_length: int = 4000,
+    ) -> IdLookup:
+        """
+        Fetches the results for many known arXiv IDs, returning an `IdLookup`
+        that streams them as each batch arrives.
+
+        IDs are normalized (stripping e.g. `arXiv:` prefixes and abstract URLs)
+        and deduplicated, then requested in batches of up to `batch_size` IDs
+        (by default, `self.page_size`), split further where needed to keep each
+        URL-encoded `id_list` within `max_id_list_length` characters.
+
+        IDs that aren't valid arXiv IDs are listed in `IdLookup.invalid` and
+        not requested. If arXiv still rejects a batch, it's split in halves
+        until the rejected IDs are isolated, so they can't sink their
+        neighbours.
+
+        If `ordered`, results are yielded in input order; otherwise, in arrival
+        order. Once iteration finishes, `IdLookup.missing` lists the IDs for
+        which no result was returned.
+
+        ```python
+        lookup = client.fetch_ids(ids)
+        for result in lookup:
+            ...
+        print("Missing:", lookup.missing)
+        ```
+        """
+        return IdLookup(
+            self,
+            ids,
+            batch_size=batch_size or self.page_size,
+            ordered=ordered,
+            max_id_list_length=max_id_list_length,
+        )
 
-    def _results(self, search: Search, offset: int = 0) -> Generator[Result, None, None]:
-        page_url = self._format_url(search, offset, self.page_size)
-        feed = self._parse_feed(page_url, first_page=True)
-        if not feed.results:
+    def _results(
+        self,
+        search: Search,
+        offset: int = 0,
+        checkpointer: _Checkpointer | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> Generator[Result, None, None]:
+        if self.stream:
+            yield from self._stream_results(search, offset, checkpointer, fields)
+            return
+        pages = self._pages(search, offset, fields)
+        if self.prefetch > 0:
+            pages = self._prefetch(pages)
+        for feed in pages:
+            yield from feed.results
+            offset += len(feed.results)
+            if checkpointer is not None:
+                checkpointer.page_done(
+                    offset, feed.header.total_results, [r.entry_id for r in feed.results]
+                )
+
+    def _pages(
+        self,
+        search: Search,
+        offset: int = 0,
+        fields: frozenset[str] | None = None,
+        columnar: bool = False,
+    ) -> Generator[ParsedFeed, None, None]:
+        """
+        Fetches successive non-empty pages of `search` results, starting at
+        index `offset`, until the result set or `search.max_results` is
+        exhausted. If `fields` is given, results are parsed with only those
+        fields; if `columnar`, pages are parsed into `ParsedFeed.batch`.
+        """
+        feed = self._fetch_page(search, offset, first_page=True, fields=fields, columnar=columnar)
+        if not feed.count:
             logger.info("Got empty first page; stopping generation")
             return
         total_results = feed.header.total_results
         logger.info(
             "Got first page: %d of %d total results",
-            len(feed.results),
+            feed.count,
             total_results,
         )
 
-        while feed.results:
-            yield from feed.results
-            offset += len(feed.results)
+        while feed.count:
+            yield feed
+            offset += feed.count
             if offset >= total_results:
                 break
-            page_url = self._format_url(search, offset, self.page_size)
-            feed = self._parse_feed(page_url, first_page=False)
+            if search.max_results and offset >= search.max_results:
+                break
+            feed = self._fetch_page(
+                search, offset, first_page=False, fields=fields, columnar=columnar
+            )
+
+    def _prefetch(
+        self, pages: Generator[ParsedFeed, None, None]
+    ) -> Generator[ParsedFeed, None, None]:
+        """
+        Runs `pages` on a background thread, staying up to `self.prefetch`
+        pages ahead of the consumer. Exceptions raised while fetching are
+        re-raised to the consumer in order.
+        """
+        # Each fetched-but-unconsumed page holds a credit, bounding memory.
+        credits = threading.Semaphore(self.prefetch)
+        buffer: queue.SimpleQueue[tuple[ParsedFeed | None, BaseException | None]] = (
+            queue.SimpleQueue()
+        )
+        stopped = threading.Event()
+
+        def produce() -> None:
+            error: BaseException | None = None
+            try:
+                while True:
+                    while not credits.acquire(timeout=0.1):
+                        if stopped.is_set():
+                            return
+                    if stopped.is_set():
+                        return
+                    feed = next(pages, None)
+                    if feed is None:
+                        return
+                    buffer.put((feed, None))
+            except BaseException as err:
+                error = err
+            finally:
+                try:
+                    pages.close()
+                except BaseException as err:
+                    error = error or err
+                # Always end the buffer, so the consumer can't wait forever
+                # on a producer that died (even of e.g. `KeyboardInterrupt`).
+                buffer.put((None, error))
+
+        producer = threading.Thread(target=produce, name="arxiv-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                feed, err = buffer.get()
+                if err is not None:
+                    raise err
+                if feed is None:
+                    return
+                credits.release()
+                yield feed
+        finally:
+            stopped.set()
+
+    def _stream_results(
+        self,
+        search: Search,
+        offset: int = 0,
+        checkpointer: _Checkpointer | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> Generator[Result, None, None]:
+        """
+        Streaming counterpart to `_pages`: yields results as their entries
+        arrive, page after page.
+        """
+        first_page = True
+        while True:
+            url = self._format_url(search, offset, self.page_size)
+            stream, ids = yield from self._stream_page(url, first_page, fields)
+            if stream.count == 0:
+                logger.info("Got empty first page; stopping generation")
+                return
+            if first_page:
+                logger.info(
+                    "Got first page: %d of %d total results",
+                    stream.count,
+                    stream.header.total_results,
+                )
+            first_page = False
+            offset += stream.count
+            if checkpointer is not None:
+                checkpointer.page_done(offset, stream.header.total_results, ids)
+            if offset >= stream.header.total_results:
+                return
+            if search.max_results and offset >= search.max_results:
+                return
+
+    def _stream_page(
+        self, url: str, first_page: bool, fields: frozenset[str] | None = None
+    ) -> Generator[Result, None, tuple[_feed.FeedStream, list[str]]]:
+        """
+        Streams one page of results, retrying like `_parse_feed`. If a retry
+        follows a partial download, results yielded by earlier tries are
+        skipped. Returns the final try's `FeedStream` and the entry IDs of the
+        yielded results.
+        """
+        ids: list[str] = []
+        try_index = 0
+        started = time.monotonic()
+        while True:
+            try:
+                resp = self.__try_open_stream(url, first_page=first_page, try_index=try_index)
+                with resp:
+                    stream = _feed.FeedStream(
+                        resp.iter_content(chunk_size=64 * 1024),
+                        lazy=self.lazy,
+                        fields=fields,
+                        pool=self._pool,
+                    )
+                    try:
+                        for i, result in enumerate(stream):
+                            if i >= len(ids):
+                                ids.append(result.entry_id)
+                                yield result
+                    except GeneratorExit:
+                        # The consumer stopped partway through the page (e.g.
+                        # at `max_results`): report what was parsed so far.
+                        self._notify("on_parsed", url, stream.feed(), stream.count)
+                        raise
+                self._notify("on_parsed", url, stream.feed(), stream.count)
+                if stream.count == 0 and not first_page:
+                    raise UnexpectedEmptyPageError(url, try_index, stream.feed())
+                if stream.malformed:
+                    logger.warning("Malformed feed; consider handling: %s", stream.error)
+                return stream, ids
+            except (
+                HTTPError,
+                UnexpectedEmptyPageError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as err:
+                if not self._before_retry(err, try_index, started, url):
+                    raise
+                try_index += 1
+
+    def __try_open_stream(self, url: str, first_page: bool, try_index: int) -> requests.Response:
+        """
+        Streaming counterpart to `__try_parse_feed`: waits for a request slot,
+        then requests `url` without reading the response body.
+        """
+        self._wait_for_slot()
+        logger.info("Streaming page (first: %r, try: %d): %s", first_page, try_index, url)
+
+        self._notify("on_request_start", url, try_index)
+        started = time.perf_counter()
+        resp = self._session.get(url, headers={"user-agent": _USER_AGENT}, stream=True)
+        self._notify("on_response", url, resp.status_code, time.perf_counter() - started)
+        if resp.status_code != requests.codes.OK:
+            resp.close()
+            raise HTTPError(
+                url,
+                try_index,
+                resp.status_code,
+                retry_after=_parse_retry_after(resp.headers.get("retry-after")),
+            )
+        return resp
+
+    def _fetch_page(
+        self,
+        search: Search,
+        start: int,
+        first_page: bool,
+        fields: frozenset[str] | None = None,
+        columnar: bool = False,
+    ) -> ParsedFeed:
+        """
+        Returns the page of `search` results starting at index `start`, from
+        `self.page_cache` if possible.
+        """
+        page_url = self._format_url(search, start, self.page_size)
+        # The URL covers the endpoint, so clients sharing a cache but querying
+        # different APIs (e.g. a `StandInServer`) don't get each other's pages;
+        # the parsing options keep lazy and eager clients' results apart.
+        key = (
+            page_url,
+            tuple(sorted(fields)) if fields is not None else None,
+            columnar,
+            self.lazy,
+        )
+        if self.page_cache is not None:
+            feed = self.page_cache.get(key)
+            if feed is not None:
+                logger.info("Using cached parsed page (start: %d)", start)
+                return feed
+        feed = self._parse_feed(page_url, first_page=first_page, fields=fields, columnar=columnar)
+        if self.page_cache is not None:
+            self.page_cache.put(key, feed)
+        return feed
 
     def _format_url(self, search: Search, start: int, page_size: int) -> str:
         """
         Construct a request API for search that returns up to `page_size`
         results starting with the result at index `start`.
         """
-        url_args = search._url_args()
-        url_args.update(
-            {
-                "start": str(start),
-                "max_results": str(page_size),
-            }
-        )
-        return self.query_url_format.format(urlencode(url_args))
+        return _format_query_url(self.query_url_format, search, start, page_size)
 
-    def _parse_feed(self, url: str, first_page: bool = True, _try_index: int = 0) -> ParsedFeed:
+    def _parse_feed(
+        self,
+        url: str,
+        first_page: bool = True,
+        fields: frozenset[str] | None = None,
+        columnar: bool = False,
+    ) -> ParsedFeed:
         """
-        Fetches the specified URL and parses it as an Atom feed.
+        Fetches the specified URL and parses it as an Atom feed, with only
+        `fields` if given, or into columns if `columnar`.
 
         If a request fails or is unexpectedly empty, retries the request up to
-        `self.num_retries` times.
+        `self.num_retries` times, as `self.retry_policy` allows.
         """
-        try:
-            return self.__try_parse_feed(url, first_page=first_page, try_index=_try_index)
-        except (
-            HTTPError,
-            UnexpectedEmptyPageError,
-            requests.exceptions.ConnectionError,
-        ) as err:
-            if _try_index < self.num_retries:
-                logger.debug("Got error (try %d): %s", _try_index, err)
-                return self._parse_feed(url, first_page=first_page, _try_index=_try_index + 1)
-            logger.debug("Giving up (try %d): %s", _try_index, err)
-            raise err
+        if self.cache is not None:
+            body = self.cache.get(url)
+            if body is not None:
+                logger.info("Using cached page: %s", url)
+                feed = _feed.parse(
+                    body, lazy=self.lazy, fields=fields, columnar=columnar, pool=self._pool
+                )
+                self._notify("on_parsed", url, feed, feed.count)
+                return feed
+        try_index = 0
+        started = time.monotonic()
+        while True:
+            try:
+                return self.__try_parse_feed(
+                    url,
+                    first_page=first_page,
+                    try_index=try_index,
+                    fields=fields,
+                    columnar=columnar,
+                )
+            except (
+                HTTPError,
+                UnexpectedEmptyPageError,
+                requests.exceptions.ConnectionError,
+            ) as err:
+                if not self._before_retry(err, try_index, started, url):
+                    raise
+                try_index += 1
+
+    def _before_retry(self, err: Exception, try_index: int, started: float, url: str) -> bool:
+        """
+        Decides whether to retry after try `try_index` failed with `err`, and if
+        so, sleeps for any backoff `self.retry_policy` requires. `started` is
+        the monotonic time at which the initial try started.
+        """
+        wait = None
+        if try_index < self.num_retries:
+            wait = self.retry_policy.wait_before_retry(err, try_index, time.monotonic() - started)
+        if wait is None:
+            logger.debug("Giving up (try %d): %s", try_index, err)
+            return False
+        logger.debug("Got error (try %d): %s", try_index, err)
+        self._notify("on_retry", url, err, try_index, wait)
+        if wait > 0:
+            logger.info("Backing off: %f seconds", wait)
+            time.sleep(wait)
+            self._notify("on_sleep", wait, "backoff")
+        return True
 
     def __try_parse_feed(
         self,
         url: str,
         first_page: bool,
         try_index: int,
+        fields: frozenset[str] | None = None,
+        columnar: bool = False,
     ) -> ParsedFeed:
         """
-        Recursive helper for _parse_feed. Enforces `self.delay_seconds`: if that
-        number of seconds has not passed since `_parse_feed` was last called,
-        sleeps until delay_seconds seconds have passed.
+        Helper for _parse_feed. Enforces `self.delay_seconds`: waits for this
+        client's next request slot before fetching `url`.
         """
-        # If this call would violate the rate limit, sleep until it doesn't.
-        if self._last_request_dt is not None:
-            required = timedelta(seconds=self.delay_seconds)
-            since_last_request = datetime.now() - self._last_request_dt
-            if since_last_request < required:
-                to_sleep = (required - since_last_request).total_seconds()
-                logger.info("Sleeping: %f seconds", to_sleep)
-                time.sleep(to_sleep)
-
+        self._wait_for_slot()
         logger.info("Requesting page (first: %r, try: %d): %s", first_page, try_index, url)
 
+        self._notify("on_request_start", url, try_index)
+        started = time.perf_counter()
         resp = self._session.get(url, headers={"user-agent": _USER_AGENT})
-        self._last_request_dt = datetime.now()
+        self._notify("on_response", url, resp.status_code, time.perf_counter() - started)
         if resp.status_code != requests.codes.OK:
-            raise HTTPError(url, try_index, resp.status_code)
+            raise HTTPError(
+                url,
+                try_index,
+                resp.status_code,
+                retry_after=_parse_retry_after(resp.headers.get("retry-after")),
+            )
+
+        feed = _feed.parse(
+            resp.content, lazy=self.lazy, fields=fields, columnar=columnar, pool=self._pool
+        )
+        self._notify("on_parsed", url, feed, feed.count)
+        if feed.count == 0 and not first_page:
+            raise UnexpectedEmptyPageError(url, try_index, feed)
+
+        if feed.malformed:
+            logger.warning("Malformed feed; consider handling: %s", feed.error)
+
+        if self.cache is not None:
+            self.cache.put(url, resp.content, feed)
+
+        return feed
+
+    def _wait_for_slot(self) -> None:
+        """
+        Reserves this client's next request slot from `self.rate_limiter` and
+        sleeps until it arrives.
+        """
+        to_sleep = self.rate_limiter.reserve(self.delay_seconds)
+        if to_sleep > 0:
+            logger.info("Sleeping: %f seconds", to_sleep)
+            time.sleep(to_sleep)
+            self._notify("on_sleep", to_sleep, "rate_limit")
+
+    def _notify(self, event: str, *args: Any) -> None:
+        """Calls the `event` method of `self.stats` and each of `self.hooks`."""
+        getattr(self.stats, event)(*args)
+        for hook in self.hooks:
+            getattr(hook, event)(*args)
+
+
+class AsyncClient:
+    """
+    An `asyncio` counterpart to `Client`.
+
+    `AsyncClient` accepts the same options as `Client` and exposes
+    `AsyncClient.results` as an asynchronous generator. Requests are made with
+    [httpx](https://www.python-httpx.org/), which must be installed separately
+    (`pip install arxiv[async]`).
+
+    Every coroutine using an `AsyncClient` shares its `delay_seconds` budget:
+    concurrent requests are scheduled into successive slots `delay_seconds`
+    apart, and waiting coroutines sleep without blocking the event loop.
+    """
+
+    query_url_format = Client.query_url_format
+    """
+    The arXiv query API endpoint format.
+    """
+    page_size: int
+    """
+    Maximum number of results fetched in a single API request. See
+    `Client.page_size`.
+    """
+    delay_seconds: float
+    """
+    Number of seconds to wait between API requests. See
+    `Client.delay_seconds`.
+    """
+    num_retries: int
+    """
+    Number of times to retry a failing API request before raising an Exception.
+    """
+    retry_policy: RetryPolicy
+    """
+    Decides which failures to retry and how long to back off before each
+    retry, within `num_retries`.
+    """
+    lazy: bool
+    """
+    Whether results decode their costlier fields only when first accessed. See
+    `Client.lazy`.
+    """
+
+    _last_request_at: float | None
+    _session: httpx.AsyncClient
+    _pool: _feed._ValuePool
+    """Canonical instances of values repeated across this client's results."""
+    _retryable_errors: tuple[type[Exception], ...]
+
+    def __init__(
+        self,
+        page_size: int = 100,
+        delay_seconds: float = 3.0,
+        num_retries: int = 3,
+        retry_policy: RetryPolicy | None = None,
+        lazy: bool = False,
+    ):
+        """
+        Constructs an asynchronous arXiv API client with the specified options.
+
+        Raises `ImportError` if httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as err:
+            raise ImportError(
+                "AsyncClient requires httpx; install it with `pip install arxiv[async]`"
+            ) from err
+        self.page_size = page_size
+        self.delay_seconds = delay_seconds
+        self.num_retries = num_retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.lazy = lazy
+        self._last_request_at = None
+        self._session = httpx.AsyncClient(headers={"user-agent": _USER_AGENT}, timeout=None)
+        self._pool = _feed._ValuePool()
+        self._retryable_errors = (HTTPError, UnexpectedEmptyPageError, httpx.TransportError)
+
+    def __str__(self) -> str:
+        return f"AsyncClient(page_size={self.page_size}, delay={self.delay_seconds}s, retries={self.num_retries})"
+
+    def __repr__(self) -> str:
+        return "{}(page_size={}, delay_seconds={}, num_retries={})".format(
+            _classname(self),
+            repr(self.page_size),
+            repr(self.delay_seconds),
+            repr(self.num_retries),
+        )
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
 
-        feed = _feed.parse(resp.content)
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP connection pool.
+        """
+        await self._session.aclose()
+
+    async def results(self, search: Search, offset: int = 0) -> AsyncIterator[Result]:
+        """
+        Uses this client configuration to fetch one page of the search results
+        at a time, yielding the parsed `Result`s, until `max_results` results
+        have been yielded or there are no more search results.
+
+        Use it with `async for`:
+
+        ```python
+        async with arxiv.AsyncClient() as client:
+            async for r in client.results(search):
+                print(r.title)
+        ```
+
+        Error handling and `offset` semantics match `Client.results`.
+        """
+        limit = search.max_results - offset if search.max_results else None
+        if limit is not None and limit <= 0:
+            return
+        count = 0
+        async with aclosing(self._results(search, offset)) as results:
+            async for result in results:
+                yield result
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    async def _results(self, search: Search, offset: int = 0) -> AsyncGenerator[Result, None]:
+        page_url = self._format_url(search, offset, self.page_size)
+        feed = await self._parse_feed(page_url, first_page=True)
+        if not feed.results:
+            logger.info("Got empty first page; stopping generation")
+            return
+        total_results = feed.header.total_results
+        logger.info(
+            "Got first page: %d of %d total results",
+            len(feed.results),
+            total_results,
+        )
+
+        while feed.results:
+            for result in feed.results:
+                yield result
+            offset += len(feed.results)
+            if offset >= total_results:
+                break
+            page_url = self._format_url(search, offset, self.page_size)
+            feed = await self._parse_feed(page_url, first_page=False)
+
+    def _format_url(self, search: Search, start: int, page_size: int) -> str:
+        """
+        Construct a request API for search that returns up to `page_size`
+        results starting with the result at index `start`.
+        """
+        return _format_query_url(self.query_url_format, search, start, page_size)
+
+    async def _parse_feed(self, url: str, first_page: bool = True) -> ParsedFeed:
+        """
+        Fetches the specified URL and parses it as an Atom feed.
+
+        If a request fails or is unexpectedly empty, retries the request up to
+        `self.num_retries` times, as `self.retry_policy` allows.
+        """
+        import asyncio
+
+        try_index = 0
+        started = time.monotonic()
+        while True:
+            try:
+                return await self._try_parse_feed(url, first_page=first_page, try_index=try_index)
+            except self._retryable_errors as err:
+                wait = None
+                if try_index < self.num_retries:
+                    wait = self.retry_policy.wait_before_retry(
+                        err, try_index, time.monotonic() - started
+                    )
+                if wait is None:
+                    logger.debug("Giving up (try %d): %s", try_index, err)
+                    raise
+                logger.debug("Got error (try %d): %s", try_index, err)
+                if wait > 0:
+                    logger.info("Backing off: %f seconds", wait)
+                    await asyncio.sleep(wait)
+                try_index += 1
+
+    async def _try_parse_feed(self, url: str, first_page: bool, try_index: int) -> ParsedFeed:
+        """
+        Waits for this client's next request slot, then fetches and parses one
+        page.
+        """
+        await self._wait_for_slot()
+        logger.info("Requesting page (first: %r, try: %d): %s", first_page, try_index, url)
+
+        resp = await self._session.get(url)
+        if resp.status_code != requests.codes.OK:
+            raise HTTPError(
+                url,
+                try_index,
+                resp.status_code,
+                retry_after=_parse_retry_after(resp.headers.get("retry-after")),
+            )
+
+        feed = _feed.parse(resp.content, lazy=self.lazy, pool=self._pool)
         if len(feed.results) == 0 and not first_page:
             raise UnexpectedEmptyPageError(url, try_index, feed)
 
@@ -578,6 +1594,26 @@ class Client:
 
         return feed
 
+    async def _wait_for_slot(self) -> None:
+        """
+        Reserves the next request slot and sleeps until it arrives.
+
+        Slots are reserved synchronously (there is no `await` between reading
+        and advancing `_last_request_at`), so concurrent coroutines each get a
+        distinct slot `delay_seconds` after the previous one.
+        """
+        import asyncio
+
+        now = time.monotonic()
+        slot = now
+        if self._last_request_at is not None:
+            slot = max(now, self._last_request_at + self.delay_seconds)
+        self._last_request_at = slot
+        to_sleep = slot - now
+        if to_sleep > 0:
+            logger.info("Sleeping: %f seconds", to_sleep)
+            await asyncio.sleep(to_sleep)
+
 
 class ArxivError(Exception):
     """This package's base Exception class."""
@@ -651,14 +1687,20 @@ class HTTPError(ArxivError):
 
     status: int
     """The HTTP status reported by the underlying request."""
+    retry_after: float | None
+    """
+    The number of seconds the response's `Retry-After` header asked clients to
+    wait before retrying, if present.
+    """
 
-    def __init__(self, url: str, retry: int, status: int):
+    def __init__(self, url: str, retry: int, status: int, retry_after: float | None = None):
         """
         Constructs an `HTTPError` for the specified status code, encountered for
         the specified API URL after `retry` tries.
         """
         self.url = url
         self.status = status
+        self.retry_after = retry_after
         super().__init__(
             url,
             retry,
@@ -666,7 +1708,7 @@ class HTTPError(ArxivError):
         )
 
     def __reduce__(self) -> tuple:
-        return (self.__class__, (self.url, self.retry, self.status))
+        return (self.__class__, (self.url, self.retry, self.status, self.retry_after))
 
     def __repr__(self) -> str:
         return "{}({}, {}, {})".format(
@@ -674,6 +1716,46 @@ class HTTPError(ArxivError):
         )
 
 
+def _format_query_url(url_format: str, search: Search, start: int, page_size: int) -> str:
+    """
+    Formats an API query URL for `search` returning up to `page_size` results
+    starting with the result at index `start`.
+    """
+    url_args = search._url_args()
+    url_args.update(
+        {
+            "start": str(start),
+            "max_results": str(page_size),
+        }
+    )
+    return url_format.format(urlencode(url_args))
+
+
 def _classname(o: object) -> str:
     """A helper function for use in __repr__ methods: arxiv.Result.Link."""
     return "arxiv.{}".format(o.__class__.__qualname__)
+
+
+def _set_slots(o: object, state: Any) -> None:
+    """
+    A helper function for use in __setstate__ methods of slotted classes.
+    Restores pickled `state`: a `(None, slots)` pair, or the `__dict__` of an
+    instance pickled before its class had slots.
+    """
+    if isinstance(state, tuple):
+        state = {**(state[0] or {}), **state[1]}
+    for name, value in state.items():
+        setattr(o, name, value)
+
+
+def _restore_result(
+    cls: type[Result], values: tuple[Any, ...], fields: frozenset[str] | None = None
+) -> Result:
+    """Unpickles a result pickled by `Result.__reduce__`."""
+    result = cls.__new__(cls)
+    names = _feed._FIELD_TAGS if fields is None else [n for n in _feed._FIELD_TAGS if n in fields]
+    for name, value in zip(names, values):
+        setattr(result, name, value)
+    if fields is not None:
+        result._fields = fields
+    return result
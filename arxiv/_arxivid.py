@@ -0,0 +1,202 @@
+"""Parsed arXiv identifiers.
+
+`ArxivId` splits an arXiv ID into its parts once, so code joining or sorting
+results by ID doesn't re-parse strings in its inner loops. It understands both
+identifier schemes (see [Understanding the arXiv
+identifier](https://arxiv.org/help/arxiv_identifier)):
+
++ new-style IDs (since April 2007), `YYMM.NNNN` until December 2014 and
+  `YYMM.NNNNN` from January 2015, e.g. `2107.05580v1`;
++ legacy IDs, `archive/YYMMNNN` with an optional subject class, e.g.
+  `quant-ph/0201082v1` or `math.GT/0309136`.
+
+`ArxivId.parse_all` normalizes a whole list of raw IDs at once, parsing each
+distinct ID only once.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Iterable
+from typing import Any, Literal, overload
+
+_ID_PREFIX = re.compile(r"^(?:https?://(?:export\.)?arxiv\.org/(?:abs|pdf)/|arxiv:)", re.IGNORECASE)
+
+_ID = re.compile(
+    r"(?:(\d\d)(\d\d)\.(\d{4,5})"
+    r"|([a-z]+(?:-[a-z]+)?)(?:\.[A-Za-z-]+)?/(\d\d)(\d\d)(\d{3}))"
+    r"(?:v([1-9]\d*))?"
+)
+"""
+Matches a normalized ID. Groups 1-3 are a new-style ID's year, month and
+number; groups 4-7 a legacy ID's archive, year, month and number; group 8 the
+version.
+"""
+
+
+def _normalize_id(raw: str) -> str:
+    """
+    Normalizes an arXiv ID as users commonly write it: strips whitespace, an
+    `arXiv:` prefix or abstract/PDF URL, and a trailing `.pdf`.
+    """
+    id = _ID_PREFIX.sub("", raw.strip())
+    if id.endswith(".pdf"):
+        id = id[: -len(".pdf")]
+    return id
+
+
+class ArxivId:
+    """
+    A parsed arXiv identifier. IDs compare equal if their base IDs and
+    versions are equal, and sort by submission month, then archive (for
+    legacy IDs), number and version; an unversioned ID sorts before its
+    versions.
+
+    ```python
+    id = arxiv.ArxivId("arXiv:2107.05580v1")
+    id.base_id, id.version, id.scheme, id.year, id.month
+    # ('2107.05580', 1, 'new', 2021, 7)
+    ```
+
+    `ArxivId`s are values: don't modify them. `ArxivId.parse` and
+    `ArxivId.parse_all` may return the same instance for equal IDs.
+    """
+
+    __slots__ = ("base_id", "version", "scheme", "archive", "year", "month", "number", "_key")
+
+    base_id: str
+    """
+    The ID without its version, e.g. `2107.05580` or `quant-ph/0201082`. A
+    legacy ID's subject class is dropped: `math.GT/0309136` becomes
+    `math/0309136`, as arXiv's own feeds write it.
+    """
+    version: int | None
+    """The version, or `None` for an unversioned ID."""
+    scheme: str
+    """`"new"` for `YYMM.NNNNN` IDs; `"legacy"` for `archive/YYMMNNN` IDs."""
+    archive: str | None
+    """A legacy ID's archive, e.g. `quant-ph`; `None` for new-style IDs."""
+    year: int
+    """The four-digit year of the month the paper was submitted."""
+    month: int
+    """The month (1-12) the paper was submitted."""
+    number: int
+    """The paper's sequence number within its submission month (and archive)."""
+
+    def __init__(self, id: str):
+        """
+        Constructs an ID by parsing `id`, which may be written as users
+        commonly do: with surrounding whitespace, an `arXiv:` prefix, or as an
+        abstract or PDF URL. Raises `ValueError` if `id` isn't an arXiv ID.
+        """
+        match = _ID.fullmatch(id) or _ID.fullmatch(_normalize_id(id))
+        if match is None:
+            raise ValueError("Invalid arXiv ID: {!r}".format(id))
+        new_yy, new_mm, new_number, archive, old_yy, old_mm, old_number, version = match.groups()
+        if archive is None:
+            # Numbers have 4 digits before 1501 and 5 from then on, so each ID
+            # has one spelling: `0704.00001` and `2107.5580` aren't IDs.
+            if len(new_number) != (5 if new_yy + new_mm >= "1501" else 4):
+                raise ValueError("Invalid arXiv ID: {!r}".format(id))
+            self.base_id = "{}{}.{}".format(new_yy, new_mm, new_number)
+            self.scheme = "new"
+            self.year = 2000 + int(new_yy)
+            self.month = int(new_mm)
+            self.number = int(new_number)
+        else:
+            self.base_id = "{}/{}{}{}".format(archive, old_yy, old_mm, old_number)
+            self.scheme = "legacy"
+            # Legacy IDs ran from August 1991 to March 2007.
+            self.year = (1900 if int(old_yy) >= 91 else 2000) + int(old_yy)
+            self.month = int(old_mm)
+            self.number = int(old_number)
+        if not 1 <= self.month <= 12:
+            raise ValueError("Invalid arXiv ID: {!r}".format(id))
+        self.archive = archive
+        self.version = None if version is None else int(version)
+        self._key = (self.year, self.month, archive or "", self.number, self.version or 0)
+
+    @classmethod
+    def parse(cls, id: str) -> ArxivId:
+        """
+        Like the constructor, but caches recently parsed IDs: parsing the same
+        string again returns the same instance.
+        """
+        return _parse(id)
+
+    @overload
+    @classmethod
+    def parse_all(cls, ids: Iterable[str], strict: Literal[True] = ...) -> list[ArxivId]: ...
+    @overload
+    @classmethod
+    def parse_all(cls, ids: Iterable[str], strict: bool) -> list[ArxivId | None]: ...
+    @classmethod
+    def parse_all(cls, ids: Iterable[str], strict: bool = True) -> list[ArxivId] | list[Any]:
+        """
+        Parses every ID in `ids`, returning a list in the same order. Each
+        distinct string is parsed only once, and repeats share an instance,
+        so normalizing millions of IDs with many repeats (e.g. the join
+        column of a large table) costs little more than a dict lookup per ID.
+
+        If `strict`, raises `ValueError` for the first invalid ID; otherwise,
+        invalid IDs map to `None`.
+        """
+        ids = ids if isinstance(ids, list) else list(ids)
+        parsed: dict[str, ArxivId | None] = dict.fromkeys(ids)
+        for id in parsed:
+            try:
+                parsed[id] = cls(id)
+            except ValueError:
+                if strict:
+                    raise
+        return list(map(parsed.__getitem__, ids))
+
+    @property
+    def short_id(self) -> str:
+        """The ID with its version, if any, e.g. `2107.05580v1`."""
+        if self.version is None:
+            return self.base_id
+        return "{}v{}".format(self.base_id, self.version)
+
+    def __str__(self) -> str:
+        return self.short_id
+
+    def __repr__(self) -> str:
+        return "arxiv.ArxivId({})".format(repr(self.short_id))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self.short_id,))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArxivId):
+            return self._key == other._key
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __lt__(self, other: ArxivId) -> bool:
+        if isinstance(other, ArxivId):
+            return self._key < other._key
+        return NotImplemented
+
+    def __le__(self, other: ArxivId) -> bool:
+        if isinstance(other, ArxivId):
+            return self._key <= other._key
+        return NotImplemented
+
+    def __gt__(self, other: ArxivId) -> bool:
+        if isinstance(other, ArxivId):
+            return self._key > other._key
+        return NotImplemented
+
+    def __ge__(self, other: ArxivId) -> bool:
+        if isinstance(other, ArxivId):
+            return self._key >= other._key
+        return NotImplemented
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse(id: str) -> ArxivId:
+    return ArxivId(id)
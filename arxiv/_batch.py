@@ -0,0 +1,293 @@
+"""Columnar batches of results, for analytics and bulk export.
+
+`Client.batches` yields one `ResultBatch` per page. A batch holds each
+`Result` field as a column, built straight from the parsed entries without
+constructing per-result objects. Timestamps are stored as integer epoch
+seconds. List fields (categories, authors, and authors' affiliations) are
+stored Arrow-style, as a flat list of values plus an offsets array: row `i`'s
+values are `values[offsets[i]:offsets[i + 1]]`.
+
+`ResultBatch.to_numpy` and `ResultBatch.to_arrow` convert a batch to NumPy
+arrays or a `pyarrow.RecordBatch`. `ParquetWriter` streams batches to a
+Parquet file. Each needs the optional `numpy` or `pyarrow` dependency
+(`pip install arxiv[columnar]`).
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._feed import _WHITESPACE, _Entry, _parse_datetime
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+def _import(module: str, feature: str) -> Any:
+    """Imports an optional dependency, explaining how to install it if missing."""
+    try:
+        return __import__(module)
+    except ImportError as err:
+        raise ImportError(
+            "{} requires {}; install it with `pip install arxiv[columnar]`".format(feature, module)
+        ) from err
+
+
+class ResultBatch:
+    """
+    The results of one page, as columns. Every column has one value per
+    result, except the flat value lists indexed by an offsets array.
+    """
+
+    entry_id: list[str]
+    """Each result's `Result.entry_id`."""
+    updated: array[int]
+    """Each result's `Result.updated`, as integer seconds since the Unix epoch."""
+    published: array[int]
+    """Each result's `Result.published`, as integer seconds since the Unix epoch."""
+    title: list[str]
+    summary: list[str]
+    comment: list[str | None]
+    journal_ref: list[str | None]
+    doi: list[str | None]
+    primary_category: list[str]
+    pdf_url: list[str | None]
+    category_offsets: array[int]
+    """Row `i`'s categories are `categories[category_offsets[i]:category_offsets[i + 1]]`."""
+    categories: list[str]
+    author_offsets: array[int]
+    """Row `i`'s authors are `author_names[author_offsets[i]:author_offsets[i + 1]]`."""
+    author_names: list[str]
+    affiliation_offsets: array[int]
+    """
+    Author `j`'s affiliations are
+    `affiliations[affiliation_offsets[j]:affiliation_offsets[j + 1]]`.
+    """
+    affiliations: list[str]
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty batch; batches are produced by `Client.batches`.
+        """
+        self.entry_id = []
+        self.updated = array("q")
+        self.published = array("q")
+        self.title = []
+        self.summary = []
+        self.comment = []
+        self.journal_ref = []
+        self.doi = []
+        self.primary_category = []
+        self.pdf_url = []
+        self.category_offsets = array("q", [0])
+        self.categories = []
+        self.author_offsets = array("q", [0])
+        self.author_names = []
+        self.affiliation_offsets = array("q", [0])
+        self.affiliations = []
+
+    def __len__(self) -> int:
+        return len(self.entry_id)
+
+    def __repr__(self) -> str:
+        return "arxiv.ResultBatch(<{} results>)".format(len(self))
+
+    def _append(self, entry: _Entry) -> None:
+        """Appends a row for a parsed entry."""
+        self.entry_id.append(entry.entry_id)
+        self.updated.append(int(_parse_datetime(entry.updated).timestamp()))
+        self.published.append(int(_parse_datetime(entry.published).timestamp()))
+        self.title.append(_WHITESPACE.sub(" ", entry.title) if entry.title else "")
+        self.summary.append(entry.summary or "")
+        self.comment.append(entry.comment)
+        self.journal_ref.append(entry.journal_ref)
+        self.doi.append(entry.doi)
+        self.primary_category.append(entry.primary_category)
+        self.pdf_url.append(
+            next((href for href, title, _, _ in entry.links if title == "pdf"), None)
+        )
+        self.categories.extend(entry.categories)
+        self.category_offsets.append(len(self.categories))
+        for name, affiliations in entry.authors:
+            self.author_names.append(name)
+            self.affiliations.extend(affiliations)
+            self.affiliation_offsets.append(len(self.affiliations))
+        self.author_offsets.append(len(self.author_names))
+
+    def _head(self, n: int) -> ResultBatch:
+        """Returns a batch of this batch's first `n` rows."""
+        head = ResultBatch()
+        for name in (
+            "entry_id",
+            "updated",
+            "published",
+            "title",
+            "summary",
+            "comment",
+            "journal_ref",
+            "doi",
+            "primary_category",
+            "pdf_url",
+        ):
+            setattr(head, name, getattr(self, name)[:n])
+        head.category_offsets = self.category_offsets[: n + 1]
+        head.categories = self.categories[: head.category_offsets[-1]]
+        head.author_offsets = self.author_offsets[: n + 1]
+        head.author_names = self.author_names[: head.author_offsets[-1]]
+        head.affiliation_offsets = self.affiliation_offsets[: len(head.author_names) + 1]
+        head.affiliations = self.affiliations[: head.affiliation_offsets[-1]]
+        return head
+
+    def to_numpy(self) -> dict[str, numpy.ndarray]:
+        """
+        Returns the batch's columns as NumPy arrays, by name. Timestamps are
+        `datetime64[s]` (UTC), offsets are `int64`, and strings are `object`
+        arrays. Requires `numpy`.
+        """
+        np = _import("numpy", "ResultBatch.to_numpy")
+        columns = {
+            "updated": np.frombuffer(self.updated, dtype=np.int64).astype("datetime64[s]"),
+            "published": np.frombuffer(self.published, dtype=np.int64).astype("datetime64[s]"),
+        }
+        for name in ("category_offsets", "author_offsets", "affiliation_offsets"):
+            columns[name] = np.frombuffer(getattr(self, name), dtype=np.int64).copy()
+        for name in (
+            "entry_id",
+            "title",
+            "summary",
+            "comment",
+            "journal_ref",
+            "doi",
+            "primary_category",
+            "pdf_url",
+            "categories",
+            "author_names",
+            "affiliations",
+        ):
+            column = np.empty(len(getattr(self, name)), dtype=object)
+            column[:] = getattr(self, name)
+            columns[name] = column
+        return columns
+
+    def to_arrow(self) -> pyarrow.RecordBatch:
+        """
+        Returns the batch as a `pyarrow.RecordBatch` with `_arrow_schema()`:
+        one row per result, with list columns for `categories` and `authors`
+        (each a struct of `name` and `affiliations`). Requires `pyarrow`.
+        """
+        pa = _import("pyarrow", "ResultBatch.to_arrow")
+        timestamp = pa.timestamp("s", tz="UTC")
+        affiliations = pa.ListArray.from_arrays(
+            pa.array(self.affiliation_offsets, pa.int32()), pa.array(self.affiliations, pa.string())
+        )
+        authors = pa.StructArray.from_arrays(
+            [pa.array(self.author_names, pa.string()), affiliations],
+            names=["name", "affiliations"],
+        )
+        columns = [
+            pa.array(self.entry_id, pa.string()),
+            pa.array(self.updated, pa.int64()).cast(timestamp),
+            pa.array(self.published, pa.int64()).cast(timestamp),
+            pa.array(self.title, pa.string()),
+            pa.ListArray.from_arrays(pa.array(self.author_offsets, pa.int32()), authors),
+            pa.array(self.summary, pa.string()),
+            pa.array(self.comment, pa.string()),
+            pa.array(self.journal_ref, pa.string()),
+            pa.array(self.doi, pa.string()),
+            pa.array(self.primary_category, pa.string()),
+            pa.ListArray.from_arrays(
+                pa.array(self.category_offsets, pa.int32()), pa.array(self.categories, pa.string())
+            ),
+            pa.array(self.pdf_url, pa.string()),
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=_arrow_schema())
+
+
+def _arrow_schema() -> pyarrow.Schema:
+    """The schema of `ResultBatch.to_arrow`'s record batches."""
+    pa = _import("pyarrow", "ResultBatch.to_arrow")
+    timestamp = pa.timestamp("s", tz="UTC")
+    author = pa.struct([("name", pa.string()), ("affiliations", pa.list_(pa.string()))])
+    return pa.schema(
+        [
+            ("entry_id", pa.string()),
+            ("updated", timestamp),
+            ("published", timestamp),
+            ("title", pa.string()),
+            ("authors", pa.list_(author)),
+            ("summary", pa.string()),
+            ("comment", pa.string()),
+            ("journal_ref", pa.string()),
+            ("doi", pa.string()),
+            ("primary_category", pa.string()),
+            ("categories", pa.list_(pa.string())),
+            ("pdf_url", pa.string()),
+        ]
+    )
+
+
+class ParquetWriter:
+    """
+    Streams `ResultBatch`es to a Parquet file, one row group per batch, so
+    memory use stays bounded by the page size however large the export.
+    Requires `pyarrow`.
+
+    ```python
+    with arxiv.ParquetWriter("cs.parquet") as writer:
+        for batch in client.batches(search):
+            writer.write(batch)
+    ```
+    """
+
+    path: Path
+    """The Parquet file being written."""
+    rows: int
+    """Number of rows written so far."""
+
+    def __init__(self, path: str | Path, compression: str = "zstd"):
+        """
+        Constructs a writer creating (or replacing) the Parquet file at `path`.
+        """
+        _import("pyarrow", "ParquetWriter")
+        import pyarrow.parquet
+
+        self.path = Path(path)
+        self.rows = 0
+        self._writer = pyarrow.parquet.ParquetWriter(
+            str(self.path), _arrow_schema(), compression=compression
+        )
+
+    def __repr__(self) -> str:
+        return "arxiv.ParquetWriter({}, rows={})".format(repr(str(self.path)), repr(self.rows))
+
+    def __enter__(self) -> ParquetWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, batch: ResultBatch) -> None:
+        """Appends `batch`'s rows to the file."""
+        if len(batch):
+            self._writer.write_batch(batch.to_arrow())
+            self.rows += len(batch)
+
+    def write_all(self, batches: Iterable[ResultBatch]) -> int:
+        """Appends every batch's rows, and returns the number of rows written."""
+        written = 0
+        for batch in batches:
+            self.write(batch)
+            written += len(batch)
+        return written
+
+    def close(self) -> None:
+        """Finishes the file; the writer can't be used afterwards."""
+        self._writer.close()
+        logger.info("Wrote %d results to %s", self.rows, self.path)
@@ -0,0 +1,147 @@
+"""Bulk lookup of known arXiv IDs; see `arxiv.Client.fetch_ids`."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from ._arxivid import ArxivId
+
+if TYPE_CHECKING:
+    from . import Client, Result
+
+logger = logging.getLogger(__name__)
+
+_MAX_BATCH_SIZE = 2000
+"""The API's limit on results per page."""
+
+
+def _batches(ids: list[str], batch_size: int, max_id_list_length: int) -> Iterator[list[str]]:
+    """
+    Splits `ids` into batches of at most `batch_size` IDs whose URL-encoded,
+    comma-separated `id_list` is at most `max_id_list_length` characters.
+    """
+    batch: list[str] = []
+    length = 0
+    for id in ids:
+        # Each ID after the first is preceded by an encoded comma ("%2C").
+        id_length = len(quote(id, safe="")) + (3 if batch else 0)
+        if batch and (len(batch) >= batch_size or length + id_length > max_id_list_length):
+            yield batch
+            batch, length = [], 0
+            id_length -= 3
+        batch.append(id)
+        length += id_length
+    if batch:
+        yield batch
+
+
+class IdLookup:
+    """
+    The results of `Client.fetch_ids`: iterate over it to stream `Result`s for
+    the requested IDs.
+
+    IDs are validated, normalized and deduplicated, then fetched in batches.
+    Invalid IDs are never sent: one would make arXiv reject its whole batch.
+    After iteration, `missing` lists the requested IDs for which arXiv
+    returned no result. An `IdLookup` can be iterated only once.
+    """
+
+    ids: list[str]
+    """The normalized, deduplicated valid IDs to fetch, in input order."""
+    invalid: list[str]
+    """
+    Requested IDs that aren't valid arXiv IDs, as given. They're not fetched,
+    and are listed in `missing` too.
+    """
+    missing: list[str]
+    """
+    Requested IDs for which no result has been returned. Complete once
+    iteration finishes; while iterating, it lists IDs missing from the batches
+    fetched so far.
+    """
+    ordered: bool
+    """
+    Whether results are yielded in input order. If `False`, they're yielded in
+    the order they arrive.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        ids: Iterable[str],
+        batch_size: int,
+        ordered: bool,
+        max_id_list_length: int,
+    ):
+        parsed: dict[ArxivId, None] = {}
+        self.invalid = []
+        for id in ids:
+            try:
+                parsed[ArxivId.parse(id)] = None
+            except ValueError:
+                self.invalid.append(id)
+        if self.invalid:
+            logger.warning("Skipping %d invalid IDs", len(self.invalid))
+        self.ids = [id.short_id for id in parsed]
+        self.missing = list(self.invalid)
+        self.ordered = ordered
+        self._client = client
+        self._batch_size = min(batch_size, _MAX_BATCH_SIZE)
+        self._max_id_list_length = max_id_list_length
+        self._consumed = False
+
+    def __repr__(self) -> str:
+        return "arxiv.IdLookup({} ids, ordered={})".format(len(self.ids), repr(self.ordered))
+
+    def __iter__(self) -> Iterator[Result]:
+        if self._consumed:
+            raise RuntimeError("IdLookup can be iterated only once")
+        self._consumed = True
+        for batch in _batches(self.ids, self._batch_size, self._max_id_list_length):
+            yield from self._fetch_batch(batch)
+
+    def _fetch_batch(self, batch: list[str]) -> Iterator[Result]:
+        from . import HTTPError, Search
+
+        # Requested IDs awaiting a result; an unversioned ID matches any version.
+        pending = dict.fromkeys(batch)
+        found: dict[str, Result] = {}
+        received = 0
+        search = Search(id_list=batch, max_results=len(batch))
+        try:
+            for result in self._client.results(search):
+                received += 1
+                id = result.arxiv_id
+                if id.short_id in pending:
+                    key = id.short_id
+                elif id.base_id in pending:
+                    key = id.base_id
+                else:
+                    logger.warning("Got unrequested result %s; skipping", id)
+                    continue
+                del pending[key]
+                if self.ordered:
+                    found[key] = result
+                else:
+                    yield result
+        except HTTPError as err:
+            # arXiv rejects a whole batch with a 400 if any ID in it is one it
+            # doesn't accept; bisect the batch to isolate such IDs.
+            if err.status != 400 or received:
+                raise
+            if len(batch) == 1:
+                logger.warning("arXiv rejected ID %s; skipping", batch[0])
+                self.missing.append(batch[0])
+                return
+            middle = len(batch) // 2
+            yield from self._fetch_batch(batch[:middle])
+            yield from self._fetch_batch(batch[middle:])
+            return
+        if self.ordered:
+            yield from (found[id] for id in batch if id in found)
+        if pending:
+            logger.info("No results for %d of %d IDs in batch", len(pending), len(batch))
+            self.missing.extend(pending)
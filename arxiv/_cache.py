@@ -0,0 +1,252 @@
+"""Caches of arXiv API responses.
+
++ `ResponseCache` stores the raw Atom body of each successfully fetched page in
+  a SQLite database, keyed by the page's normalized query URL. A hit skips both
+  the HTTP request and the rate-limit sleep.
++ `PageCache` keeps parsed pages in memory, keyed by the page's query URL
+  (including the API endpoint) and parsing options. A hit additionally skips
+  XML parsing and `Result` construction.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Hashable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ._feed import ParsedFeed
+from ._sqlite import Database
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalizes a query URL so equivalent requests share a cache key: sorts the
+    query parameters and lowercases the scheme and host.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+class ResponseCache:
+    """
+    A persistent cache of raw API responses, shared by every `Client` (in any
+    process) pointing at the same database file.
+
+    Entries expire `ttl` after they're stored. When the cached bodies exceed
+    `max_bytes` in total, the least recently used entries are evicted.
+    """
+
+    path: Path
+    """The SQLite database file holding cached responses."""
+    ttl: timedelta | None
+    """How long a cached response stays valid; `None` to keep it until evicted."""
+    max_bytes: int | None
+    """Cap on the total size of cached bodies; `None` for no cap."""
+    min_entry_age: timedelta | None
+    """
+    If set, only pages whose entries were all last updated at least this long
+    ago are cached. Older records rarely change, so this keeps recently updated
+    results fresh while caching stable history.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: timedelta | None = timedelta(hours=24),
+        max_bytes: int | None = 512 * 1024 * 1024,
+        min_entry_age: timedelta | None = None,
+        timeout: float = 60.0,
+    ):
+        """
+        Constructs a response cache backed by the SQLite database at `path`,
+        creating it if necessary.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.min_entry_age = min_entry_age
+        self._db = Database(self.path, timeout)
+        self._db.connection().execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, size INTEGER, stored_at REAL, accessed_at REAL)"
+        )
+
+    def __repr__(self) -> str:
+        return "arxiv.ResponseCache({}, ttl={}, max_bytes={}, min_entry_age={})".format(
+            repr(str(self.path)), repr(self.ttl), repr(self.max_bytes), repr(self.min_entry_age)
+        )
+
+    def get(self, url: str) -> bytes | None:
+        """
+        Returns the cached body for `url`, or `None` if there is no fresh entry.
+        """
+        key = _normalize_url(url)
+        now = time.time()
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, stored_at = row
+            if self.ttl is not None and now - stored_at > self.ttl.total_seconds():
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return bytes(body)
+
+    def put(self, url: str, body: bytes, feed: ParsedFeed) -> None:
+        """
+        Stores `body`, the response for `url`, if `feed` (its parsed form) is
+        worth caching; then evicts least recently used entries over `max_bytes`.
+        """
+        if not self._should_store(feed):
+            return
+        key = _normalize_url(url)
+        now = time.time()
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now),
+            )
+            if self.max_bytes is not None:
+                self._evict(conn, self.max_bytes)
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def _should_store(self, feed: ParsedFeed) -> bool:
+        # Empty pages are usually transient API failures; never cache them.
+        if feed.malformed or not feed.count:
+            return False
+        if self.min_entry_age is None:
+            return True
+        cutoff = datetime.now(timezone.utc) - self.min_entry_age
+        if feed.batch is not None:
+            return max(feed.batch.updated) <= cutoff.timestamp()
+        # Results parsed without `updated` (see `Client.results`) can't be
+        # checked, so their pages aren't cached.
+        updated = [getattr(r, "updated", None) for r in feed.results]
+        return all(u is not None and u <= cutoff for u in updated)
+
+    def _evict(self, conn: sqlite3.Connection, max_bytes: int) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            logger.debug("Evicted cached response: %s", key)
+
+
+class PageCache:
+    """
+    A bounded, in-memory LRU cache of parsed result pages.
+
+    Share one `PageCache` between clients (and threads) in a long-lived
+    process to serve repeated searches without refetching or reparsing. Cached
+    pages are shared, not copied: callers mustn't mutate the `Result`s they
+    receive.
+
+    Pages' sizes are approximated by the size of their raw response bodies.
+    """
+
+    max_entries: int | None
+    """Maximum number of cached pages; `None` for no limit."""
+    max_bytes: int | None
+    """Cap on the total size of cached pages; `None` for no cap."""
+    ttl: timedelta | None
+    """How long a cached page stays valid; `None` to keep it until evicted."""
+    hits: int
+    """Number of lookups served from the cache."""
+    misses: int
+    """Number of lookups not served from the cache."""
+    evictions: int
+    """Number of pages evicted to respect `max_entries` or `max_bytes`."""
+
+    def __init__(
+        self,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = 256 * 1024 * 1024,
+        ttl: timedelta | None = timedelta(minutes=15),
+    ):
+        """
+        Constructs an empty page cache with the specified bounds.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pages: OrderedDict[Hashable, tuple[float, ParsedFeed]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "arxiv.PageCache(max_entries={}, max_bytes={}, ttl={})".format(
+            repr(self.max_entries), repr(self.max_bytes), repr(self.ttl)
+        )
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, key: Hashable) -> ParsedFeed | None:
+        """
+        Returns the cached page for `key`, or `None` if there is no fresh entry.
+        """
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None:
+                stored_at, feed = entry
+                if self.ttl is None or time.monotonic() - stored_at <= self.ttl.total_seconds():
+                    self._pages.move_to_end(key)
+                    self.hits += 1
+                    return feed
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, feed: ParsedFeed) -> None:
+        """
+        Stores `feed` under `key` unless it's empty or malformed, then evicts
+        least recently used pages over the cache's bounds.
+        """
+        if feed.malformed or not feed.count:
+            return
+        with self._lock:
+            if key in self._pages:
+                self._remove(key)
+            self._pages[key] = (time.monotonic(), feed)
+            self._bytes += feed.size
+            while self._pages and (
+                (self.max_entries is not None and len(self._pages) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._pages)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes every cached page; doesn't reset the counters."""
+        with self._lock:
+            self._pages.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, feed = self._pages.pop(key)
+        self._bytes -= feed.size
@@ -0,0 +1,131 @@
+"""Resumable positions in a `Client.results` run; see `arxiv.Cursor`."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import Search
+
+_SCHEMA_VERSION = 1
+
+
+class Cursor:
+    """
+    A serializable position in a `Client.results` run: the search, the offset
+    of the next result to fetch, and the IDs on the last completed page.
+
+    Pass an `on_checkpoint` callback to `Client.results` to receive a cursor
+    every few completed pages, and save it (e.g. with `Cursor.save`). After a
+    crash, pass the saved cursor as `resume_from` to continue where the run
+    stopped without refetching completed pages:
+
+    ```python
+    search = arxiv.Search(query="cat:cs.LG", max_results=None)
+    resume_from = arxiv.Cursor.load(path) if path.exists() else None
+    for r in client.results(search, resume_from=resume_from, on_checkpoint=lambda c: c.save(path)):
+        ...
+    ```
+    """
+
+    search: Search
+    """The search being run."""
+    offset: int
+    """Index of the next result to fetch in the search's result set."""
+    total_results: int | None
+    """The total number of results the API last reported for the search."""
+    last_seen_ids: list[str]
+    """
+    Entry IDs on the last completed page. When resuming, results with these IDs
+    are skipped, in case the result set shifted between runs.
+    """
+
+    def __init__(
+        self,
+        search: Search,
+        offset: int = 0,
+        total_results: int | None = None,
+        last_seen_ids: list[str] | None = None,
+    ):
+        """
+        Constructs a cursor at the specified position in `search`'s results.
+        """
+        self.search = search
+        self.offset = offset
+        self.total_results = total_results
+        self.last_seen_ids = last_seen_ids or []
+
+    def __repr__(self) -> str:
+        return "arxiv.Cursor({}, offset={}, total_results={}, last_seen_ids={})".format(
+            repr(self.search),
+            repr(self.offset),
+            repr(self.total_results),
+            repr(self.last_seen_ids),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Cursor):
+            return self.to_dict() == other.to_dict()
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a JSON-serializable representation of this cursor."""
+        return {
+            "version": _SCHEMA_VERSION,
+            "search": self.search._to_dict(),
+            "offset": self.offset,
+            "total_results": self.total_results,
+            "last_seen_ids": self.last_seen_ids,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Cursor:
+        """Reconstructs a cursor from the output of `Cursor.to_dict`."""
+        from . import Search
+
+        if data.get("version") != _SCHEMA_VERSION:
+            raise ValueError("Unsupported cursor version: {}".format(data.get("version")))
+        return cls(
+            search=Search._from_dict(data["search"]),
+            offset=data["offset"],
+            total_results=data["total_results"],
+            last_seen_ids=data["last_seen_ids"],
+        )
+
+    def save(self, path: str | Path) -> None:
+        """
+        Writes this cursor to `path` as JSON. The write is atomic: a crash
+        mid-write leaves the previous checkpoint intact.
+        """
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cursor:
+        """Reads a cursor written by `Cursor.save`."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class _Checkpointer:
+    """
+    Tracks a `Client.results` run page by page, passing a `Cursor` to
+    `on_checkpoint` after every `every` completed pages.
+    """
+
+    def __init__(self, search: Search, on_checkpoint: Callable[[Cursor], None], every: int):
+        self.search = search
+        self.on_checkpoint = on_checkpoint
+        self.every = every
+        self.pages = 0
+
+    def page_done(self, next_offset: int, total_results: int, ids: list[str]) -> None:
+        """Records a page whose results have all been consumed."""
+        self.pages += 1
+        if self.pages % self.every == 0:
+            self.on_checkpoint(Cursor(self.search, next_offset, total_results, ids))
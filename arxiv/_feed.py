@@ -13,7 +13,8 @@ so a thin namespace-aware lxml parser gives us:
 
 The public surface is intentionally minimal: `parse(content)` returns a
 `ParsedFeed` carrying the page header plus a list of fully-constructed
-`arxiv.Result` objects.
+`arxiv.Result` objects. `FeedStream` parses a response incrementally as it
+downloads, yielding each `arxiv.Result` as soon as its `<entry>` closes.
 
 For the response format see
 https://info.arxiv.org/help/api/user-manual.html#_details_of_atom_results_returned.
@@ -21,16 +22,21 @@ https://info.arxiv.org/help/api/user-manual.html#_details_of_atom_results_return
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from lxml import etree
 
 if TYPE_CHECKING:
     from . import Result
+    from ._batch import ResultBatch
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,32 @@ _NS = {
     "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
 }
 
+# Clark-notation tags of the elements `FeedStream` handles as they close.
+_ENTRY_TAG = "{%s}entry" % _NS["atom"]
+# Clark-notation tags of the `<entry>` children `_read_entry` reads.
+_ID = "{%s}id" % _NS["atom"]
+_UPDATED = "{%s}updated" % _NS["atom"]
+_PUBLISHED = "{%s}published" % _NS["atom"]
+_TITLE = "{%s}title" % _NS["atom"]
+_SUMMARY = "{%s}summary" % _NS["atom"]
+_AUTHOR = "{%s}author" % _NS["atom"]
+_NAME = "{%s}name" % _NS["atom"]
+_LINK = "{%s}link" % _NS["atom"]
+_CATEGORY = "{%s}category" % _NS["atom"]
+_AFFILIATION = "{%s}affiliation" % _NS["arxiv"]
+_PRIMARY_CATEGORY = "{%s}primary_category" % _NS["arxiv"]
+_COMMENT = "{%s}comment" % _NS["arxiv"]
+_JOURNAL_REF = "{%s}journal_ref" % _NS["arxiv"]
+_DOI = "{%s}doi" % _NS["arxiv"]
+
+_WHITESPACE = re.compile(r"\s+")
+
+_HEADER_TAGS = {
+    "{%s}totalResults" % _NS["opensearch"]: "total_results",
+    "{%s}itemsPerPage" % _NS["opensearch"]: "items_per_page",
+    "{%s}startIndex" % _NS["opensearch"]: "start_index",
+}
+
 
 def _text(elem: Any, path: str) -> str | None:
     if elem is None:
@@ -52,12 +84,23 @@ def _text(elem: Any, path: str) -> str | None:
     return found.text
 
 
-def _parse_datetime(s: str | None) -> datetime | None:
-    """Parse an Atom RFC 3339 timestamp into a tz-aware UTC datetime."""
-    if s is None:
-        return None
-    # arXiv emits e.g. "2016-05-26T17:59:46Z". `fromisoformat` handles
-    # `+00:00` natively; swap `Z` for that on older Pythons.
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(s: str) -> datetime:
+    """Parse an Atom RFC 3339 timestamp into a tz-aware UTC datetime.
+
+    arXiv always emits the fixed form "2016-05-26T17:59:46Z", which skips the
+    normalization `_parse_iso_datetime` does for other forms. Results are
+    memoized, since entries announced in the same batch share timestamps.
+    """
+    if len(s) == 20 and s[19] == "Z":
+        return datetime.fromisoformat(s[:19]).replace(tzinfo=timezone.utc)
+    return _parse_iso_datetime(s)
+
+
+def _parse_iso_datetime(s: str) -> datetime:
+    """Parse any RFC 3339 timestamp into a tz-aware UTC datetime."""
+    # `fromisoformat` handles `+00:00` natively; swap `Z` for that on older
+    # Pythons.
     text = s.strip().replace("Z", "+00:00")
     dt = datetime.fromisoformat(text)
     if dt.tzinfo is None:
@@ -82,96 +125,358 @@ class ParsedFeed:
     results: list["Result"] = field(default_factory=list)
     malformed: bool = False
     error: Exception | None = None
+    size: int = 0
+    """Size of the raw response body in bytes."""
+    parse_seconds: float = 0.0
+    """Time spent parsing the body's XML."""
+    build_seconds: float = 0.0
+    """Time spent constructing `Result`s from the parsed entries."""
+    batch: "ResultBatch | None" = None
+    """The parsed entries as columns, instead of `results`, if parsed `columnar`."""
+
+    @property
+    def count(self) -> int:
+        """The number of entries parsed, as `results` or as `batch` rows."""
+        return len(self.batch) if self.batch is not None else len(self.results)
+
+
+_Result: "type[Result] | None" = None
+
+
+def _result_type() -> "type[Result]":
+    """Returns `arxiv.Result`, importing it on first use."""
+    global _Result
+    if _Result is None:
+        # Imported lazily to avoid a circular import; `Result` lives in `arxiv`.
+        from . import Result
+
+        _Result = Result
+    return _Result
+
+
+def _make_parser() -> Any:
+    # Disable network access and entity expansion; arXiv responses never
+    # need to reference external resources.
+    return etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+        recover=True,
+    )
 
 
-def _build_result(entry: Any) -> "Result | None":
-    """Convert a parsed `<entry>` element into a `Result`, or None if invalid."""
-    # Imported lazily to avoid a circular import; `Result` lives in `arxiv`.
-    from . import Result
+_local = threading.local()
+
+
+def _parser() -> Any:
+    """Returns this thread's reusable parser; lxml parsers aren't thread-safe."""
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = _make_parser()
+    return parser
+
+
+def _int_text(text: str | None) -> int:
+    if text is None:
+        return 0
+    try:
+        return int(text.strip())
+    except ValueError:
+        return 0
+
+
+class _Entry(NamedTuple):
+    """An `<entry>`'s raw field values, read in one pass but not yet decoded."""
+
+    entry_id: str
+    updated: str
+    published: str
+    title: str | None
+    summary: str | None
+    comment: str | None
+    journal_ref: str | None
+    doi: str | None
+    primary_category: str
+    categories: list[str]
+    authors: list[tuple[str, list[str]]]
+    """`(name, affiliations)` pairs."""
+    links: list[tuple[str, str | None, str, str | None]]
+    """`(href, title, rel, type)` tuples."""
+
+
+class _Values(dict[str, str]):
+    """A dict that maps each missing key to itself, adding it."""
+
+    def __missing__(self, key: str) -> str:
+        self[key] = key
+        return key
+
+
+class _ValuePool:
+    """
+    Canonical instances of the strings that repeat across feed entries:
+    category terms, link attributes, and prolific authors' names and
+    affiliations. Results parsed with the same pool share these strings
+    rather than each holding its own copy, which adds up across a long
+    harvest.
+
+    The pool holds at most about `maxsize` values: once it outgrows that, it
+    starts over empty when the next page is parsed.
+    """
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._values = _Values()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def interner(self) -> Callable[[str], str]:
+        """
+        Returns a function mapping each value to its pooled instance, adding
+        values not yet pooled.
+        """
+        if len(self._values) > self.maxsize:
+            logger.debug("Value pool reached %d values; clearing it", len(self._values))
+            self._values.clear()
+        # Looking up a pooled value doesn't make any Python-level call.
+        return self._values.__getitem__
+
+
+def _read_entry(
+    entry: Any,
+    tags: frozenset[str] | None = None,
+    intern: Callable[[str], str] | None = None,
+) -> _Entry | None:
+    """Reads an `<entry>` element's raw fields, or returns None if it's invalid.
+
+    Makes a single pass over the entry's children, dispatching on their
+    Clark-notation tags, rather than searching the entry once per field. If
+    `tags` is given, children with other tags are skipped, and their fields
+    are left empty. Values that repeat across entries (names, affiliations,
+    categories and link attributes) are passed through `intern` if given,
+    e.g. a `_ValuePool.interner`.
+    """
+    entry_id = updated = published = title = summary = None
+    comment = journal_ref = doi = None
+    primary_category = ""
+    authors: list[tuple[str, list[str]]] = []
+    links: list[tuple[str, str | None, str, str | None]] = []
+    categories: list[str] = []
+    # Ordered by how often each tag occurs in an entry.
+    for child in entry:
+        tag = child.tag
+        if tags is not None and tag not in tags:
+            continue
+        if tag == _AUTHOR:
+            name = ""
+            affiliations: list[str] = []
+            for field_elem in child:
+                if field_elem.tag == _NAME:
+                    name = field_elem.text or ""
+                elif field_elem.tag == _AFFILIATION and field_elem.text is not None:
+                    affiliations.append(field_elem.text)
+            authors.append((name, affiliations))
+        elif tag == _LINK:
+            get = child.get
+            href = get("href")
+            if href is not None:
+                links.append((href, get("title"), get("rel") or "", get("type")))
+        elif tag == _CATEGORY:
+            term = child.get("term")
+            if term is not None:
+                categories.append(term)
+        elif tag == _ID:
+            entry_id = child.text
+        elif tag == _UPDATED:
+            updated = child.text
+        elif tag == _PUBLISHED:
+            published = child.text
+        elif tag == _TITLE:
+            title = child.text
+        elif tag == _SUMMARY:
+            summary = child.text
+        elif tag == _PRIMARY_CATEGORY:
+            primary_category = child.get("term") or ""
+        elif tag == _COMMENT:
+            comment = child.text
+        elif tag == _JOURNAL_REF:
+            journal_ref = child.text
+        elif tag == _DOI:
+            doi = child.text
 
-    entry_id = _text(entry, "atom:id")
     if not entry_id:
         logger.warning("Skipping entry without <id>")
         return None
+    for value, tag in ((updated, _UPDATED), (published, _PUBLISHED)):
+        if value is None and (tags is None or tag in tags):
+            logger.warning("Skipping entry %s missing <%s>", entry_id, tag.split("}")[1])
+            return None
+    if intern is not None:
+        primary_category = intern(primary_category)
+        categories = list(map(intern, categories))
+        authors = [(intern(name), list(map(intern, affs))) for name, affs in authors]
+        links = [
+            (href, link_title and intern(link_title), intern(rel), type_ and intern(type_))
+            for href, link_title, rel, type_ in links
+        ]
+    return _Entry(
+        entry_id,
+        updated or "",
+        published or "",
+        title,
+        summary,
+        comment,
+        journal_ref,
+        doi,
+        primary_category,
+        categories,
+        authors,
+        links,
+    )
 
-    updated = _parse_datetime(_text(entry, "atom:updated"))
-    published = _parse_datetime(_text(entry, "atom:published"))
-    if updated is None or published is None:
-        missing = "updated" if updated is None else "published"
-        logger.warning("Skipping entry %s missing <%s>", entry_id, missing)
-        return None
-
-    title = _text(entry, "atom:title") or ""
 
-    authors: list[Result.Author] = []
-    for a in entry.iterfind("atom:author", _NS):
-        name = _text(a, "atom:name") or ""
-        affiliations = [
-            af.text for af in a.iterfind("arxiv:affiliation", _NS) if af.text is not None
+def _decode_field(entry: _Entry, name: str) -> Any:
+    """Decodes the `Result` field `name` from its raw entry."""
+    if name == "updated" or name == "published":
+        return _parse_datetime(getattr(entry, name))
+    if name == "title":
+        return _WHITESPACE.sub(" ", entry.title) if entry.title else ""
+    if name == "summary":
+        return entry.summary or ""
+    if name == "authors":
+        result_type = _result_type()
+        return [result_type.Author(name=n, affiliation=a) for n, a in entry.authors]
+    if name == "links":
+        result_type = _result_type()
+        return [
+            result_type.Link(href=href, title=title, rel=rel, content_type=content_type)
+            for href, title, rel, content_type in entry.links
         ]
-        authors.append(Result.Author(name=name, affiliation=affiliations))
+    if name == "pdf_url":
+        return _result_type()._get_pdf_url(_decode_field(entry, "links"))
+    return getattr(entry, name)
 
-    links: list[Result.Link] = []
-    for link in entry.iterfind("atom:link", _NS):
-        href = link.get("href")
-        if href is None:
-            continue
-        links.append(
-            Result.Link(
-                href=href,
-                title=link.get("title"),
-                rel=link.get("rel") or "",
-                content_type=link.get("type"),
-            )
-        )
 
-    categories: list[str] = []
-    for cat in entry.iterfind("atom:category", _NS):
-        term = cat.get("term")
-        if term is not None:
-            categories.append(term)
-
-    primary_elem = entry.find("arxiv:primary_category", _NS)
-    primary_category = primary_elem.get("term") if primary_elem is not None else ""
-
-    return Result(
-        entry_id=entry_id,
-        updated=updated,
-        published=published,
-        title=re.sub(r"\s+", " ", title),
-        authors=authors,
-        summary=_text(entry, "atom:summary") or "",
-        comment=_text(entry, "arxiv:comment"),
-        journal_ref=_text(entry, "arxiv:journal_ref"),
-        doi=_text(entry, "arxiv:doi"),
-        primary_category=primary_category or "",
-        categories=categories,
-        links=links,
+_LAZY_FIELDS = frozenset(["updated", "published", "title", "authors", "links", "pdf_url"])
+"""
+`Result` fields a lazy result decodes on first access. `pdf_url` is derived
+from the decoded `links`.
+"""
+
+_FIELD_TAGS = {
+    "entry_id": _ID,
+    "updated": _UPDATED,
+    "published": _PUBLISHED,
+    "title": _TITLE,
+    "authors": _AUTHOR,
+    "summary": _SUMMARY,
+    "comment": _COMMENT,
+    "journal_ref": _JOURNAL_REF,
+    "doi": _DOI,
+    "primary_category": _PRIMARY_CATEGORY,
+    "categories": _CATEGORY,
+    "links": _LINK,
+    "pdf_url": _LINK,
+}
+"""The tag each `Result` field is read from, in `Result` constructor order."""
+
+
+def _projection(fields: Iterable[str]) -> frozenset[str]:
+    """
+    Validates a set of `Result` field names to parse, adding `entry_id`, which
+    every result needs.
+    """
+    projection = frozenset(fields) | {"entry_id"}
+    unknown = projection - _FIELD_TAGS.keys()
+    if unknown:
+        raise ValueError("Unknown Result fields: {}".format(", ".join(sorted(unknown))))
+    return projection
+
+
+@functools.lru_cache(maxsize=64)
+def _projection_tags(fields: frozenset[str]) -> frozenset[str]:
+    return frozenset(_FIELD_TAGS[name] for name in fields)
+
+
+def _build_result(entry: Any, intern: Callable[[str], str] | None = None) -> "Result | None":
+    """Convert a parsed `<entry>` element into a `Result`, or None if invalid."""
+    data = _read_entry(entry, intern=intern)
+    if data is None:
+        return None
+    result_type = _result_type()
+    return result_type(
+        entry_id=data.entry_id,
+        updated=_parse_datetime(data.updated),
+        published=_parse_datetime(data.published),
+        title=_WHITESPACE.sub(" ", data.title) if data.title else "",
+        authors=[result_type.Author(name=n, affiliation=a) for n, a in data.authors],
+        summary=data.summary or "",
+        comment=data.comment,
+        journal_ref=data.journal_ref,
+        doi=data.doi,
+        primary_category=data.primary_category,
+        categories=data.categories,
+        links=[
+            result_type.Link(href=href, title=title, rel=rel, content_type=content_type)
+            for href, title, rel, content_type in data.links
+        ],
     )
 
 
-def parse(content: bytes) -> ParsedFeed:
+def _lazy_result(entry: Any, intern: Callable[[str], str] | None = None) -> "Result | None":
+    """
+    Like `_build_result`, but defers decoding the `_LAZY_FIELDS` until they're
+    first accessed.
+    """
+    data = _read_entry(entry, intern=intern)
+    if data is None:
+        return None
+    return _result_type()._lazy(data)
+
+
+def _projected_result(
+    entry: Any, fields: frozenset[str], intern: Callable[[str], str] | None = None
+) -> "Result | None":
+    """
+    Like `_build_result`, but reads and decodes only the `Result` fields in
+    `fields` (a `_projection`), skipping the others' elements entirely.
+    """
+    data = _read_entry(entry, _projection_tags(fields), intern)
+    if data is None:
+        return None
+    return _result_type()._projected(data, fields)
+
+
+def parse(
+    content: bytes,
+    lazy: bool = False,
+    fields: frozenset[str] | None = None,
+    columnar: bool = False,
+    pool: _ValuePool | None = None,
+) -> ParsedFeed:
     """Parse an arXiv API Atom response.
 
     Always returns a `ParsedFeed`. If the document is unparseable, returns an
     empty feed with `malformed=True` and `error` set. Individual entries that
-    are missing required fields are logged and skipped.
+    are missing required fields are logged and skipped. If `lazy`, results
+    decode their costlier fields only when first accessed. If `fields` (a
+    `_projection`) is given, results only have those fields; it overrides
+    `lazy`. If `columnar`, entries are read into `ParsedFeed.batch` instead
+    of `Result`s. If a `pool` is given, repeated values share its instances.
     """
     if not isinstance(content, (bytes, bytearray)):
         raise TypeError("parse expects bytes")
 
+    started = time.perf_counter()
     try:
-        # Disable network access and entity expansion; arXiv responses never
-        # need to reference external resources.
-        parser = etree.XMLParser(
-            resolve_entities=False,
-            no_network=True,
-            huge_tree=False,
-            recover=True,
-        )
-        root = etree.fromstring(content, parser=parser)
+        root = etree.fromstring(content, parser=_parser())
     except etree.XMLSyntaxError as exc:
-        return ParsedFeed(header=FeedHeader(), results=[], malformed=True, error=exc)
+        return ParsedFeed(
+            header=FeedHeader(), results=[], malformed=True, error=exc, size=len(content)
+        )
 
     if root is None:
         return ParsedFeed(
@@ -179,16 +484,11 @@ def parse(content: bytes) -> ParsedFeed:
             results=[],
             malformed=True,
             error=ValueError("empty document"),
+            size=len(content),
         )
 
     def _int(path: str) -> int:
-        text = _text(root, path)
-        if text is None:
-            return 0
-        try:
-            return int(text.strip())
-        except ValueError:
-            return 0
+        return _int_text(_text(root, path))
 
     header = FeedHeader(
         total_results=_int("opensearch:totalResults"),
@@ -196,10 +496,123 @@ def parse(content: bytes) -> ParsedFeed:
         start_index=_int("opensearch:startIndex"),
     )
 
+    parsed = time.perf_counter()
+    intern = pool.interner() if pool is not None else None
     results: list["Result"] = []
-    for entry_elem in root.iterfind("atom:entry", _NS):
-        result = _build_result(entry_elem)
-        if result is not None:
-            results.append(result)
+    batch = None
+    if columnar:
+        from ._batch import ResultBatch
+
+        batch = ResultBatch()
+        for entry_elem in root.iterchildren(_ENTRY_TAG):
+            data = _read_entry(entry_elem, intern=intern)
+            if data is not None:
+                batch._append(data)
+    else:
+        build = _builder(lazy, fields, intern)
+        for entry_elem in root.iterchildren(_ENTRY_TAG):
+            result = build(entry_elem)
+            if result is not None:
+                results.append(result)
+
+    return ParsedFeed(
+        header=header,
+        results=results,
+        batch=batch,
+        malformed=False,
+        size=len(content),
+        parse_seconds=parsed - started,
+        build_seconds=time.perf_counter() - parsed,
+    )
 
-    return ParsedFeed(header=header, results=results, malformed=False)
+
+def _builder(
+    lazy: bool, fields: frozenset[str] | None, intern: Callable[[str], str] | None = None
+) -> Callable[[Any], "Result | None"]:
+    """Returns the function `parse` and `FeedStream` use to build results."""
+    if fields is not None:
+        return functools.partial(_projected_result, fields=fields, intern=intern)
+    build = _lazy_result if lazy else _build_result
+    return functools.partial(build, intern=intern) if intern is not None else build
+
+
+class FeedStream:
+    """An arXiv API response parsed incrementally as its chunks arrive.
+
+    Iterating yields each `Result` as soon as its `<entry>` closes, then
+    discards the entry's elements, so memory use stays flat however large the
+    page. `header`, `size`, and the `malformed` flags are complete once
+    iteration finishes. A `FeedStream` can be iterated only once.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        lazy: bool = False,
+        fields: frozenset[str] | None = None,
+        pool: _ValuePool | None = None,
+    ):
+        self.header = FeedHeader()
+        self.size = 0
+        self.count = 0
+        self.malformed = False
+        self.error: Exception | None = None
+        self.parse_seconds = 0.0
+        self.build_seconds = 0.0
+        self._chunks = chunks
+        self._build = _builder(lazy, fields, pool.interner() if pool is not None else None)
+
+    def __iter__(self) -> Iterator["Result"]:
+        parser = etree.XMLPullParser(
+            events=("end",),
+            tag=[_ENTRY_TAG, *_HEADER_TAGS],
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=False,
+            recover=True,
+        )
+        for chunk in self._chunks:
+            self.size += len(chunk)
+            started = time.perf_counter()
+            parser.feed(chunk)
+            self.parse_seconds += time.perf_counter() - started
+            yield from self._read_events(parser)
+        started = time.perf_counter()
+        try:
+            parser.close()
+        except etree.XMLSyntaxError as exc:
+            self.malformed, self.error = True, exc
+        self.parse_seconds += time.perf_counter() - started
+        yield from self._read_events(parser)
+        if self.size == 0:
+            self.malformed, self.error = True, ValueError("empty document")
+
+    def _read_events(self, parser: Any) -> Iterator["Result"]:
+        for _, elem in parser.read_events():
+            if elem.tag == _ENTRY_TAG:
+                started = time.perf_counter()
+                result = self._build(elem)
+                self.build_seconds += time.perf_counter() - started
+                if result is not None:
+                    self.count += 1
+                    yield result
+            else:
+                setattr(self.header, _HEADER_TAGS[elem.tag], _int_text(elem.text))
+            # Drop the handled element and everything before it.
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    def feed(self) -> ParsedFeed:
+        """Summarizes the stream (without its results) as a `ParsedFeed`."""
+        return ParsedFeed(
+            header=self.header,
+            results=[],
+            malformed=self.malformed,
+            error=self.error,
+            size=self.size,
+            parse_seconds=self.parse_seconds,
+            build_seconds=self.build_seconds,
+        )
@@ -0,0 +1,287 @@
+"""Request lifecycle hooks and the per-stage timing stats built on them.
+
+A `Client` notifies its `ClientHooks` as each page request moves through its
+stages: waiting for a rate-limit slot, the HTTP request, and parsing the
+response. `ClientStats`, which every client keeps as `Client.stats`, is
+itself a hook that aggregates those notifications into counters and latency
+histograms.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._feed import ParsedFeed
+
+_DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Upper bounds, in seconds, of `LatencyHistogram`'s default buckets."""
+
+
+class ClientHooks:
+    """
+    Base class for observers of a `Client`'s requests. Every method is a no-op;
+    subclasses override the ones they need.
+
+    Hooks are called synchronously on the thread making the request (a
+    background thread if the client prefetches), so they should be quick and
+    thread-safe. Exceptions raised by a hook propagate to the caller.
+    """
+
+    def on_request_start(self, url: str, try_index: int) -> None:
+        """Called just before requesting `url`; `try_index` is 0 for the initial try."""
+
+    def on_response(self, url: str, status: int, seconds: float) -> None:
+        """
+        Called when a response arrives, `seconds` after the request started.
+        For non-streaming clients that includes downloading the body; streaming
+        clients report the time to the response headers.
+        """
+
+    def on_parsed(self, url: str, feed: ParsedFeed, results: int) -> None:
+        """
+        Called when a response body has been parsed into `results` results.
+        `feed.size`, `feed.parse_seconds` and `feed.build_seconds` report the
+        body's size and the time spent parsing XML and constructing `Result`s.
+        Streaming clients' feeds don't retain their results.
+        """
+
+    def on_retry(self, url: str, err: Exception, try_index: int, wait: float) -> None:
+        """
+        Called before retrying after try `try_index` failed with `err`, with the
+        backoff (in seconds) the client will wait on top of the rate limit.
+        """
+
+    def on_sleep(self, seconds: float, reason: str) -> None:
+        """
+        Called after the client slept for `seconds`. `reason` is `"rate_limit"`
+        when waiting for a request slot, or `"backoff"` before a retry.
+        """
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations in fixed buckets, in the style of Prometheus
+    histograms. Not thread-safe on its own; `ClientStats` serializes updates.
+    """
+
+    buckets: tuple[float, ...]
+    """Upper bounds of the buckets, in seconds, ascending."""
+    counts: list[int]
+    """Observations per bucket; the last entry counts those above every bound."""
+    count: int
+    """Total number of observations."""
+    sum: float
+    """Sum of all observations, in seconds."""
+    max: float
+    """Largest observation, in seconds."""
+
+    def __init__(self, buckets: tuple[float, ...] = _DEFAULT_BUCKETS):
+        """
+        Constructs an empty histogram with the specified bucket bounds.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return "arxiv.LatencyHistogram(count={}, sum={}, max={})".format(
+            repr(self.count), repr(self.sum), repr(self.max)
+        )
+
+    def observe(self, seconds: float) -> None:
+        """Records one duration."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """The mean observation, in seconds; 0 if there are none."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the `q`-quantile (e.g. 0.99) as the upper bound of the bucket
+        containing it, capped at `max`.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns a JSON-serializable summary, with cumulative bucket counts keyed
+        by upper bound (`"+Inf"` for the last).
+        """
+        cumulative: dict[str, int] = {}
+        seen = 0
+        for bound, n in zip((*self.buckets, "+Inf"), self.counts):
+            seen += n
+            cumulative[str(bound)] = seen
+        return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": cumulative}
+
+
+class ClientStats(ClientHooks):
+    """
+    Aggregate counters and per-stage latency histograms for a `Client`'s
+    requests. Every client keeps one as `Client.stats`; scrape `to_dict` to
+    find where time goes:
+
+    + `rate_limit_sleep` and `backoff_sleep`: time spent sleeping.
+    + `network`: time from sending a request to receiving its response.
+    + `parse`: time spent parsing response XML.
+    + `build`: time spent constructing `Result`s from parsed entries.
+
+    Pages served from a `ResponseCache` are counted as parsed, but not as
+    requests; pages served from a `PageCache` aren't counted at all.
+    """
+
+    requests: int
+    """Number of HTTP requests started."""
+    responses: Counter[int]
+    """Number of responses received, by HTTP status."""
+    pages: int
+    """Number of response bodies parsed."""
+    results: int
+    """Number of results parsed."""
+    bytes_received: int
+    """Total size of parsed response bodies, in bytes."""
+    retries: Counter[str]
+    """
+    Number of retries by cause: `"http_<status>"` for HTTP errors,
+    `"empty_page"` for unexpectedly empty pages, or the exception's class name.
+    """
+    rate_limit_sleep: LatencyHistogram
+    backoff_sleep: LatencyHistogram
+    network: LatencyHistogram
+    parse: LatencyHistogram
+    build: LatencyHistogram
+
+    def __init__(self) -> None:
+        """
+        Constructs empty stats.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return "arxiv.ClientStats(requests={}, pages={}, results={}, bytes_received={})".format(
+            repr(self.requests), repr(self.pages), repr(self.results), repr(self.bytes_received)
+        )
+
+    def reset(self) -> None:
+        """Zeroes every counter and histogram."""
+        with self._lock:
+            self.requests = 0
+            self.responses = Counter()
+            self.pages = 0
+            self.results = 0
+            self.bytes_received = 0
+            self.retries = Counter()
+            self.rate_limit_sleep = LatencyHistogram()
+            self.backoff_sleep = LatencyHistogram()
+            self.network = LatencyHistogram()
+            self.parse = LatencyHistogram()
+            self.build = LatencyHistogram()
+            self._started_at: float | None = None
+            self._last_parsed_at: float | None = None
+
+    @property
+    def results_per_second(self) -> float:
+        """
+        Results parsed per second of wall time, from the first request to the
+        most recently parsed page.
+        """
+        with self._lock:
+            if self._started_at is None or self._last_parsed_at is None:
+                return 0.0
+            elapsed = self._last_parsed_at - self._started_at
+            return self.results / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a JSON-serializable snapshot of these stats."""
+        results_per_second = self.results_per_second
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "responses": {str(k): v for k, v in self.responses.items()},
+                "pages": self.pages,
+                "results": self.results,
+                "bytes_received": self.bytes_received,
+                "retries": dict(self.retries),
+                "results_per_second": results_per_second,
+                "rate_limit_sleep": self.rate_limit_sleep.to_dict(),
+                "backoff_sleep": self.backoff_sleep.to_dict(),
+                "network": self.network.to_dict(),
+                "parse": self.parse.to_dict(),
+                "build": self.build.to_dict(),
+            }
+
+    def on_request_start(self, url: str, try_index: int) -> None:
+        with self._lock:
+            self.requests += 1
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+
+    def on_response(self, url: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.responses[status] += 1
+            self.network.observe(seconds)
+
+    def on_parsed(self, url: str, feed: ParsedFeed, results: int) -> None:
+        with self._lock:
+            self.pages += 1
+            self.results += results
+            self.bytes_received += feed.size
+            self.parse.observe(feed.parse_seconds)
+            self.build.observe(feed.build_seconds)
+            self._last_parsed_at = time.monotonic()
+
+    def on_retry(self, url: str, err: Exception, try_index: int, wait: float) -> None:
+        from . import HTTPError, UnexpectedEmptyPageError
+
+        if isinstance(err, HTTPError):
+            cause = "http_{}".format(err.status)
+        elif isinstance(err, UnexpectedEmptyPageError):
+            cause = "empty_page"
+        else:
+            cause = type(err).__name__
+        with self._lock:
+            self.retries[cause] += 1
+
+    def on_sleep(self, seconds: float, reason: str) -> None:
+        with self._lock:
+            if reason == "backoff":
+                self.backoff_sleep.observe(seconds)
+            else:
+                self.rate_limit_sleep.observe(seconds)
@@ -0,0 +1,364 @@
+"""A lease-based work queue for splitting a harvest between workers.
+
+A coordinator adds work units (a search and a range of result offsets) to a
+`WorkQueue`; any number of `Worker`s, in any number of processes, claim units,
+fetch their results with `Client.results`, and mark them done. Each claim is a
+lease that the worker renews as it completes pages. A unit whose lease expires
+(because its worker crashed or hung) is claimed again, resuming from its last
+checkpointed page.
+
+Delivery is at-least-once: a unit reclaimed after its worker stalled may
+repeat part of a page, so result handlers should be idempotent (e.g. upsert by
+`Result.entry_id`).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._cursor import Cursor
+from ._sqlite import Database
+
+if TYPE_CHECKING:
+    from . import Client, Result, Search
+    from ._shard import Shard
+
+logger = logging.getLogger(__name__)
+
+_PENDING = "pending"
+_LEASED = "leased"
+_DONE = "done"
+_FAILED = "failed"
+
+
+class LeaseLostError(Exception):
+    """
+    Raised by a `Worker` when its lease on a work unit expired and another
+    worker may have claimed the unit.
+    """
+
+
+class WorkUnit:
+    """
+    A claimed range of a search's results: those at offsets `[start, end)`.
+    """
+
+    id: int
+    """The unit's ID within its queue."""
+    search: Search
+    """The search whose results the unit covers."""
+    start: int
+    """Offset of the unit's first result."""
+    end: int | None
+    """Offset after the unit's last result; `None` to run to the end."""
+    attempts: int
+    """Number of times the unit has been claimed, including this claim."""
+    cursor: Cursor | None
+    """The unit's last checkpoint, left by a previous attempt, if any."""
+
+    def __init__(
+        self,
+        id: int,
+        search: Search,
+        start: int,
+        end: int | None,
+        attempts: int,
+        cursor: Cursor | None,
+    ):
+        """
+        Constructs a work unit; units are created by `WorkQueue.claim`.
+        """
+        self.id = id
+        self.search = search
+        self.start = start
+        self.end = end
+        self.attempts = attempts
+        self.cursor = cursor
+
+    def __repr__(self) -> str:
+        return "arxiv.WorkUnit(id={}, search={}, start={}, end={}, attempts={})".format(
+            repr(self.id), repr(self.search), repr(self.start), repr(self.end), repr(self.attempts)
+        )
+
+    def _range_search(self) -> Search:
+        """The unit's search, capped to end at the unit's last result."""
+        from . import Search
+
+        data = self.search._to_dict()
+        if self.end is not None:
+            data["max_results"] = self.end
+        return Search._from_dict(data)
+
+
+class WorkQueue:
+    """
+    A queue of work units persisted in a SQLite database file, shared by every
+    coordinator and worker pointing at the same `path`.
+
+    Processes on other hosts can share the queue if the file lives on a
+    filesystem with working locks; pair it with a rate limiter shared the same
+    way (e.g. a `SQLiteRateLimiter` on the same filesystem) so the workers
+    together respect the API's rate limit.
+
+    ```python
+    queue = arxiv.WorkQueue("harvest.db")
+    queue.add_shards(arxiv.ShardPlanner(client).plan(search))  # coordinator
+    arxiv.Worker(queue, client).run(lambda unit, result: store(result))  # each worker
+    ```
+    """
+
+    path: Path
+    """The SQLite database file holding the queue."""
+    lease_duration: timedelta
+    """
+    How long a claim lasts without a heartbeat. Workers renew their lease after
+    every page, so this must comfortably exceed the time to fetch and handle
+    one page.
+    """
+    max_attempts: int | None
+    """
+    Number of claims after which an unfinished unit is marked failed rather
+    than claimed again; `None` for no limit.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        lease_duration: timedelta = timedelta(minutes=10),
+        max_attempts: int | None = 5,
+        timeout: float = 60.0,
+    ):
+        """
+        Constructs a work queue backed by the SQLite database at `path`,
+        creating it if necessary.
+        """
+        self.path = Path(path)
+        self.lease_duration = lease_duration
+        self.max_attempts = max_attempts
+        self._db = Database(self.path, timeout)
+        self._db.connection().execute(
+            "CREATE TABLE IF NOT EXISTS work_units ("
+            "id INTEGER PRIMARY KEY, search TEXT, start INTEGER, end INTEGER, "
+            "status TEXT, worker TEXT, lease_expires_at REAL, attempts INTEGER, cursor TEXT)"
+        )
+
+    def __repr__(self) -> str:
+        return "arxiv.WorkQueue({}, lease_duration={}, max_attempts={})".format(
+            repr(str(self.path)), repr(self.lease_duration), repr(self.max_attempts)
+        )
+
+    def add(self, search: Search, start: int = 0, end: int | None = None) -> int:
+        """
+        Adds a unit covering `search`'s results at offsets `[start, end)`, and
+        returns its ID.
+        """
+        with self._db.transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO work_units (search, start, end, status, attempts) "
+                "VALUES (?, ?, ?, ?, 0)",
+                (json.dumps(search._to_dict()), start, end, _PENDING),
+            )
+        assert cur.lastrowid is not None
+        return cur.lastrowid
+
+    def add_ranges(self, search: Search, total_results: int, unit_size: int) -> list[int]:
+        """
+        Splits the first `total_results` of `search`'s results into units of
+        `unit_size` results each, and returns their IDs. `unit_size` should be
+        a multiple of the workers' page size.
+        """
+        return [
+            self.add(search, start, min(start + unit_size, total_results))
+            for start in range(0, total_results, unit_size)
+        ]
+
+    def add_shards(self, shards: Iterable[Shard]) -> list[int]:
+        """Adds a unit per shard planned by a `ShardPlanner`, and returns their IDs."""
+        return [self.add(shard.search) for shard in shards]
+
+    def claim(self, worker: str) -> WorkUnit | None:
+        """
+        Leases the oldest pending unit (or unit with an expired lease) to
+        `worker`, or returns `None` if no unit is available.
+        """
+        now = time.time()
+        with self._db.transaction() as conn:
+            while True:
+                row = conn.execute(
+                    "SELECT id, search, start, end, attempts, cursor FROM work_units "
+                    "WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (_PENDING, _LEASED, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                id, search, start, end, attempts, cursor = row
+                if self.max_attempts is not None and attempts >= self.max_attempts:
+                    logger.warning("Work unit %d failed after %d attempts", id, attempts)
+                    conn.execute("UPDATE work_units SET status = ? WHERE id = ?", (_FAILED, id))
+                    continue
+                conn.execute(
+                    "UPDATE work_units SET status = ?, worker = ?, lease_expires_at = ?, "
+                    "attempts = ? WHERE id = ?",
+                    (_LEASED, worker, now + self.lease_duration.total_seconds(), attempts + 1, id),
+                )
+                break
+        from . import Search
+
+        return WorkUnit(
+            id,
+            Search._from_dict(json.loads(search)),
+            start,
+            end,
+            attempts + 1,
+            Cursor.from_dict(json.loads(cursor)) if cursor else None,
+        )
+
+    def heartbeat(self, unit: WorkUnit, worker: str, cursor: Cursor | None = None) -> bool:
+        """
+        Renews `worker`'s lease on `unit`, recording `cursor` as its latest
+        checkpoint if given. Returns `False` if the lease was already lost.
+        """
+        return self._update_lease(
+            unit,
+            worker,
+            "lease_expires_at = ?, cursor = COALESCE(?, cursor)",
+            (
+                time.time() + self.lease_duration.total_seconds(),
+                json.dumps(cursor.to_dict()) if cursor else None,
+            ),
+        )
+
+    def complete(self, unit: WorkUnit, worker: str) -> bool:
+        """
+        Marks `unit` done. Returns `False` if `worker`'s lease was already lost,
+        in which case the unit stays claimable.
+        """
+        return self._update_lease(unit, worker, "status = ?", (_DONE,))
+
+    def release(self, unit: WorkUnit, worker: str) -> bool:
+        """
+        Gives up `worker`'s lease on `unit` so another worker can claim it
+        straight away, keeping its checkpoint. Returns `False` if the lease was
+        already lost.
+        """
+        return self._update_lease(unit, worker, "status = ?, worker = NULL", (_PENDING,))
+
+    def counts(self) -> dict[str, int]:
+        """Returns the number of units by status: pending, leased, done and failed."""
+        rows = self._db.connection().execute(
+            "SELECT status, COUNT(*) FROM work_units GROUP BY status"
+        )
+        counts = dict.fromkeys((_PENDING, _LEASED, _DONE, _FAILED), 0)
+        counts.update(rows)
+        return counts
+
+    def unfinished(self) -> int:
+        """Returns the number of units not yet done or failed."""
+        counts = self.counts()
+        return counts[_PENDING] + counts[_LEASED]
+
+    def _update_lease(self, unit: WorkUnit, worker: str, assignments: str, args: tuple) -> bool:
+        with self._db.transaction() as conn:
+            cur = conn.execute(
+                "UPDATE work_units SET {} WHERE id = ? AND status = ? AND worker = ? "
+                "AND lease_expires_at >= ?".format(assignments),
+                (*args, unit.id, _LEASED, worker, time.time()),
+            )
+        if cur.rowcount == 0:
+            logger.warning("Worker %s lost its lease on work unit %d", worker, unit.id)
+        return cur.rowcount > 0
+
+
+class Worker:
+    """
+    Claims units from a `WorkQueue` and fetches their results with a `Client`.
+
+    Results are passed to a handler as they arrive. After each completed page
+    the worker renews its lease and checkpoints its position, so a unit
+    reclaimed after a crash resumes from its last completed page.
+    """
+
+    queue: WorkQueue
+    """The queue to claim units from."""
+    client: Client
+    """The client used to fetch units' results."""
+    name: str
+    """Identifies this worker's leases; unique per worker."""
+    poll_interval: float
+    """Seconds to wait before polling again when every unfinished unit is leased."""
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        client: Client,
+        name: str | None = None,
+        poll_interval: float = 30.0,
+    ):
+        """
+        Constructs a worker; `name` defaults to one unique to this host,
+        process and thread.
+        """
+        self.queue = queue
+        self.client = client
+        self.name = name or "{}-{}-{}".format(
+            socket.gethostname(), os.getpid(), threading.get_ident()
+        )
+        self.poll_interval = poll_interval
+
+    def __repr__(self) -> str:
+        return "arxiv.Worker({}, name={})".format(repr(self.queue), repr(self.name))
+
+    def run(self, handle: Callable[[WorkUnit, Result], None]) -> int:
+        """
+        Works through units until none are unfinished, passing each result to
+        `handle`, and returns the number of units this worker completed.
+
+        If fetching or handling a unit raises, the unit is released for
+        another attempt and the exception propagates.
+        """
+        completed = 0
+        while True:
+            unit = self.queue.claim(self.name)
+            if unit is None:
+                if not self.queue.unfinished():
+                    return completed
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                self.work(unit, handle)
+            except LeaseLostError:
+                continue
+            except BaseException:
+                self.queue.release(unit, self.name)
+                raise
+            if self.queue.complete(unit, self.name):
+                completed += 1
+
+    def work(self, unit: WorkUnit, handle: Callable[[WorkUnit, Result], None]) -> None:
+        """
+        Fetches `unit`'s results, passing each to `handle`, from its last
+        checkpoint if it has one. Raises `LeaseLostError` if the lease expires.
+        """
+
+        def checkpoint(cursor: Cursor) -> None:
+            if not self.queue.heartbeat(unit, self.name, cursor):
+                raise LeaseLostError("Lost lease on work unit {}".format(unit.id))
+
+        search = unit._range_search()
+        if unit.cursor is not None:
+            logger.info("Resuming work unit %d from offset %d", unit.id, unit.cursor.offset)
+            results = self.client.results(search, resume_from=unit.cursor, on_checkpoint=checkpoint)
+        else:
+            results = self.client.results(search, offset=unit.start, on_checkpoint=checkpoint)
+        for result in results:
+            handle(unit, result)
@@ -0,0 +1,126 @@
+"""Request rate limiters shared by `arxiv.Client` instances.
+
+A `Client` asks its rate limiter to reserve a request slot before every API
+request, then sleeps until that slot arrives. Slots are spaced at least
+`Client.delay_seconds` apart. Where the limiter keeps its state determines
+which clients share a budget:
+
++ `InMemoryRateLimiter` (the default) is shared by the threads of one process.
++ `SQLiteRateLimiter` persists the last reserved slot in a SQLite database, so
+  every process on a machine pointing at the same file shares one budget.
+
+Other backends (e.g. a Redis- or HTTP-backed limiter shared between hosts)
+only need to implement `RateLimiter.reserve`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter(ABC):
+    """
+    Abstract base class for strategies that space out API requests.
+
+    Subclasses implement `reserve`. Implementations must be safe to call from
+    several threads at once.
+    """
+
+    @abstractmethod
+    def reserve(self, interval: float) -> float:
+        """
+        Reserves the next request slot, at least `interval` seconds after the
+        previously reserved slot, and returns the number of seconds until that
+        slot arrives (zero if the caller may request immediately).
+
+        The caller is responsible for sleeping; a reservation can't be returned.
+        """
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """
+    A rate limiter whose state lives in this process.
+
+    Slots are handed out under a lock using a monotonic clock, so threads
+    sharing the limiter never fire requests together and wall-clock
+    adjustments can't shorten or stretch the delay.
+    """
+
+    _last_request_at: float | None
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self._last_request_at = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "arxiv.InMemoryRateLimiter()"
+
+    def reserve(self, interval: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if self._last_request_at is not None:
+                slot = max(now, self._last_request_at + interval)
+            self._last_request_at = slot
+        return slot - now
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    A rate limiter whose state is persisted in a SQLite database file.
+
+    Every process using the same `path` and `key` shares one request budget.
+    Each reservation runs in an exclusive (`BEGIN IMMEDIATE`) transaction, so
+    concurrent processes serialize on the database lock rather than racing.
+    Because the last reserved slot is persisted, a short-lived process neither
+    fires early (ignoring a request a previous process just made) nor sleeps
+    unnecessarily (assuming no time has passed since its own last request).
+
+    Uses the wall clock (`time.time`), since monotonic clocks aren't comparable
+    between processes.
+    """
+
+    path: Path
+    """The SQLite database file holding limiter state."""
+    key: str
+    """Identifies the budget within the database; limiters sharing a key share a budget."""
+
+    def __init__(self, path: str | Path, key: str = "export.arxiv.org", timeout: float = 60.0):
+        """
+        Constructs a rate limiter backed by the SQLite database at `path`,
+        creating it if necessary.
+
+        `timeout` is the number of seconds to wait for another process to
+        release the database lock.
+        """
+        from ._sqlite import Database
+
+        self.path = Path(path)
+        self.key = key
+        self._db = Database(self.path, timeout)
+        self._db.connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit (key TEXT PRIMARY KEY, last_request_at REAL)"
+        )
+
+    def __repr__(self) -> str:
+        return "arxiv.SQLiteRateLimiter({}, key={})".format(repr(str(self.path)), repr(self.key))
+
+    def reserve(self, interval: float) -> float:
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT last_request_at FROM rate_limit WHERE key = ?", (self.key,)
+            ).fetchone()
+            now = time.time()
+            slot = now if row is None else max(now, row[0] + interval)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit (key, last_request_at) VALUES (?, ?)",
+                (self.key, slot),
+            )
+        return slot - now
@@ -0,0 +1,152 @@
+"""A set of results indexed by arXiv ID and version.
+
+`Result` is hashable on its `entry_id`, so results can go in plain sets and
+dict keys. `ResultSet` adds lookups by arXiv ID: by exact short ID (e.g.
+`2107.05580v1`), or by base ID (e.g. `2107.05580`) for a result's latest
+version. Merging and deduplicating the results of overlapping searches with
+it takes time linear in the number of results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, MutableSet
+from typing import TYPE_CHECKING
+
+from ._arxivid import ArxivId
+
+if TYPE_CHECKING:
+    from . import Result
+
+
+class ResultSet(MutableSet["Result"]):
+    """
+    A set of `Result`s, unique by `entry_id`, that also indexes them by arXiv
+    ID. Iteration follows insertion order. Adding a result whose `entry_id`
+    is already present keeps the existing result.
+
+    Supports the usual set operators (`|`, `&`, `-`, `^`, comparisons) with
+    any set of results; `union` and `difference` also accept any iterables of
+    results, such as `Client.results` streams.
+
+    ```python
+    seen = arxiv.ResultSet(client.results(search_a))
+    new = arxiv.ResultSet(client.results(search_b)) - seen
+    latest = seen.get("2107.05580")
+    ```
+    """
+
+    def __init__(self, results: Iterable[Result] = ()):
+        """
+        Constructs a set of the specified results.
+        """
+        self._by_entry_id: dict[str, Result] = {}
+        # Base ID -> version (0 if none) -> the results with that ID, in
+        # insertion order. Results with different `entry_id`s can share an ID
+        # (e.g. `arxiv.org` and `export.arxiv.org` URLs).
+        self._versions: dict[str, dict[int, list[Result]]] = {}
+        for result in results:
+            self.add(result)
+
+    def __repr__(self) -> str:
+        return "arxiv.ResultSet(<{} results>)".format(len(self))
+
+    def __len__(self) -> int:
+        return len(self._by_entry_id)
+
+    def __iter__(self) -> Iterator[Result]:
+        return iter(self._by_entry_id.values())
+
+    def __contains__(self, result: object) -> bool:
+        entry_id = getattr(result, "entry_id", None)
+        return isinstance(entry_id, str) and entry_id in self._by_entry_id
+
+    def add(self, result: Result) -> None:
+        """
+        Adds `result`, unless a result with its `entry_id` is present. A
+        result whose `entry_id` isn't an arXiv URL is added, but can't be
+        looked up by ID.
+        """
+        if result.entry_id in self._by_entry_id:
+            return
+        self._by_entry_id[result.entry_id] = result
+        id = _arxiv_id(result)
+        if id is not None:
+            self._versions.setdefault(id.base_id, {}).setdefault(id.version or 0, []).append(result)
+
+    def discard(self, result: Result) -> None:
+        """Removes the result with `result`'s `entry_id`, if present."""
+        if self._by_entry_id.pop(result.entry_id, None) is None:
+            return
+        id = _arxiv_id(result)
+        if id is None:
+            return
+        versions = self._versions[id.base_id]
+        same_id = versions[id.version or 0]
+        same_id[:] = [r for r in same_id if r.entry_id != result.entry_id]
+        if not same_id:
+            del versions[id.version or 0]
+        if not versions:
+            del self._versions[id.base_id]
+
+    def get(self, id: str) -> Result | None:
+        """
+        Returns the result with short ID `id` if it has a version (e.g.
+        `2107.05580v1`); otherwise, the latest version present of the result
+        with base ID `id` (e.g. `2107.05580`). Returns `None` if there's no
+        such result. `id` may be written in any form `ArxivId` accepts. Of
+        several results with the same ID, returns the first added.
+        """
+        try:
+            parsed = ArxivId.parse(id)
+        except ValueError:
+            return None
+        versions = self._versions.get(parsed.base_id)
+        if not versions:
+            return None
+        if parsed.version is not None:
+            same_id = versions.get(parsed.version)
+            return same_id[0] if same_id else None
+        return versions[max(versions)][0]
+
+    def versions(self, base_id: str) -> list[Result]:
+        """Returns every version present of the result with `base_id`, oldest first."""
+        try:
+            versions = self._versions.get(ArxivId.parse(base_id).base_id, {})
+        except ValueError:
+            return []
+        return [versions[v][0] for v in sorted(versions)]
+
+    def latest(self) -> ResultSet:
+        """
+        Returns a set holding only the latest version present of each result,
+        and any results that can't be looked up by ID.
+        """
+        latest = ResultSet(versions[max(versions)][0] for versions in self._versions.values())
+        for result in self:
+            if _arxiv_id(result) is None:
+                latest.add(result)
+        return latest
+
+    def union(self, *others: Iterable[Result]) -> ResultSet:
+        """Returns a new set of the results in this set or any of `others`."""
+        union = ResultSet(self)
+        for other in others:
+            for result in other:
+                union.add(result)
+        return union
+
+    def difference(self, *others: Iterable[Result]) -> ResultSet:
+        """Returns a new set of the results in this set but none of `others`."""
+        difference = ResultSet(self)
+        for other in others:
+            for result in other:
+                difference.discard(result)
+        return difference
+
+
+def _arxiv_id(result: Result) -> ArxivId | None:
+    """Returns `result`'s parsed ID, or `None` if its `entry_id` isn't an arXiv URL."""
+    try:
+        return result.arxiv_id
+    except ValueError:
+        return None
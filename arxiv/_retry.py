@@ -0,0 +1,153 @@
+"""Retry policies deciding whether, and when, to retry failed API requests."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Decides whether a client retries a failed page request, and how long it
+    waits first. The number of retries is capped by the client's
+    `num_retries`.
+
+    A retry always waits for the client's rate limit. The default policy waits
+    no longer than that, matching the behavior of earlier versions; set
+    `backoff` to back off exponentially from an overloaded API:
+
+    ```python
+    policy = arxiv.RetryPolicy(backoff=3.0, jitter=0.5, max_elapsed=300)
+    client = arxiv.Client(num_retries=6, retry_policy=policy)
+    ```
+
+    Subclass and override `wait_before_retry` for custom rules.
+    """
+
+    backoff: float
+    """
+    Seconds to wait before the first retry, in addition to the rate limit.
+    Each later retry waits `backoff_factor` times longer, up to `max_backoff`.
+    """
+    backoff_factor: float
+    """Multiplier applied to the backoff after each retry."""
+    max_backoff: float
+    """Cap on the backoff before any one retry, before jitter."""
+    jitter: float
+    """
+    Fraction of each backoff to randomize: a backoff `b` becomes a uniformly
+    random wait in `[b * (1 - jitter), b]`, so concurrent clients spread out.
+    """
+    max_elapsed: float | None
+    """
+    Time budget in seconds for all tries of one page. A retry that would start
+    after the budget is spent isn't attempted. `None` for no budget.
+    """
+    respect_retry_after: bool
+    """
+    Whether to wait at least as long as a `Retry-After` header on an HTTP error
+    response (typically a 429 or 503) asks.
+    """
+    retry_statuses: frozenset[int] | None
+    """HTTP statuses worth retrying; `None` to retry every error status."""
+    retry_empty_pages: bool
+    """Whether to retry an `UnexpectedEmptyPageError`."""
+    retry_connection_errors: bool
+    """Whether to retry connection errors."""
+
+    def __init__(
+        self,
+        backoff: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 120.0,
+        jitter: float = 0.0,
+        max_elapsed: float | None = None,
+        respect_retry_after: bool = True,
+        retry_statuses: frozenset[int] | set[int] | None = None,
+        retry_empty_pages: bool = True,
+        retry_connection_errors: bool = True,
+    ):
+        """
+        Constructs a retry policy with the specified rules.
+        """
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = None if retry_statuses is None else frozenset(retry_statuses)
+        self.retry_empty_pages = retry_empty_pages
+        self.retry_connection_errors = retry_connection_errors
+
+    def __repr__(self) -> str:
+        return (
+            "arxiv.RetryPolicy(backoff={}, backoff_factor={}, max_backoff={}, jitter={}, "
+            "max_elapsed={}, respect_retry_after={}, retry_statuses={}, "
+            "retry_empty_pages={}, retry_connection_errors={})"
+        ).format(
+            repr(self.backoff),
+            repr(self.backoff_factor),
+            repr(self.max_backoff),
+            repr(self.jitter),
+            repr(self.max_elapsed),
+            repr(self.respect_retry_after),
+            repr(self.retry_statuses),
+            repr(self.retry_empty_pages),
+            repr(self.retry_connection_errors),
+        )
+
+    def wait_before_retry(self, err: Exception, try_index: int, elapsed: float) -> float | None:
+        """
+        Returns the number of seconds to wait (on top of the rate limit) before
+        retrying after `err`, or `None` if the request shouldn't be retried.
+
+        `try_index` is the index of the failed try (0 for the initial try), and
+        `elapsed` is the number of seconds since the initial try started.
+        """
+        from . import HTTPError, UnexpectedEmptyPageError
+
+        retry_after = None
+        if isinstance(err, HTTPError):
+            if self.retry_statuses is not None and err.status not in self.retry_statuses:
+                return None
+            retry_after = err.retry_after if self.respect_retry_after else None
+        elif isinstance(err, UnexpectedEmptyPageError):
+            if not self.retry_empty_pages:
+                return None
+        elif not self.retry_connection_errors:
+            return None
+
+        wait = 0.0
+        if self.backoff > 0:
+            try:
+                wait = min(self.backoff * self.backoff_factor**try_index, self.max_backoff)
+            except OverflowError:
+                wait = self.max_backoff
+        if self.jitter:
+            wait -= random.uniform(0, wait * self.jitter)
+        if retry_after is not None:
+            wait = max(wait, retry_after)
+        if self.max_elapsed is not None and elapsed + wait > self.max_elapsed:
+            return None
+        return wait
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a `Retry-After` header, which is either a number of seconds or an
+    HTTP date, into a number of seconds from now.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
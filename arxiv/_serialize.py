@@ -0,0 +1,165 @@
+"""Streaming serialization of results to JSON Lines or msgpack files.
+
+`ResultWriter` appends each result's `Result.to_dict` to a file as it's
+written, and `ResultReader` yields results back one at a time, so exports
+and imports of any size run in bounded memory. Paths ending in `.gz` are
+gzip-compressed.
+
+JSON Lines files hold one JSON object per line. msgpack files hold a
+sequence of msgpack maps; they're smaller and faster to read and write, but
+need the optional `msgpack` dependency (`pip install arxiv[msgpack]`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import Result
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = ("jsonl", "msgpack")
+
+
+def _format(path: Path, format: str | None) -> str:
+    """Validates `format`, or infers it from `path`'s suffixes."""
+    if format is None:
+        format = "msgpack" if ".msgpack" in path.suffixes else "jsonl"
+    if format not in _FORMATS:
+        raise ValueError("Unknown format {!r}; expected one of {}".format(format, _FORMATS))
+    return format
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    return open(path, mode)
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as err:
+        raise ImportError(
+            "The msgpack format requires msgpack; install it with `pip install arxiv[msgpack]`"
+        ) from err
+    return msgpack
+
+
+class ResultWriter:
+    """
+    Writes results to a JSON Lines or msgpack file as they arrive.
+
+    ```python
+    with arxiv.ResultWriter("results.jsonl.gz") as writer:
+        writer.write_all(client.results(search))
+    ```
+    """
+
+    path: Path
+    """The file being written."""
+    format: str
+    """`"jsonl"` or `"msgpack"`."""
+    count: int
+    """Number of results written so far."""
+
+    def __init__(self, path: str | Path, format: str | None = None, append: bool = False):
+        """
+        Constructs a writer creating (or replacing, unless `append`) the file
+        at `path`. `format` defaults to `"msgpack"` if `path` has a
+        `.msgpack` suffix, and to `"jsonl"` otherwise.
+        """
+        self.path = Path(path)
+        self.format = _format(self.path, format)
+        self.count = 0
+        self._packer = _msgpack().Packer() if self.format == "msgpack" else None
+        self._file = _open(self.path, "ab" if append else "wb")
+
+    def __repr__(self) -> str:
+        return "arxiv.ResultWriter({}, format={}, count={})".format(
+            repr(str(self.path)), repr(self.format), repr(self.count)
+        )
+
+    def __enter__(self) -> ResultWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, result: Result) -> None:
+        """Appends `result` to the file."""
+        if self._packer is not None:
+            self._file.write(self._packer.pack(result.to_dict()))
+        else:
+            line = json.dumps(result.to_dict(), ensure_ascii=False, separators=(",", ":"))
+            self._file.write(line.encode("utf-8") + b"\n")
+        self.count += 1
+
+    def write_all(self, results: Iterable[Result]) -> int:
+        """Appends every result, and returns the number of results written."""
+        written = 0
+        for result in results:
+            self.write(result)
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Flushes and closes the file; the writer can't be used afterwards."""
+        self._file.close()
+        logger.info("Wrote %d results to %s", self.count, self.path)
+
+
+class ResultReader:
+    """
+    Reads results from a file written by `ResultWriter`, one at a time.
+
+    ```python
+    with arxiv.ResultReader("results.jsonl.gz") as reader:
+        for result in reader:
+            ...
+    ```
+    """
+
+    path: Path
+    """The file being read."""
+    format: str
+    """`"jsonl"` or `"msgpack"`."""
+
+    def __init__(self, path: str | Path, format: str | None = None):
+        """
+        Constructs a reader of the file at `path`, inferring `format` from its
+        suffixes like `ResultWriter`.
+        """
+        self.path = Path(path)
+        self.format = _format(self.path, format)
+        self._msgpack = _msgpack() if self.format == "msgpack" else None
+        self._file = _open(self.path, "rb")
+
+    def __repr__(self) -> str:
+        return "arxiv.ResultReader({}, format={})".format(repr(str(self.path)), repr(self.format))
+
+    def __enter__(self) -> ResultReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Result]:
+        from . import Result
+
+        if self._msgpack is not None:
+            records: Iterable[Any] = self._msgpack.Unpacker(self._file, raw=False)
+        else:
+            records = (json.loads(line) for line in self._file if line.strip())
+        for record in records:
+            yield Result.from_dict(record)
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
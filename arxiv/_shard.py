@@ -0,0 +1,253 @@
+"""Date-window sharding for harvests beyond the API's per-query limits.
+
+The API serves at most 300,000 results per query, and deep offsets are slow
+and error-prone. `ShardPlanner` splits a broad search into `submittedDate`
+windows, each small enough to page through comfortably, and streams their
+union.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from ._feed import FeedHeader, ParsedFeed
+
+if TYPE_CHECKING:
+    from . import Client, Result, Search
+
+logger = logging.getLogger(__name__)
+
+_MINUTE = timedelta(minutes=1)
+_DATE_FORMAT = "%Y%m%d%H%M"
+
+_ARXIV_EPOCH = datetime(1991, 8, 1, tzinfo=timezone.utc)
+"""arXiv's first submissions were made in August 1991."""
+
+
+def _floor_minute(dt: datetime) -> datetime:
+    """Truncates `dt` to the minute in UTC, treating naive datetimes as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).replace(second=0, microsecond=0)
+
+
+class Shard:
+    """
+    One `submittedDate` window of a sharded search.
+    """
+
+    search: Search
+    """The search restricted to this window."""
+    start: datetime
+    """The window's inclusive start."""
+    end: datetime
+    """The window's exclusive end."""
+    total_results: int
+    """The number of results the API reported for this window when planning."""
+
+    def __init__(self, search: Search, start: datetime, end: datetime, total_results: int):
+        """
+        Constructs a shard of `total_results` results submitted in `[start, end)`.
+        """
+        self.search = search
+        self.start = start
+        self.end = end
+        self.total_results = total_results
+
+    def __repr__(self) -> str:
+        return "arxiv.Shard(start={}, end={}, total_results={})".format(
+            repr(self.start), repr(self.end), repr(self.total_results)
+        )
+
+
+class ShardPlanner:
+    """
+    Splits a broad search into `submittedDate` windows of at most
+    `target_size` results each, then streams the union of their results.
+
+    Planning starts from a single window covering `start` to `end`. Each
+    window's size is read from the `opensearch:totalResults` of a one-result
+    request; windows larger than `target_size` are halved until they fit (or
+    span a single minute, the API's date resolution). Planning a window costs
+    one rate-limited request.
+
+    The API sporadically serves an empty page reporting zero results. So if a
+    window's halves don't add up to the window, a half counted as empty is
+    re-queried, retried like an `UnexpectedEmptyPageError`; if they still
+    fall short, the planner logs a warning. Likewise, a shard whose first
+    page comes back empty is retried rather than skipped.
+
+    ```python
+    planner = arxiv.ShardPlanner(client, target_size=10_000)
+    for result in planner.results(arxiv.Search(query="cat:hep-th", max_results=None)):
+        ...
+    ```
+    """
+
+    client: Client
+    """The client used to plan and fetch shards."""
+    target_size: int
+    """Maximum number of results per shard."""
+    start: datetime
+    """Inclusive start of the harvested date range."""
+    end: datetime | None
+    """Exclusive end of the harvested date range; `None` for the present."""
+
+    def __init__(
+        self,
+        client: Client,
+        target_size: int = 10_000,
+        start: datetime = _ARXIV_EPOCH,
+        end: datetime | None = None,
+    ):
+        """
+        Constructs a planner sharding searches over `[start, end)`.
+        """
+        self.client = client
+        self.target_size = target_size
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return "arxiv.ShardPlanner(target_size={}, start={}, end={})".format(
+            repr(self.target_size), repr(self.start), repr(self.end)
+        )
+
+    def plan(self, search: Search) -> list[Shard]:
+        """
+        Returns non-empty, non-overlapping shards covering `search`'s results
+        within this planner's date range, in chronological order.
+        """
+        if not search.query:
+            raise ValueError("Only searches with a query can be sharded")
+        start = _floor_minute(self.start)
+        end = _floor_minute(self.end or datetime.now(timezone.utc)) + _MINUTE
+        root = self._window_search(search, start, end)
+        shards: list[Shard] = []
+        # Depth-first, earliest window first, so shards come out in order. The
+        # whole range has no parent to check its count against.
+        pending = [(start, end, root, self._count(root, retry_empty=True))]
+        while pending:
+            window_start, window_end, shard_search, total = pending.pop()
+            logger.info("Window %s to %s has %d results", window_start, window_end, total)
+            if total == 0:
+                continue
+            if total > self.target_size and window_end - window_start > _MINUTE:
+                middle = window_start + (window_end - window_start) / 2
+                middle = max(_floor_minute(middle), window_start + _MINUTE)
+                halves = [
+                    self._window_search(search, window_start, middle),
+                    self._window_search(search, middle, window_end),
+                ]
+                counts = [self._count(half) for half in halves]
+                if sum(counts) < total:
+                    counts = [
+                        count or self._count(half, retry_empty=True)
+                        for half, count in zip(halves, counts)
+                    ]
+                if sum(counts) < total:
+                    logger.warning(
+                        "Window %s to %s has %d results, but its halves only %d; "
+                        "results may be missing",
+                        window_start,
+                        window_end,
+                        total,
+                        sum(counts),
+                    )
+                pending.append((middle, window_end, halves[1], counts[1]))
+                pending.append((window_start, middle, halves[0], counts[0]))
+                continue
+            if total > self.target_size:
+                logger.warning("Shard %s has %d results; can't split further", window_start, total)
+            shards.append(Shard(shard_search, window_start, window_end, total))
+        return shards
+
+    def results(self, search: Search, shards: list[Shard] | None = None) -> Iterator[Result]:
+        """
+        Streams the union of `search`'s shards (planning them first unless
+        `shards` is given), in chronological shard order, until
+        `search.max_results` results have been yielded. Within each shard,
+        results follow `search`'s sort order.
+        """
+        if shards is None:
+            shards = self.plan(search)
+        results = self._dedupe(self._shard_results(shard) for shard in shards)
+        return itertools.islice(results, search.max_results or None)
+
+    def _shard_results(self, shard: Shard) -> Iterator[Result]:
+        """
+        Streams `shard`'s results. The client ends a search at an empty first
+        page, but a shard planned as non-empty shouldn't have one, so it's
+        retried like an `UnexpectedEmptyPageError`.
+        """
+        from . import UnexpectedEmptyPageError
+
+        try_index = 0
+        started = time.monotonic()
+        while True:
+            results = self.client.results(shard.search)
+            first = next(results, None)
+            if first is not None or not shard.total_results:
+                break
+            url = self.client._format_url(shard.search, 0, self.client.page_size)
+            err = UnexpectedEmptyPageError(url, try_index, ParsedFeed(FeedHeader()))
+            if not self.client._before_retry(err, try_index, started, url):
+                raise err
+            try_index += 1
+        if first is not None:
+            yield first
+            yield from results
+
+    @staticmethod
+    def _dedupe(shards: Iterable[Iterator[Result]]) -> Iterator[Result]:
+        # Windows don't overlap, but a result revised mid-harvest may turn up
+        # in the next window too. Remembering only the previous shard's IDs
+        # bounds memory by the shard size, however long the harvest.
+        previous: set[str] = set()
+        for results in shards:
+            current: set[str] = set()
+            for result in results:
+                if result.entry_id not in previous and result.entry_id not in current:
+                    current.add(result.entry_id)
+                    yield result
+            previous = current
+
+    def _count(self, search: Search, retry_empty: bool = False) -> int:
+        """
+        Returns the number of results the API reports for `search`. If
+        `retry_empty`, a zero count is suspected to be a sporadic empty page,
+        and is re-queried as the client retries an `UnexpectedEmptyPageError`.
+        """
+        from . import UnexpectedEmptyPageError
+
+        url = self.client._format_url(search, 0, 1)
+        try:
+            feed = self.client._parse_feed(url, first_page=not retry_empty)
+        except UnexpectedEmptyPageError:
+            return 0
+        return feed.header.total_results
+
+    @staticmethod
+    def _window_search(search: Search, start: datetime, end: datetime) -> Search:
+        """
+        Restricts `search` to results submitted in `[start, end)`. The API's
+        date ranges are inclusive, so the window ends a minute before `end`.
+        """
+        from . import Search
+
+        last = end - _MINUTE
+        query = "({}) AND submittedDate:[{} TO {}]".format(
+            search.query, start.strftime(_DATE_FORMAT), last.strftime(_DATE_FORMAT)
+        )
+        return Search(
+            query=query,
+            id_list=search.id_list,
+            max_results=None,
+            sort_by=search.sort_by,
+            sort_order=search.sort_order,
+        )
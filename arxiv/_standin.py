@@ -0,0 +1,311 @@
+"""A local stand-in for the arXiv query API, serving synthetic feeds.
+
+`StandInServer` runs an HTTP server on a background thread that answers
+`/api/query` requests like `export.arxiv.org` does, from a deterministic
+synthetic corpus of any size. Point a client's `query_url_format` at it for
+reproducible load, pagination and retry tests without touching the real
+service:
+
+```python
+with arxiv.StandInServer(total_results=50_000, error_rate=0.1) as server:
+    client = arxiv.Client(page_size=2000, delay_seconds=0)
+    client.query_url_format = server.query_url_format
+    results = list(client.results(arxiv.Search(query="cat:cs.LG", max_results=None)))
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_SPACING = timedelta(minutes=10)
+"""Time between successive synthetic submissions."""
+_MAX_PAGE_SIZE = 2000
+
+_CATEGORIES = ("cs.LG", "hep-th", "math.CO", "quant-ph", "astro-ph.GA", "cond-mat.str-el")
+_WORDS = (
+    "quantum learning graph field theory model network dynamics stochastic lattice "
+    "spectral neural inference topological galaxy boundary optimal random entropy"
+).split()
+
+_DATE_RANGE = re.compile(r"submittedDate:\[(\d{8}|\d{12}|\d{14}) TO (\d{8}|\d{12}|\d{14})\]")
+_CATEGORY = re.compile(r"\bcat:([\w.-]+)")
+_ID = re.compile(r"^(\d{4})\.(\d{4,5})(v\d+)?$")
+
+_FEED_HEADER = """<?xml version='1.0' encoding='UTF-8'?>
+<feed xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" \
+xmlns:arxiv="http://arxiv.org/schemas/atom" xmlns="http://www.w3.org/2005/Atom">
+  <id>https://arxiv.org/api/standin</id>
+  <title>arXiv Query: {query}</title>
+  <updated>{now}</updated>
+  <opensearch:itemsPerPage>{items_per_page}</opensearch:itemsPerPage>
+  <opensearch:totalResults>{total_results}</opensearch:totalResults>
+  <opensearch:startIndex>{start}</opensearch:startIndex>
+"""
+
+_ENTRY = """  <entry>
+    <id>http://arxiv.org/abs/{id}v1</id>
+    <title>{title}</title>
+    <updated>{updated}</updated>
+    <link href="https://arxiv.org/abs/{id}v1" rel="alternate" type="text/html"/>
+    <link href="https://arxiv.org/pdf/{id}v1" rel="related" type="application/pdf" title="pdf"/>
+    <summary>{summary}</summary>
+    <category term="{category}" scheme="http://arxiv.org/schemas/atom"/>
+    <published>{published}</published>
+    <arxiv:comment>{pages} pages, {figures} figures</arxiv:comment>
+    <arxiv:primary_category term="{category}"/>
+    <author>
+      <name>Author {a1}</name>
+      <arxiv:affiliation>Institute {a1}</arxiv:affiliation>
+    </author>
+    <author>
+      <name>Author {a2}</name>
+    </author>
+  </entry>
+"""
+
+
+def _timestamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class StandInServer:
+    """
+    A local HTTP server imitating arXiv's query API, serving feeds generated
+    from a synthetic corpus of `total_results` records.
+
+    Record `i` (in relevance order) was submitted `10 * i` minutes after
+    2000-01-01 and updated a day later; primary categories rotate through
+    `cs.LG`, `hep-th`, `math.CO`, `quant-ph`, `astro-ph.GA` and
+    `cond-mat.str-el`. Its ID is a new-style ID numbered within its
+    submission month: `YYMM.NNNN` before 2015, `YYMM.NNNNN` from then on.
+
+    Requests honor `id_list`, `start`, `max_results` (capped at 2000 like the
+    real API), `sortBy` and `sortOrder`. In `search_query`, `cat:` and
+    `submittedDate:[... TO ...]` clauses combined with `AND` filter the corpus;
+    every other term matches every record.
+
+    Failures are injected at random, reproducibly from `seed`: `error_rate` of
+    requests get a 503 response, and `empty_page_rate` get a page with no
+    entries and zero total results, like the real API's sporadic empty pages.
+    """
+
+    total_results: int
+    """Number of records in the synthetic corpus."""
+    latency: float
+    """Seconds to wait before answering each request."""
+    error_rate: float
+    """Fraction of requests answered with a 503 error."""
+    retry_after: int | None
+    """`Retry-After` seconds sent with 503 errors; `None` to omit the header."""
+    empty_page_rate: float
+    """Fraction of requests answered with an empty page."""
+    requests: int
+    """Number of requests received."""
+
+    def __init__(
+        self,
+        total_results: int = 10_000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: int | None = None,
+        empty_page_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Constructs a stand-in server listening on `host` and `port` (any free
+        port by default). Call `start`, or use it as a context manager.
+        """
+        self.total_results = total_results
+        self.latency = latency
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.empty_page_rate = empty_page_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return "arxiv.StandInServer(total_results={}, url={})".format(
+            repr(self.total_results), repr(self.url)
+        )
+
+    def __enter__(self) -> StandInServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """The server's base URL."""
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(str(host), port)
+
+    @property
+    def query_url_format(self) -> str:
+        """A `Client.query_url_format` pointing at this server."""
+        return self.url + "/api/query?{}"
+
+    def start(self) -> None:
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="arxiv-standin", daemon=True
+        )
+        self._thread.start()
+        logger.info("Stand-in API serving at %s", self.url)
+
+    def stop(self) -> None:
+        """Stops serving and closes the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def respond(self, query: dict[str, list[str]]) -> tuple[int, dict[str, str], bytes]:
+        """
+        Returns the status, headers and body answering a request with the
+        parsed query string `query`.
+        """
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+        if self.latency:
+            time.sleep(self.latency)
+        if roll < self.error_rate:
+            headers = {"Content-Type": "text/plain"}
+            if self.retry_after is not None:
+                headers["Retry-After"] = str(self.retry_after)
+            return 503, headers, b"Service Unavailable"
+
+        def arg(name: str, default: str = "") -> str:
+            return query.get(name, [default])[0]
+
+        start = max(int(arg("start", "0") or 0), 0)
+        max_results = min(max(int(arg("max_results", "10") or 0), 0), _MAX_PAGE_SIZE)
+        if roll < self.error_rate + self.empty_page_rate:
+            matches: range | list[int] = range(0)
+        else:
+            matches = self._matches(arg("search_query"), arg("id_list"))
+            # Corpus order is both most relevant first and oldest first.
+            by_relevance = arg("sortBy", "relevance") == "relevance"
+            if by_relevance == (arg("sortOrder", "descending") == "ascending"):
+                matches = matches[::-1]
+        page = matches[start : start + max_results]
+        body = _FEED_HEADER.format(
+            query=escape(arg("search_query")),
+            now=_timestamp(datetime.now(timezone.utc)),
+            items_per_page=max_results,
+            total_results=len(matches),
+            start=start,
+        )
+        body += "".join(self._entry(i) for i in page) + "</feed>\n"
+        return 200, {"Content-Type": "application/atom+xml; charset=utf-8"}, body.encode()
+
+    def _matches(self, search_query: str, id_list: str) -> range | list[int]:
+        """Indices of the records matching the request, in relevance order."""
+        matches = range(self.total_results)
+        for lo, hi in _DATE_RANGE.findall(search_query):
+            first = self._index_at(_parse_date(lo), ceil=True)
+            last = self._index_at(_parse_date(hi), ceil=False)
+            matches = range(max(matches.start, first), min(matches.stop, last + 1))
+        categories = set(_CATEGORY.findall(search_query))
+        if categories:
+            if len(categories) > 1 or not categories <= set(_CATEGORIES):
+                return range(0)
+            k = _CATEGORIES.index(categories.pop())
+            matches = matches[(k - matches.start) % len(_CATEGORIES) :: len(_CATEGORIES)]
+        if not id_list:
+            return matches
+        found = (self._index_of(id) for id in id_list.split(","))
+        return [i for i in found if i is not None and i in matches]
+
+    def _index_at(self, dt: datetime, ceil: bool) -> int:
+        """
+        The index of the first record submitted at or after `dt` if `ceil`,
+        otherwise of the last record submitted at or before it.
+        """
+        steps, rem = divmod(dt - _EPOCH, _SPACING)
+        return int(steps) + (1 if ceil and rem else 0)
+
+    def _index_of(self, id: str) -> int | None:
+        match = _ID.match(id.strip())
+        if match is None:
+            return None
+        yymm, number = match.group(1), int(match.group(2))
+        month = datetime(2000 + int(yymm[:2]), int(yymm[2:]), 1, tzinfo=timezone.utc)
+        if month < _EPOCH or number < 1:
+            return None
+        i = self._index_at(month, ceil=True) + number - 1
+        if i >= self.total_results or self._id(i) != "{}.{}".format(yymm, match.group(2)):
+            return None
+        return i
+
+    def _id(self, i: int) -> str:
+        published = _EPOCH + i * _SPACING
+        month = published.replace(day=1, hour=0, minute=0)
+        number = i - self._index_at(month, ceil=True) + 1
+        width = 5 if published.year >= 2015 else 4
+        return "{:%y%m}.{:0{}d}".format(published, number, width)
+
+    def _entry(self, i: int) -> str:
+        published = _EPOCH + i * _SPACING
+        words = [_WORDS[(i * 7 + k * 3) % len(_WORDS)] for k in range(40)]
+        return _ENTRY.format(
+            id=self._id(i),
+            title=escape("Synthetic {} of {} {}".format(*words[:3]).capitalize()),
+            updated=_timestamp(published + timedelta(days=1)),
+            published=_timestamp(published),
+            summary=escape(" ".join(words) + "."),
+            category=_CATEGORIES[i % len(_CATEGORIES)],
+            pages=5 + i % 40,
+            figures=i % 12,
+            a1=i % 997,
+            a2=(i * 31) % 997,
+        )
+
+
+def _parse_date(text: str) -> datetime:
+    """Parses a `submittedDate` bound: `YYYYMMDD[HHMM[SS]]`."""
+    fmt = {8: "%Y%m%d", 12: "%Y%m%d%H%M", 14: "%Y%m%d%H%M%S"}.get(len(text), "%Y%m%d%H%M")
+    return datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+
+
+def _handler(server: StandInServer) -> Any:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            parts = urlsplit(self.path)
+            if parts.path != "/api/query":
+                self.send_error(404)
+                return
+            status, headers, body = server.respond(parse_qs(parts.query))
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("Stand-in API: " + format, *args)
+
+    return Handler
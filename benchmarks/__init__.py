@@ -0,0 +1,80 @@
+"""Offline benchmarks for the parser and client, driven by the recorded test
+fixtures under `tests/fixtures/`.
+
+Run `make bench` to run every benchmark and compare it to the stored
+`baseline.json`; the run fails if any metric regressed by more than the
+tolerance. Baselines are machine-specific: after an intentional change, or on
+a new machine, regenerate them with `make bench-baseline`.
+
+Benchmarks live in `bench_*.py` modules in this package, registered with the
+`benchmark` decorator. Each returns a dict of `Metric`s.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+BENCHMARKS: dict[str, Callable[[], dict[str, Metric]]] = {}
+"""Registered benchmarks, by name."""
+
+
+@dataclass
+class Metric:
+    """One measurement from a benchmark."""
+
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    def regressed(self, baseline: float, tolerance: float) -> bool:
+        """Whether this metric is worse than `baseline` by more than `tolerance`."""
+        if self.higher_is_better:
+            return self.value < baseline * (1 - tolerance)
+        return self.value > baseline * (1 + tolerance)
+
+
+def benchmark(
+    name: str,
+) -> Callable[[Callable[[], dict[str, Metric]]], Callable[[], dict[str, Metric]]]:
+    """Registers the decorated function as the benchmark `name`."""
+
+    def register(fn: Callable[[], dict[str, Metric]]) -> Callable[[], dict[str, Metric]]:
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+def fixture_bodies(prefix: str = "") -> list[bytes]:
+    """The recorded response bodies whose fixture names start with `prefix`."""
+    bodies = []
+    for path in sorted(FIXTURES_DIR.glob(prefix + "*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["status_code"] == 200:
+            bodies.append(data["body"].encode("latin-1"))
+    return bodies
+
+
+def best_time(fn: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """
+    Returns the fastest of `repeat` timings of `number` calls to `fn`, in
+    seconds per call, after one warm-up call. The fastest run is the least
+    disturbed by other load.
+    """
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
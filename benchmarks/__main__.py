@@ -0,0 +1,98 @@
+"""Runs the benchmarks and compares them to the stored baseline.
+
+Usage: `python -m benchmarks [--update-baseline] [--tolerance T] [NAME ...]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import sys
+from pathlib import Path
+
+from . import BASELINE_PATH, BENCHMARKS, Metric
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="relative slowdown that counts as a regression (default: 0.25)",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="store this run's results as the baseline"
+    )
+    parser.add_argument(
+        "--attempts",
+        type=int,
+        default=3,
+        help="runs of a benchmark before reporting a regression, keeping the best (default: 3)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    for module in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module("{}.{}".format(__package__, module.name))
+    names = args.names or sorted(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error("unknown benchmarks: {}".format(", ".join(sorted(unknown))))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results: dict[str, dict[str, float | str]] = {}
+    regressions = []
+    for name in names:
+        metrics = _run(name, baseline, args.tolerance, args.attempts, args.update_baseline)
+        for metric_name, metric in metrics.items():
+            key = "{}.{}".format(name, metric_name)
+            results[key] = {"value": metric.value, "unit": metric.unit}
+            line = "{:<55} {:>14.2f} {}".format(key, metric.value, metric.unit)
+            if key in baseline:
+                base = baseline[key]["value"]
+                line += "  ({:+.1%} vs. baseline)".format(metric.value / base - 1)
+                if not args.update_baseline and metric.regressed(base, args.tolerance):
+                    regressions.append(key)
+                    line += "  REGRESSED"
+            print(line, flush=True)
+
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print("Updated {}".format(args.baseline))
+        return 0
+    if regressions:
+        print("Regressed beyond {:.0%}: {}".format(args.tolerance, ", ".join(regressions)))
+        return 1
+    return 0
+
+
+def _run(
+    name: str, baseline: dict, tolerance: float, attempts: int, update: bool
+) -> dict[str, Metric]:
+    """
+    Runs benchmark `name`, keeping the best value of each metric. Reruns it, up
+    to `attempts` runs in all, while any metric looks regressed (or, when
+    updating the baseline, always), so one noisy run can't fail the suite.
+    """
+    best = BENCHMARKS[name]()
+    for _ in range(attempts - 1):
+        if not update and not any(
+            "{}.{}".format(name, k) in baseline
+            and m.regressed(baseline["{}.{}".format(name, k)]["value"], tolerance)
+            for k, m in best.items()
+        ):
+            break
+        for k, m in BENCHMARKS[name]().items():
+            if (m.value > best[k].value) == m.higher_is_better:
+                best[k] = m
+    return best
+
+
+if __name__ == "__main__":
+    sys.exit(main())
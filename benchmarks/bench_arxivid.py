@@ -0,0 +1,47 @@
+"""Benchmarks for parsing arXiv IDs."""
+
+from __future__ import annotations
+
+import re
+
+import arxiv
+from arxiv import _arxivid, _feed
+
+from . import Metric, benchmark, best_time, fixture_bodies
+
+_VERSION = re.compile(r"v\d+$")
+
+
+@benchmark("arxiv_id")
+def arxiv_id() -> dict[str, Metric]:
+    """
+    Throughput of `ArxivId.parse_all` normalizing a 200,000-row join column
+    built from the recorded results' IDs, written in several forms and
+    repeated; and of normalizing the same column one string at a time with
+    regexes.
+    """
+    short_ids = sorted(
+        {result.get_short_id() for body in fixture_bodies() for result in _feed.parse(body).results}
+    )
+    forms = [
+        form
+        for id in short_ids
+        for form in (id, "arXiv:" + id, "https://arxiv.org/abs/" + id, _VERSION.sub("", id))
+    ]
+    column = [forms[(i * 7919) % len(forms)] for i in range(200_000)]
+
+    def run() -> None:
+        arxiv.ArxivId.parse_all(column)
+
+    def run_strings() -> None:
+        for raw in column:
+            _VERSION.sub("", _arxivid._normalize_id(raw))
+
+    seconds = best_time(run, repeat=5)
+    string_seconds = best_time(run_strings, repeat=5)
+    return {
+        "ids_per_second": Metric(len(column) / seconds, "ids/s", higher_is_better=True),
+        "string_ids_per_second": Metric(
+            len(column) / string_seconds, "ids/s", higher_is_better=True
+        ),
+    }
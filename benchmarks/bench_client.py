@@ -0,0 +1,41 @@
+"""End-to-end benchmarks for `arxiv.Client.results` against a mocked session."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from requests import Response
+
+import arxiv
+
+from . import Metric, benchmark, best_time, fixture_bodies
+
+_PAGES = 20
+
+
+@benchmark("client_results")
+def client_results() -> dict[str, Metric]:
+    """
+    Overhead of paging through `Client.results` with no delay, serving one
+    recorded 100-result page for every request.
+    """
+    (body,) = fixture_bodies("q_testing_s0_m100")
+
+    def get(self, url, **kwargs) -> Response:
+        resp = Response()
+        resp.status_code = 200
+        resp._content = body
+        return resp
+
+    client = arxiv.Client(page_size=100, delay_seconds=0)
+    search = arxiv.Search(query="testing", max_results=100 * _PAGES)
+
+    def run() -> None:
+        for _ in client.results(search):
+            pass
+
+    with patch("requests.Session.get", get):
+        seconds = best_time(run, repeat=5)
+    return {
+        "results_per_second": Metric(100 * _PAGES / seconds, "results/s", higher_is_better=True),
+    }
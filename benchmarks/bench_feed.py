@@ -0,0 +1,232 @@
+"""Benchmarks for `arxiv._feed`: XML parsing, `Result` construction, memory."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from lxml import etree
+
+from arxiv import _feed
+
+from . import Metric, benchmark, best_time, fixture_bodies
+
+
+@benchmark("parse")
+def parse() -> dict[str, Metric]:
+    """Throughput of `_feed.parse` over every recorded response."""
+    bodies = fixture_bodies()
+    entries = sum(len(_feed.parse(body).results) for body in bodies)
+    size = sum(len(body) for body in bodies)
+
+    def run() -> None:
+        for body in bodies:
+            _feed.parse(body)
+
+    seconds = best_time(run, repeat=5, number=10)
+    return {
+        "entries_per_second": Metric(entries / seconds, "entries/s", higher_is_better=True),
+        "megabytes_per_second": Metric(size / seconds / 1e6, "MB/s", higher_is_better=True),
+    }
+
+
+def _large_page() -> bytes:
+    """A 2000-entry page, the API's maximum, built from a recorded page."""
+    (body,) = fixture_bodies("q_testing_s0_m100")
+    head, rest = body.split(b"<entry>", 1)
+    entries, tail = rest.rsplit(b"</entry>", 1)
+    page = head + (b"<entry>" + entries + b"</entry>") * 20 + tail
+    assert len(_feed.parse(page).results) == 2000
+    return page
+
+
+@benchmark("parse_large_page")
+def parse_large_page() -> dict[str, Metric]:
+    """Throughput of `_feed.parse` on a 2000-entry page."""
+    page = _large_page()
+    seconds = best_time(lambda: _feed.parse(page), repeat=5)
+    return {
+        "entries_per_second": Metric(2000 / seconds, "entries/s", higher_is_better=True),
+    }
+
+
+@benchmark("parse_lazy")
+def parse_lazy() -> dict[str, Metric]:
+    """
+    Throughput of a lazy `_feed.parse` on a 2000-entry page, reading only
+    `entry_id` and `updated` from each result, as change-detection jobs do.
+    """
+    page = _large_page()
+
+    def run() -> None:
+        for result in _feed.parse(page, lazy=True).results:
+            result.entry_id, result.updated
+
+    seconds = best_time(run, repeat=5)
+    return {
+        "entries_per_second": Metric(2000 / seconds, "entries/s", higher_is_better=True),
+    }
+
+
+@benchmark("parse_projected")
+def parse_projected() -> dict[str, Metric]:
+    """
+    Throughput of `_feed.parse` on a 2000-entry page, parsing only `entry_id`
+    and `updated`, as change-detection jobs do.
+    """
+    page = _large_page()
+    fields = _feed._projection(["updated"])
+
+    def run() -> None:
+        for result in _feed.parse(page, fields=fields).results:
+            result.entry_id, result.updated
+
+    seconds = best_time(run, repeat=5)
+    return {
+        "entries_per_second": Metric(2000 / seconds, "entries/s", higher_is_better=True),
+    }
+
+
+@benchmark("parse_columnar")
+def parse_columnar() -> dict[str, Metric]:
+    """
+    Throughput of a columnar `_feed.parse` on a 2000-entry page, converting
+    the batch to NumPy arrays as analytics jobs do.
+    """
+    page = _large_page()
+
+    def run() -> None:
+        batch = _feed.parse(page, columnar=True).batch
+        assert batch is not None
+        batch.to_numpy()
+
+    seconds = best_time(run, repeat=5)
+    return {
+        "entries_per_second": Metric(2000 / seconds, "entries/s", higher_is_better=True),
+    }
+
+
+@benchmark("build_result")
+def build_result() -> dict[str, Metric]:
+    """Cost of constructing a `Result` from an already-parsed `<entry>`."""
+    entries = [
+        entry
+        for body in fixture_bodies()
+        for entry in etree.fromstring(body, parser=_feed._make_parser()).iterfind(
+            "atom:entry", _feed._NS
+        )
+    ]
+
+    def run() -> None:
+        for entry in entries:
+            _feed._build_result(entry)
+
+    def run_lazy() -> None:
+        for entry in entries:
+            _feed._lazy_result(entry)
+
+    seconds = best_time(run, repeat=5, number=10)
+    lazy_seconds = best_time(run_lazy, repeat=5, number=10)
+    return {
+        "microseconds_per_result": Metric(
+            seconds / len(entries) * 1e6, "us/result", higher_is_better=False
+        ),
+        "lazy_microseconds_per_result": Metric(
+            lazy_seconds / len(entries) * 1e6, "us/result", higher_is_better=False
+        ),
+    }
+
+
+@benchmark("parse_datetime")
+def parse_datetime() -> dict[str, Metric]:
+    """
+    Cost of `_feed._parse_datetime` over every `updated` and `published`
+    timestamp in the recorded responses, in order, starting from an empty
+    memo each run; and of the general `_parse_iso_datetime` it replaced.
+    """
+    stamps = [
+        value
+        for body in fixture_bodies()
+        for entry in etree.fromstring(body, parser=_feed._make_parser()).iterfind(
+            "atom:entry", _feed._NS
+        )
+        for value in (
+            entry.findtext("atom:updated", namespaces=_feed._NS),
+            entry.findtext("atom:published", namespaces=_feed._NS),
+        )
+    ]
+
+    def run() -> None:
+        _feed._parse_datetime.cache_clear()
+        for stamp in stamps:
+            _feed._parse_datetime(stamp)
+
+    def run_general() -> None:
+        for stamp in stamps:
+            _feed._parse_iso_datetime(stamp)
+
+    seconds = best_time(run, repeat=5, number=10)
+    general_seconds = best_time(run_general, repeat=5, number=10)
+    return {
+        "microseconds_per_timestamp": Metric(
+            seconds / len(stamps) * 1e6, "us/timestamp", higher_is_better=False
+        ),
+        "general_microseconds_per_timestamp": Metric(
+            general_seconds / len(stamps) * 1e6, "us/timestamp", higher_is_better=False
+        ),
+    }
+
+
+@benchmark("memory")
+def memory() -> dict[str, Metric]:
+    """
+    Peak traced memory to parse and hold 10,000 results, without and with a
+    shared `_feed._ValuePool`.
+    """
+    bodies = [body for body in fixture_bodies() if _feed.parse(body).results]
+    return {
+        "peak_megabytes_per_10k_results": Metric(
+            _peak_megabytes(bodies, None), "MB", higher_is_better=False
+        ),
+        "pooled_peak_megabytes_per_10k_results": Metric(
+            _peak_megabytes(bodies, _feed._ValuePool()), "MB", higher_is_better=False
+        ),
+        "retained_bytes_per_result": Metric(
+            _retained_bytes(bodies), "bytes/result", higher_is_better=False
+        ),
+    }
+
+
+def _retained_bytes(bodies: list[bytes]) -> float:
+    """
+    Traced memory still allocated per result after parsing and holding
+    10,000 results from `bodies`, once the feeds themselves are released.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        held = []
+        i = 0
+        while len(held) < 10_000:
+            held.extend(_feed.parse(bodies[i % len(bodies)]).results)
+            i += 1
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / len(held)
+
+
+def _peak_megabytes(bodies: list[bytes], pool: _feed._ValuePool | None) -> float:
+    """Peak traced memory to parse and hold 10,000 results from `bodies`."""
+    tracemalloc.start()
+    try:
+        held = []
+        i = 0
+        while len(held) < 10_000:
+            held.extend(_feed.parse(bodies[i % len(bodies)], pool=pool).results)
+            i += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / len(held) * 10_000 / 1e6
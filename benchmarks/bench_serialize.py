@@ -0,0 +1,60 @@
+"""Benchmarks for serializing `Result`s: files, dicts and pickles."""
+
+from __future__ import annotations
+
+import pickle
+import tempfile
+from pathlib import Path
+
+import arxiv
+from arxiv import _feed
+
+from . import Metric, benchmark, best_time, fixture_bodies
+
+
+def _results() -> list[arxiv.Result]:
+    return [result for body in fixture_bodies() for result in _feed.parse(body).results]
+
+
+@benchmark("serialize_files")
+def serialize_files() -> dict[str, Metric]:
+    """Throughput of writing then reading every parsed fixture result, by format."""
+    results = _results()
+    metrics = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for format in ("jsonl", "msgpack"):
+            path = Path(tmp) / "results"
+
+            def run() -> None:
+                with arxiv.ResultWriter(path, format=format) as writer:
+                    writer.write_all(results)
+                with arxiv.ResultReader(path, format=format) as reader:
+                    for _ in reader:
+                        pass
+
+            seconds = best_time(run, repeat=5)
+            metrics[format + "_results_per_second"] = Metric(
+                len(results) / seconds, "results/s", higher_is_better=True
+            )
+            metrics[format + "_bytes_per_result"] = Metric(
+                path.stat().st_size / len(results), "bytes/result", higher_is_better=False
+            )
+    return metrics
+
+
+@benchmark("pickle")
+def pickle_results() -> dict[str, Metric]:
+    """Throughput and size of pickling every parsed fixture result."""
+    results = _results()
+    data = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def run() -> None:
+        pickle.loads(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+    seconds = best_time(run, repeat=5)
+    return {
+        "results_per_second": Metric(len(results) / seconds, "results/s", higher_is_better=True),
+        "bytes_per_result": Metric(
+            len(data) / len(results), "bytes/result", higher_is_better=False
+        ),
+    }
@@ -9,7 +9,10 @@ Fixtures are stored as files under ``tests/fixtures/``, keyed by a
 stable hash of the request URL.
 """
 
+import asyncio
+import contextlib
 import hashlib
+import io
 import json
 import time
 import urllib.request
@@ -19,6 +22,11 @@ from unittest.mock import patch
 import pytest
 import requests
 
+try:
+    import httpx
+except ImportError:  # httpx is only needed for AsyncClient tests.
+    httpx = None
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 # Track which fixture files are loaded during a run (offline mode only).
@@ -72,9 +80,12 @@ def _load_fixture(url: str) -> requests.Response:
         )
     _used_fixture_paths.add(path)
     data = json.loads(path.read_text(encoding="utf-8"))
+    body = data["body"].encode("latin-1")
     resp = requests.Response()
     resp.status_code = data["status_code"]
-    resp._content = data["body"].encode("latin-1")
+    resp._content = body
+    # Also expose the body as a stream, for clients reading it incrementally.
+    resp.raw = io.BytesIO(body)
     return resp
 
 
@@ -100,7 +111,7 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 
 @pytest.fixture(autouse=True)
 def _mock_api(request: pytest.FixtureRequest) -> None:  # type: ignore[return]
-    """Autouse fixture: patches Session.get and time.sleep unless --live."""
+    """Autouse fixture: patches HTTP gets and sleeps unless --live."""
     live = request.config.getoption("--live")
     record = request.config.getoption("--record") and live
 
@@ -118,10 +129,18 @@ def _mock_api(request: pytest.FixtureRequest) -> None:  # type: ignore[return]
             _save_fixture(url, resp)
             return resp
 
-        with (
-            patch.object(requests.Session, "get", recording_get),
-            patch.object(time, "sleep", lambda _: None),
-        ):
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(patch.object(requests.Session, "get", recording_get))
+            stack.enter_context(patch.object(time, "sleep", lambda _: None))
+            if httpx is not None:
+                real_async_get = httpx.AsyncClient.get
+
+                async def recording_async_get(self, url, **kwargs):  # type: ignore[no-untyped-def]
+                    resp = await real_async_get(self, url, **kwargs)
+                    _save_fixture(str(url), resp)
+                    return resp
+
+                stack.enter_context(patch.object(httpx.AsyncClient, "get", recording_async_get))
             yield
         return
 
@@ -134,11 +153,20 @@ def _mock_api(request: pytest.FixtureRequest) -> None:  # type: ignore[return]
         Path(filename).write_bytes(b"FAKE")
         return (filename, None)
 
-    with (
-        patch.object(requests.Session, "get", fixture_get),
-        patch.object(time, "sleep", lambda _: None),
-        patch.object(urllib.request, "urlretrieve", fake_urlretrieve),
-    ):
+    async def async_fixture_get(self, url, **kwargs):  # type: ignore[no-untyped-def]
+        resp = _load_fixture(str(url))
+        return httpx.Response(resp.status_code, content=resp.content)
+
+    async def async_no_sleep(_: float) -> None:
+        return None
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch.object(requests.Session, "get", fixture_get))
+        stack.enter_context(patch.object(time, "sleep", lambda _: None))
+        stack.enter_context(patch.object(urllib.request, "urlretrieve", fake_urlretrieve))
+        if httpx is not None:
+            stack.enter_context(patch.object(httpx.AsyncClient, "get", async_fixture_get))
+            stack.enter_context(patch.object(asyncio, "sleep", async_no_sleep))
         yield
 
 
@@ -0,0 +1,96 @@
+import pickle
+import unittest
+
+import arxiv
+
+
+class TestArxivId(unittest.TestCase):
+    def test_new_style(self):
+        id = arxiv.ArxivId("2107.05580v1")
+        self.assertEqual(id.base_id, "2107.05580")
+        self.assertEqual(id.version, 1)
+        self.assertEqual(id.scheme, "new")
+        self.assertIsNone(id.archive)
+        self.assertEqual((id.year, id.month, id.number), (2021, 7, 5580))
+        self.assertEqual(str(id), "2107.05580v1")
+        self.assertEqual(repr(id), "arxiv.ArxivId('2107.05580v1')")
+        self.assertEqual(str(arxiv.ArxivId("0704.0001")), "0704.0001")
+
+    def test_legacy(self):
+        id = arxiv.ArxivId("quant-ph/0201082v2")
+        self.assertEqual(id.base_id, "quant-ph/0201082")
+        self.assertEqual(id.version, 2)
+        self.assertEqual(id.scheme, "legacy")
+        self.assertEqual(id.archive, "quant-ph")
+        self.assertEqual((id.year, id.month, id.number), (2002, 1, 82))
+        self.assertEqual(arxiv.ArxivId("hep-th/9108001").year, 1991)
+        # Subject classes are dropped, as in arXiv's feeds.
+        self.assertEqual(arxiv.ArxivId("math.GT/0309136").base_id, "math/0309136")
+
+    def test_normalization(self):
+        for raw in (
+            " arXiv:2107.05580v1 ",
+            "https://arxiv.org/abs/2107.05580v1",
+            "http://export.arxiv.org/pdf/2107.05580v1.pdf",
+        ):
+            self.assertEqual(arxiv.ArxivId(raw), arxiv.ArxivId("2107.05580v1"))
+        for raw in (
+            "",
+            "2107.05580v0",
+            "2113.05580",
+            "quant-ph/020108",
+            "not an id",
+            # Numbers have 4 digits before 1501 and 5 from then on.
+            "2107.5580",
+            "0704.00001",
+            "1412.00001",
+            "1501.0001",
+        ):
+            with self.assertRaises(ValueError):
+                arxiv.ArxivId(raw)
+
+    def test_ordering_and_hashing(self):
+        ids = [
+            arxiv.ArxivId(raw)
+            for raw in (
+                "2107.05580v2",
+                "quant-ph/0201082",
+                "2107.05580",
+                "2107.05580v1",
+                "1501.00001",
+            )
+        ]
+        self.assertListEqual(
+            [str(id) for id in sorted(ids)],
+            ["quant-ph/0201082", "1501.00001", "2107.05580", "2107.05580v1", "2107.05580v2"],
+        )
+        self.assertEqual(len(set(ids) | {arxiv.ArxivId("arXiv:1501.00001")}), 5)
+        self.assertNotEqual(arxiv.ArxivId("2107.05580"), "2107.05580")
+        self.assertEqual(pickle.loads(pickle.dumps(ids[0])), ids[0])
+
+    def test_one_spelling_per_id(self):
+        self.assertEqual(str(arxiv.ArxivId("1412.9999")), "1412.9999")
+        self.assertEqual(str(arxiv.ArxivId("1501.00001")), "1501.00001")
+        self.assertListEqual(
+            arxiv.ArxivId.parse_all(["0704.0001", "0704.00001", "2107.5580"], strict=False),
+            [arxiv.ArxivId("0704.0001"), None, None],
+        )
+
+    def test_parse_all(self):
+        raws = ["2107.05580v1", "arXiv:2107.05580v1", "2107.05580v1", "hep-th/9108001"]
+        ids = arxiv.ArxivId.parse_all(iter(raws))
+        self.assertListEqual([str(id) for id in ids], ["2107.05580v1"] * 3 + ["hep-th/9108001"])
+        self.assertIs(ids[0], ids[2])
+        self.assertIs(arxiv.ArxivId.parse("1501.00001"), arxiv.ArxivId.parse("1501.00001"))
+        with self.assertRaises(ValueError):
+            arxiv.ArxivId.parse_all(["2107.05580", "bogus"])
+        self.assertListEqual(
+            arxiv.ArxivId.parse_all(["2107.05580", "bogus"], strict=False),
+            [arxiv.ArxivId("2107.05580"), None],
+        )
+
+    def test_result_arxiv_id(self):
+        result = arxiv.Result("http://arxiv.org/abs/quant-ph/0201082v1")
+        self.assertEqual(result.arxiv_id, arxiv.ArxivId("quant-ph/0201082v1"))
+        self.assertIs(result.arxiv_id, result.arxiv_id)
+        self.assertEqual(str(result.arxiv_id), result.get_short_id())
@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+import arxiv
+
+
+async def collect(client: arxiv.AsyncClient, search: arxiv.Search, offset: int = 0):
+    return [r async for r in client.results(search, offset=offset)]
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def test_matches_client(self):
+        search = arxiv.Search(query="testing", max_results=55)
+        expected = list(arxiv.Client(page_size=10).results(search))
+        async with arxiv.AsyncClient(page_size=10) as client:
+            got = await collect(client, search)
+        self.assertEqual(len(got), 55)
+        self.assertListEqual(got, expected)
+
+    async def test_offset(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        async with arxiv.AsyncClient(page_size=10) as client:
+            default = await collect(client, search)
+            self.assertListEqual(await collect(client, search, offset=5), default[5:])
+            self.assertListEqual(await collect(client, search, offset=10), [])
+
+    async def test_format_url(self):
+        search = arxiv.Search(query="quantum")
+        self.assertEqual(
+            arxiv.AsyncClient()._format_url(search, 20, 10),
+            arxiv.Client()._format_url(search, 20, 10),
+        )
+
+    async def test_retry(self):
+        client = arxiv.AsyncClient(num_retries=2)
+        with patch("httpx.AsyncClient.get", return_value=httpx.Response(500)) as mock_get:
+            with self.assertRaises(arxiv.HTTPError) as ctx:
+                await collect(client, arxiv.Search(query="quantum"))
+        self.assertEqual(ctx.exception.status, 500)
+        self.assertEqual(ctx.exception.retry, 2)
+        self.assertEqual(mock_get.call_count, 3)
+
+    async def test_concurrent_requests_share_delay(self):
+        client = arxiv.AsyncClient(delay_seconds=3.0)
+        with (
+            patch("httpx.AsyncClient.get", return_value=httpx.Response(200, content=b"")),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            url = client._format_url(arxiv.Search(query="quantum"), 0, 1)
+            await asyncio.gather(*(client._parse_feed(url) for _ in range(4)))
+        # The first request goes immediately; the rest are spaced one slot apart.
+        delays = sorted(c.args[0] for c in mock_sleep.call_args_list)
+        self.assertEqual(len(delays), 3)
+        for i, delay in enumerate(delays, start=1):
+            self.assertAlmostEqual(delay, 3.0 * i, delta=0.1)
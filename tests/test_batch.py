@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy
+import pyarrow.parquet
+
+import arxiv
+
+
+class TestResultBatch(unittest.TestCase):
+    def setUp(self):
+        self.search = arxiv.Search("testing", max_results=100)
+        self.results = list(arxiv.Client().results(self.search))
+        self.batches = list(arxiv.Client().batches(self.search))
+
+    def test_matches_results(self):
+        self.assertEqual(len(self.batches), 1)
+        batch = self.batches[0]
+        self.assertEqual(len(batch), len(self.results))
+        for i, r in enumerate(self.results):
+            self.assertEqual(batch.entry_id[i], r.entry_id)
+            self.assertEqual(batch.updated[i], r.updated.timestamp())
+            self.assertEqual(batch.published[i], r.published.timestamp())
+            self.assertEqual(batch.title[i], r.title)
+            self.assertEqual(batch.doi[i], r.doi)
+            self.assertEqual(batch.pdf_url[i], r.pdf_url)
+            start, end = batch.category_offsets[i], batch.category_offsets[i + 1]
+            self.assertListEqual(batch.categories[start:end], r.categories)
+            start, end = batch.author_offsets[i], batch.author_offsets[i + 1]
+            self.assertListEqual(batch.author_names[start:end], [a.name for a in r.authors])
+
+    def test_to_numpy(self):
+        columns = self.batches[0].to_numpy()
+        self.assertEqual(columns["updated"].dtype, numpy.dtype("datetime64[s]"))
+        self.assertEqual(
+            columns["updated"][0], numpy.datetime64(self.results[0].updated.replace(tzinfo=None))
+        )
+        self.assertListEqual(list(columns["entry_id"]), [r.entry_id for r in self.results])
+
+    def test_parquet_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "results.parquet"
+            with arxiv.ParquetWriter(path) as writer:
+                self.assertEqual(writer.write_all(self.batches), 100)
+            table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 100)
+        rows = table.to_pylist()
+        for row, r in zip(rows, self.results):
+            self.assertEqual(row["entry_id"], r.entry_id)
+            self.assertEqual(row["published"], r.published)
+            self.assertListEqual(row["categories"], r.categories)
+            self.assertListEqual(
+                row["authors"],
+                [{"name": a.name, "affiliations": a.affiliation} for a in r.authors],
+            )
+
+    def test_max_results(self):
+        search = arxiv.Search("testing", max_results=15)
+        batches = list(arxiv.Client(page_size=10).batches(search))
+        self.assertListEqual([len(b) for b in batches], [10, 5])
+        expected = list(arxiv.Client(page_size=10).results(search))
+        self.assertListEqual(
+            batches[0].entry_id + batches[1].entry_id, [r.entry_id for r in expected]
+        )
+        self.assertListEqual(list(arxiv.Client(page_size=10).batches(search, offset=15)), [])
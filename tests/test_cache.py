@@ -0,0 +1,173 @@
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+import arxiv
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "cache.sqlite"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hit_skips_request_and_sleep(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.ResponseCache(self.path)
+        expected = list(arxiv.Client(page_size=10, cache=cache).results(search))
+
+        client = arxiv.Client(page_size=10, cache=cache)
+        with (
+            patch.object(requests.Session, "get") as mock_get,
+            patch("time.sleep") as mock_sleep,
+        ):
+            got = list(client.results(search))
+        mock_get.assert_not_called()
+        mock_sleep.assert_not_called()
+        self.assertListEqual(got, expected)
+
+    def test_normalized_key(self):
+        cache = arxiv.ResponseCache(self.path)
+        client = arxiv.Client(cache=cache)
+        url = client._format_url(arxiv.Search(id_list=["1605.08386"]), 0, 100)
+        feed = client._parse_feed(url)
+        base, query = url.split("?")
+        reordered = (
+            base.upper().replace("/API/QUERY", "/api/query")
+            + "?"
+            + "&".join(reversed(query.split("&")))
+        )
+        self.assertIsNotNone(cache.get(reordered))
+        self.assertEqual(len(feed.results), 1)
+
+    def test_ttl(self):
+        cache = arxiv.ResponseCache(self.path, ttl=timedelta(seconds=60))
+        client = arxiv.Client(cache=cache)
+        url = client._format_url(arxiv.Search(id_list=["1605.08386"]), 0, 100)
+        client._parse_feed(url)
+        self.assertIsNotNone(cache.get(url))
+        with patch("time.time", return_value=10**10):
+            self.assertIsNone(cache.get(url))
+        # Expired entries are dropped.
+        self.assertIsNone(cache.get(url))
+
+    def test_lru_eviction(self):
+        client = arxiv.Client()
+        urls = [
+            client._format_url(arxiv.Search(id_list=[id]), 0, 100)
+            for id in ["1605.08386", "1707.08567", "astro-ph/0601001"]
+        ]
+        bodies = [client._session.get(url).content for url in urls]
+        feeds = [arxiv._feed.parse(body) for body in bodies]
+        cache = arxiv.ResponseCache(self.path, max_bytes=len(bodies[0]) + len(bodies[1]))
+        with patch("time.time", side_effect=range(1000)):
+            cache.put(urls[0], bodies[0], feeds[0])
+            cache.put(urls[1], bodies[1], feeds[1])
+            # Touch the first entry so the second is least recently used.
+            self.assertIsNotNone(cache.get(urls[0]))
+            cache.put(urls[2], bodies[2], feeds[2])
+            self.assertIsNone(cache.get(urls[1]))
+            self.assertIsNotNone(cache.get(urls[2]))
+
+    def test_min_entry_age(self):
+        client = arxiv.Client()
+        url = client._format_url(arxiv.Search(id_list=["1605.08386"]), 0, 100)
+        body = client._session.get(url).content
+        feed = arxiv._feed.parse(body)
+        # 1605.08386 was last updated in 2016.
+        recent = arxiv.ResponseCache(self.path, min_entry_age=timedelta(days=365 * 100))
+        recent.put(url, body, feed)
+        self.assertIsNone(recent.get(url))
+        stable = arxiv.ResponseCache(self.path, min_entry_age=timedelta(days=30))
+        stable.put(url, body, feed)
+        self.assertIsNotNone(stable.get(url))
+
+    def test_empty_page_not_cached(self):
+        cache = arxiv.ResponseCache(self.path)
+        client = arxiv.Client(cache=cache)
+        url = client._format_url(arxiv.Search(id_list=["0000.0000"]), 0, 100)
+        client._parse_feed(url)
+        self.assertIsNone(cache.get(url))
+
+
+class TestPageCache(unittest.TestCase):
+    def test_hit_skips_parse_feed(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.PageCache()
+        expected = list(arxiv.Client(page_size=10, page_cache=cache).results(search))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        client = arxiv.Client(page_size=10, page_cache=cache)
+        with patch.object(client, "_parse_feed") as mock_parse_feed:
+            got = list(client.results(search))
+        mock_parse_feed.assert_not_called()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Hits return the very same parsed results.
+        for a, b in zip(got, expected):
+            self.assertIs(a, b)
+
+    def test_key_includes_page_size(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.PageCache()
+        list(arxiv.Client(page_size=10, page_cache=cache).results(search))
+        list(arxiv.Client(page_size=15, page_cache=cache).results(search))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_key_includes_endpoint(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.PageCache()
+        client = arxiv.Client(page_size=10, page_cache=cache)
+        feed = client._fetch_page(search, 0, first_page=True)
+        mirror = arxiv.Client(page_size=10, page_cache=cache)
+        mirror.query_url_format = "http://127.0.0.1:8080/api/query?{}"
+        with patch.object(mirror, "_parse_feed", return_value=feed) as mock_parse_feed:
+            list(mirror.results(search))
+        mock_parse_feed.assert_called_once()
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_key_includes_lazy(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.PageCache()
+        eager = list(arxiv.Client(page_size=10, page_cache=cache).results(search))
+        lazy = list(arxiv.Client(page_size=10, page_cache=cache, lazy=True).results(search))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(eager, lazy)
+        self.assertFalse(any(hasattr(r, "_entry") for r in eager))
+        self.assertTrue(all(hasattr(r, "_entry") for r in lazy))
+
+    def test_ttl(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        cache = arxiv.PageCache(ttl=timedelta(seconds=60))
+        client = arxiv.Client(page_size=10, page_cache=cache)
+        list(client.results(search))
+        with patch("time.monotonic", return_value=10**10):
+            list(client.results(search))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_bounds(self):
+        client = arxiv.Client()
+        feeds = [
+            client._parse_feed(client._format_url(arxiv.Search(id_list=[id]), 0, 100))
+            for id in ["1605.08386", "1707.08567", "astro-ph/0601001"]
+        ]
+        by_entries = arxiv.PageCache(max_entries=2, max_bytes=None)
+        for i, feed in enumerate(feeds):
+            by_entries.put(i, feed)
+        self.assertIsNone(by_entries.get(0))
+        self.assertIs(by_entries.get(2), feeds[2])
+        self.assertEqual(by_entries.evictions, 1)
+
+        by_bytes = arxiv.PageCache(max_entries=None, max_bytes=feeds[0].size + feeds[1].size)
+        by_bytes.put(0, feeds[0])
+        by_bytes.put(1, feeds[1])
+        by_bytes.get(0)
+        by_bytes.put(2, feeds[2])
+        self.assertIsNone(by_bytes.get(1))
+        self.assertIsNotNone(by_bytes.get(0))
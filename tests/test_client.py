@@ -1,7 +1,10 @@
+import subprocess
+import sys
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, call, patch
 import arxiv
-from datetime import datetime, timedelta
 from pytest import approx
 from requests import Response
 
@@ -130,9 +133,9 @@ class TestClient(unittest.TestCase):
         # A client should sleep until delay_seconds have passed.
         client._parse_feed(url)
         mock_sleep.assert_not_called()
-        # Overwrite _last_request_dt to minimize flakiness: different
+        # Overwrite the limiter's last request time to minimize flakiness: different
         # environments will have different page fetch times.
-        client._last_request_dt = datetime.now()
+        client.rate_limiter._last_request_at = time.monotonic()
         client._parse_feed(url)
         mock_sleep.assert_called_once_with(approx(client.delay_seconds, rel=1e-3))
 
@@ -146,7 +149,7 @@ class TestClient(unittest.TestCase):
         # `test_sleep_standard`.
         client._parse_feed(url1)
         mock_sleep.assert_not_called()
-        client._last_request_dt = datetime.now()
+        client.rate_limiter._last_request_at = time.monotonic()
         client._parse_feed(url2)
         mock_sleep.assert_called_once_with(approx(client.delay_seconds, rel=1e-3))
 
@@ -155,13 +158,13 @@ class TestClient(unittest.TestCase):
     def test_sleep_elapsed(self, mock_sleep, mock_get):
         client = arxiv.Client()
         url = client._format_url(arxiv.Search(query="quantum"), 0, 1)
-        # If _last_request_dt is less than delay_seconds ago, sleep.
-        client._last_request_dt = datetime.now() - timedelta(seconds=client.delay_seconds - 1)
+        # If the last request was less than delay_seconds ago, sleep.
+        client.rate_limiter._last_request_at = time.monotonic() - (client.delay_seconds - 1)
         client._parse_feed(url)
         mock_sleep.assert_called_once()
         mock_sleep.reset_mock()
-        # If _last_request_dt is at least delay_seconds ago, don't sleep.
-        client._last_request_dt = datetime.now() - timedelta(seconds=client.delay_seconds)
+        # If the last request was at least delay_seconds ago, don't sleep.
+        client.rate_limiter._last_request_at = time.monotonic() - client.delay_seconds
         client._parse_feed(url)
         mock_sleep.assert_not_called()
 
@@ -175,14 +178,20 @@ class TestClient(unittest.TestCase):
         mock_sleep.assert_not_called()
 
     @patch("requests.Session.get", return_value=empty_response(500))
-    @patch("time.sleep", return_value=None)
-    def test_sleep_between_errors(self, mock_sleep, mock_get):
+    def test_sleep_between_errors(self, mock_get):
         client = arxiv.Client()
         url = client._format_url(arxiv.Search(query="quantum"), 0, 1)
-        try:
-            client._parse_feed(url)
-        except arxiv.HTTPError:
-            pass
+        # Sleeping advances a fake monotonic clock, as a real sleep would.
+        clock = [time.monotonic()]
+        mock_sleep = MagicMock(side_effect=lambda s: clock.__setitem__(0, clock[0] + s))
+        with (
+            patch("time.sleep", mock_sleep),
+            patch("time.monotonic", side_effect=lambda: clock[0]),
+        ):
+            try:
+                client._parse_feed(url)
+            except arxiv.HTTPError:
+                pass
         # Should sleep between retries.
         mock_sleep.assert_called()
         self.assertEqual(mock_sleep.call_count, client.num_retries)
@@ -192,3 +201,36 @@ class TestClient(unittest.TestCase):
             ]
             * client.num_retries
         )
+
+    @patch("requests.Session.get", return_value=empty_response(200))
+    @patch("time.sleep", return_value=None)
+    def test_sleep_shared_between_threads(self, mock_sleep, mock_get):
+        client = arxiv.Client()
+        url = client._format_url(arxiv.Search(query="quantum"), 0, 1)
+        threads = [threading.Thread(target=client._parse_feed, args=(url,)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Each thread gets its own slot: the first request goes immediately and
+        # the others wait 1, 2, 3, and 4 delays respectively.
+        delays = sorted(c.args[0] for c in mock_sleep.call_args_list)
+        self.assertEqual(len(delays), 4)
+        for i, delay in enumerate(delays, start=1):
+            self.assertEqual(delay, approx(client.delay_seconds * i, abs=0.1))
+
+
+class TestImport(unittest.TestCase):
+    def test_optional_features_load_lazily(self):
+        script = (
+            "import sys, arxiv; "
+            "print(sorted(m for m in ('asyncio', 'sqlite3', 'http.server') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        self.assertEqual(out.stdout.strip(), "[]", out.stderr)
+        for name in arxiv.__all__:
+            self.assertIsNotNone(getattr(arxiv, name))
+            self.assertIn(name, dir(arxiv))
+        self.assertIs(arxiv.StandInServer, arxiv._standin.StandInServer)
+        with self.assertRaises(AttributeError):
+            arxiv.NoSuchName
@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import arxiv
+
+
+class TestCursor(unittest.TestCase):
+    def setUp(self):
+        self.search = arxiv.Search(query="testing", max_results=55)
+
+    def test_checkpoints(self):
+        cursors = []
+        client = arxiv.Client(page_size=10)
+        results = list(client.results(self.search, on_checkpoint=cursors.append))
+        self.assertEqual(len(results), 55)
+        # The last page is only partly consumed, so it isn't checkpointed.
+        self.assertListEqual([c.offset for c in cursors], [10, 20, 30, 40, 50])
+        self.assertListEqual(cursors[1].last_seen_ids, [r.entry_id for r in results[10:20]])
+        self.assertTrue(all(c.total_results > 55 for c in cursors))
+
+    def test_checkpoint_every(self):
+        for stream in [False, True]:
+            cursors = []
+            client = arxiv.Client(page_size=10, stream=stream)
+            list(client.results(self.search, on_checkpoint=cursors.append, checkpoint_every=2))
+            self.assertListEqual([c.offset for c in cursors], [20, 40])
+        for every in [0, -1]:
+            with self.assertRaises(ValueError):
+                arxiv.Client().results(self.search, on_checkpoint=print, checkpoint_every=every)
+
+    def test_resume(self):
+        expected = list(arxiv.Client(page_size=10).results(self.search))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cursor.json"
+            got = []
+            for r in arxiv.Client(page_size=10).results(
+                self.search, on_checkpoint=lambda c: c.save(path)
+            ):
+                if len(got) == 25:
+                    break  # Crash mid-page.
+                got.append(r)
+            cursor = arxiv.Cursor.load(path)
+
+        self.assertEqual(cursor.offset, 20)
+        client = arxiv.Client(page_size=10)
+        client._parse_feed = MagicMock(wraps=client._parse_feed)
+        resumed = list(client.results(self.search, resume_from=cursor))
+        self.assertListEqual(got[:20] + resumed, expected)
+        # Completed pages aren't fetched again.
+        urls = [c.args[0] for c in client._parse_feed.call_args_list]
+        self.assertFalse(any("start=0&" in url or "start=10&" in url for url in urls))
+
+    def test_resume_skips_last_seen(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        client = arxiv.Client(page_size=15)
+        expected = list(client.results(search))
+        # Suppose the result set shifted since the checkpoint, so the entry at
+        # the cursor's offset was on the last completed page.
+        cursor = arxiv.Cursor(search, 9, None, [expected[9].entry_id])
+        resumed = list(client.results(search, resume_from=cursor))
+        self.assertEqual(len(resumed), 1)
+        self.assertNotIn(resumed[0], expected)
+
+    def test_resume_validates_search(self):
+        cursor = arxiv.Cursor(arxiv.Search(query="other"), 10)
+        with self.assertRaises(ValueError):
+            arxiv.Client().results(self.search, resume_from=cursor)
+        with self.assertRaises(ValueError):
+            arxiv.Client().results(self.search, offset=5, resume_from=arxiv.Cursor(self.search))
+
+    def test_serialization(self):
+        search = arxiv.Search(
+            query="cat:cs.LG",
+            id_list=["1605.08386"],
+            max_results=None,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Ascending,
+        )
+        cursor = arxiv.Cursor(search, 200, 1234, ["http://arxiv.org/abs/1605.08386v1"])
+        self.assertEqual(arxiv.Cursor.from_dict(cursor.to_dict()), cursor)
+        with self.assertRaises(ValueError):
+            arxiv.Cursor.from_dict({**cursor.to_dict(), "version": 99})
@@ -25,6 +25,14 @@ class TestErrorPickle(unittest.TestCase):
         self.assertEqual(str(restored), str(err))
         self.assertEqual(repr(restored), repr(err))
 
+    def test_http_error_retry_after_pickle_roundtrip(self):
+        err = arxiv.HTTPError(
+            url="http://export.arxiv.org/api/query", retry=1, status=429, retry_after=30.0
+        )
+        restored = pickle.loads(pickle.dumps(err))
+        self.assertEqual(restored.status, 429)
+        self.assertEqual(restored.retry_after, 30.0)
+
     def test_unexpected_empty_page_error_pickle_roundtrip(self):
         err = arxiv.UnexpectedEmptyPageError(
             url="http://export.arxiv.org/api/query", retry=2, raw_feed="<xml/>"
@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import arxiv
+from arxiv import _feed
+
+
+class TestParseDatetime(unittest.TestCase):
+    def test_fixed_format(self):
+        parsed = _feed._parse_datetime("2016-05-26T17:59:46Z")
+        self.assertEqual(parsed, datetime(2016, 5, 26, 17, 59, 46, tzinfo=timezone.utc))
+        self.assertIs(parsed.tzinfo, timezone.utc)
+        self.assertEqual(parsed, _feed._parse_iso_datetime("2016-05-26T17:59:46Z"))
+
+    def test_memoized(self):
+        _feed._parse_datetime.cache_clear()
+        first = _feed._parse_datetime("2021-04-26T17:59:46Z")
+        self.assertIs(_feed._parse_datetime("2021-04-26T17:59:46Z"), first)
+        self.assertEqual(_feed._parse_datetime.cache_info().hits, 1)
+
+    def test_other_forms(self):
+        expected = datetime(2016, 5, 26, 16, 59, 46, tzinfo=timezone.utc)
+        self.assertEqual(_feed._parse_datetime("2016-05-26T17:59:46+01:00"), expected)
+        self.assertEqual(_feed._parse_datetime(" 2016-05-26T16:59:46Z\n"), expected)
+        self.assertEqual(
+            _feed._parse_datetime("2016-05-26T16:59:46.5Z"), expected + timedelta(seconds=0.5)
+        )
+        with self.assertRaises(ValueError):
+            _feed._parse_datetime("2016-05-26T17:59:4xZ")
+
+
+class TestValuePool(unittest.TestCase):
+    def test_shares_repeated_values(self):
+        client = arxiv.Client()
+        results = list(client.results(arxiv.Search("testing", max_results=100)))
+        pdf_titles = [link.title for r in results for link in r.links if link.title == "pdf"]
+        self.assertGreater(len(pdf_titles), 1)
+        self.assertTrue(all(title is pdf_titles[0] for title in pdf_titles))
+        by_value = {}
+        for r in results:
+            for category in r.categories:
+                self.assertIs(by_value.setdefault(category, category), category)
+
+    def test_bounded(self):
+        pool = _feed._ValuePool(maxsize=2)
+        intern = pool.interner()
+        values = ["".join(["cs.", c]) for c in "ABC"]
+        for value in values:
+            self.assertIs(intern(value), value)
+        self.assertIs(intern("".join(["cs.", "A"])), values[0])
+        self.assertEqual(len(pool), 3)
+        pool.interner()
+        self.assertEqual(len(pool), 0)
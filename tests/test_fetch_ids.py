@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import MagicMock
+
+import arxiv
+from arxiv import _bulk
+
+
+class TestFetchIds(unittest.TestCase):
+    def test_normalizes_dedups_and_orders(self):
+        client = arxiv.Client()
+        lookup = client.fetch_ids(
+            [
+                "1605.08386",
+                " arXiv:1707.08567 ",
+                "https://arxiv.org/abs/astro-ph/0601001",
+                "1605.08386",
+                "0000.0000",
+                "https://arxiv.org/pdf/quant-ph/0201082v1",
+            ],
+            batch_size=1,
+        )
+        self.assertListEqual(
+            lookup.ids,
+            ["1605.08386", "1707.08567", "astro-ph/0601001", "quant-ph/0201082v1"],
+        )
+        self.assertListEqual(lookup.invalid, ["0000.0000"])
+        results = list(lookup)
+        self.assertListEqual(
+            [r.get_short_id() for r in results],
+            ["1605.08386v1", "1707.08567v1", "astro-ph/0601001v1", "quant-ph/0201082v1"],
+        )
+        self.assertListEqual(lookup.missing, ["0000.0000"])
+
+    def test_batches_share_requests(self):
+        client = arxiv.Client()
+        client._parse_feed = MagicMock(wraps=client._parse_feed)
+        lookup = client.fetch_ids(["0808.05394", "1707.08567"])
+        results = list(lookup)
+        self.assertEqual(client._parse_feed.call_count, 1)
+        self.assertListEqual([r.get_short_id() for r in results], ["1707.08567v1"])
+        self.assertListEqual(lookup.missing, ["0808.05394"])
+
+    def test_invalid_ids_not_sent(self):
+        # arXiv answers an id_list containing "abc" with a 400 for the whole batch.
+        client = arxiv.Client()
+        lookup = client.fetch_ids(["abc", "1605.08386", "not/an id"])
+        results = list(lookup)
+        self.assertListEqual([r.get_short_id() for r in results], ["1605.08386v1"])
+        self.assertListEqual(lookup.invalid, ["abc", "not/an id"])
+        self.assertListEqual(lookup.missing, ["abc", "not/an id"])
+
+    def test_distinct_spellings_not_collapsed(self):
+        lookup = arxiv.Client().fetch_ids(["0704.0001", "0704.00001", "2107.5580"])
+        self.assertListEqual(lookup.ids, ["0704.0001"])
+        self.assertListEqual(lookup.invalid, ["0704.00001", "2107.5580"])
+
+    def test_rejected_batch_bisected(self):
+        rejected = "2101.00003"
+
+        def results(search):
+            if rejected in search.id_list:
+                raise arxiv.HTTPError("url", 3, 400)
+            return iter(
+                [arxiv.Result("http://arxiv.org/abs/{}v1".format(id)) for id in search.id_list]
+            )
+
+        client = arxiv.Client()
+        client.results = MagicMock(side_effect=results)
+        ids = ["2101.{:05d}".format(i) for i in range(1, 6)]
+        lookup = client.fetch_ids(ids)
+        results = list(lookup)
+        self.assertListEqual(
+            [r.get_short_id() for r in results],
+            [id + "v1" for id in ids if id != rejected],
+        )
+        self.assertListEqual(lookup.missing, [rejected])
+        # Other errors aren't retried piecemeal.
+        client.results = MagicMock(side_effect=arxiv.HTTPError("url", 3, 503))
+        with self.assertRaises(arxiv.HTTPError):
+            list(client.fetch_ids(ids))
+
+    def test_legacy_subject_class(self):
+        client = arxiv.Client()
+        client.results = MagicMock(
+            return_value=iter([arxiv.Result("http://arxiv.org/abs/math/0309136v2")])
+        )
+        lookup = client.fetch_ids(["math.GT/0309136"])
+        self.assertListEqual(lookup.ids, ["math/0309136"])
+        results = list(lookup)
+        self.assertListEqual([r.get_short_id() for r in results], ["math/0309136v2"])
+        self.assertListEqual(lookup.missing, [])
+        search = client.results.call_args.args[0]
+        self.assertListEqual(search.id_list, ["math/0309136"])
+
+    def test_iterate_once(self):
+        lookup = arxiv.Client().fetch_ids(["1605.08386"])
+        list(lookup)
+        with self.assertRaises(RuntimeError):
+            list(lookup)
+
+
+class TestBatches(unittest.TestCase):
+    def test_batch_size(self):
+        ids = [f"2101.{i:05d}" for i in range(5)]
+        self.assertListEqual(
+            list(_bulk._batches(ids, batch_size=2, max_id_list_length=10**6)),
+            [ids[0:2], ids[2:4], ids[4:5]],
+        )
+
+    def test_url_length(self):
+        # Each ID is 10 characters; separators encode to 3 ("%2C").
+        ids = [f"2101.{i:05d}" for i in range(5)]
+        batches = list(_bulk._batches(ids, batch_size=100, max_id_list_length=23))
+        self.assertListEqual(batches, [ids[0:2], ids[2:4], ids[4:5]])
+        # Slashes in legacy IDs are encoded too.
+        self.assertListEqual(
+            list(_bulk._batches(["hep-th/9901001"] * 2, batch_size=100, max_id_list_length=34)),
+            [["hep-th/9901001"], ["hep-th/9901001"]],
+        )
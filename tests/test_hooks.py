@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import patch
+
+import arxiv
+from tests.test_client import empty_response
+
+
+class RecordingHooks(arxiv.ClientHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, url, try_index):
+        self.events.append(("request_start", try_index))
+
+    def on_response(self, url, status, seconds):
+        self.events.append(("response", status))
+
+    def on_parsed(self, url, feed, results):
+        self.events.append(("parsed", results))
+
+    def on_retry(self, url, err, try_index, wait):
+        self.events.append(("retry", try_index))
+
+    def on_sleep(self, seconds, reason):
+        self.events.append(("sleep", reason))
+
+
+class TestHooks(unittest.TestCase):
+    def test_events(self):
+        page = [("request_start", 0), ("response", 200), ("parsed", 10)]
+        hooks = RecordingHooks()
+        client = arxiv.Client(page_size=10, hooks=[hooks])
+        list(client.results(arxiv.Search("testing", max_results=20)))
+        self.assertListEqual(hooks.events, page + [("sleep", "rate_limit")] + page)
+
+    def test_stream_events(self):
+        hooks = RecordingHooks()
+        client = arxiv.Client(page_size=10, stream=True, hooks=[hooks])
+        list(client.results(arxiv.Search("testing", max_results=20)))
+        # A streamed page is reported as parsed once it's fully consumed, or
+        # when iteration stops partway through it, as at the last result.
+        page = [("request_start", 0), ("response", 200), ("parsed", 10)]
+        self.assertListEqual(hooks.events, page + [("sleep", "rate_limit")] + page)
+
+    @patch("requests.Session.get", return_value=empty_response(503))
+    def test_retry_events(self, mock_get):
+        hooks = RecordingHooks()
+        policy = arxiv.RetryPolicy(backoff=1.0)
+        client = arxiv.Client(num_retries=1, retry_policy=policy, hooks=[hooks])
+        with self.assertRaises(arxiv.HTTPError):
+            list(client.results(arxiv.Search("testing")))
+        self.assertIn(("retry", 0), hooks.events)
+        self.assertIn(("sleep", "backoff"), hooks.events)
+        self.assertEqual(client.stats.retries["http_503"], 1)
+        self.assertEqual(client.stats.responses[503], 2)
+        self.assertEqual(client.stats.backoff_sleep.count, 1)
+
+
+class TestClientStats(unittest.TestCase):
+    def test_stats(self):
+        client = arxiv.Client(page_size=10)
+        list(client.results(arxiv.Search("testing", max_results=30)))
+        stats = client.stats
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.responses[200], 3)
+        self.assertEqual(stats.pages, 3)
+        self.assertEqual(stats.results, 30)
+        self.assertGreater(stats.bytes_received, 0)
+        self.assertEqual(stats.network.count, 3)
+        self.assertEqual(stats.parse.count, 3)
+        self.assertGreater(stats.build.sum, 0)
+        self.assertEqual(stats.rate_limit_sleep.count, 2)
+        snapshot = stats.to_dict()
+        self.assertEqual(snapshot["results"], 30)
+        self.assertEqual(snapshot["network"]["buckets"]["+Inf"], 3)
+        stats.reset()
+        self.assertEqual(stats.requests, 0)
+
+    def test_stream_stats_match_buffered(self):
+        search = arxiv.Search("testing", max_results=20)
+        buffered = arxiv.Client(page_size=10)
+        streamed = arxiv.Client(page_size=10, stream=True)
+        list(buffered.results(search))
+        list(streamed.results(search))
+        for name in ("requests", "pages", "results"):
+            self.assertEqual(getattr(streamed.stats, name), getattr(buffered.stats, name), name)
+        self.assertEqual(streamed.stats.parse.count, buffered.stats.parse.count)
+
+    def test_histogram(self):
+        histogram = arxiv.LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in [0.05, 0.5, 0.5, 5.0]:
+            histogram.observe(seconds)
+        self.assertListEqual(histogram.counts, [1, 2, 1])
+        self.assertEqual(histogram.mean, 1.5125)
+        self.assertEqual(histogram.quantile(0.5), 1.0)
+        self.assertEqual(histogram.quantile(1.0), 5.0)
+        self.assertDictEqual(histogram.to_dict()["buckets"], {"0.1": 1, "1.0": 3, "+Inf": 4})
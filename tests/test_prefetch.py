@@ -0,0 +1,67 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import arxiv
+from tests.test_client import empty_response
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_same_results(self):
+        search = arxiv.Search(query="testing", max_results=55)
+        serial = list(arxiv.Client(page_size=10).results(search))
+        for prefetch in [1, 3]:
+            prefetched = list(arxiv.Client(page_size=10, prefetch=prefetch).results(search))
+            self.assertListEqual(prefetched, serial)
+
+    def test_fetches_ahead(self):
+        client = arxiv.Client(page_size=10, prefetch=1)
+        second_page_fetched = threading.Event()
+        parse_feed = client._parse_feed
+
+        def tracking_parse_feed(url, **kwargs):
+            feed = parse_feed(url, **kwargs)
+            if "start=10" in url:
+                second_page_fetched.set()
+            return feed
+
+        client._parse_feed = tracking_parse_feed
+        results = client.results(arxiv.Search(query="testing", max_results=20))
+        next(results)
+        # The second page arrives while the consumer is still on the first.
+        self.assertTrue(second_page_fetched.wait(timeout=5))
+        self.assertEqual(len(list(results)), 19)
+
+    def test_stops_at_max_results(self):
+        client = arxiv.Client(page_size=10, prefetch=3)
+        client._parse_feed = MagicMock(wraps=client._parse_feed)
+        results = list(client.results(arxiv.Search(query="testing", max_results=20)))
+        self.assertEqual(len(results), 20)
+        urls = [c.args[0] for c in client._parse_feed.call_args_list]
+        self.assertEqual(len(urls), 2)
+
+    def test_bounded_depth(self):
+        client = arxiv.Client(page_size=10, prefetch=1)
+        client._parse_feed = MagicMock(wraps=client._parse_feed)
+        results = client.results(arxiv.Search(query="testing", max_results=55))
+        next(results)
+        # Give the producer time to run ahead as far as it's allowed to.
+        threading.Event().wait(0.2)
+        self.assertEqual(client._parse_feed.call_count, 2)
+        self.assertEqual(len(list(results)), 54)
+
+    @patch("requests.Session.get", return_value=empty_response(500))
+    def test_propagates_errors(self, mock_get):
+        client = arxiv.Client(prefetch=1, num_retries=1)
+        with self.assertRaises(arxiv.HTTPError):
+            next(client.results(arxiv.Search(query="quantum")))
+
+    def test_propagates_base_exceptions(self):
+        class Interrupt(BaseException):
+            pass
+
+        client = arxiv.Client(page_size=10, prefetch=1)
+        client._parse_feed = MagicMock(side_effect=Interrupt)
+        # Without forwarding, the consumer would wait on the buffer forever.
+        with self.assertRaises(Interrupt):
+            next(client.results(arxiv.Search(query="testing", max_results=20)))
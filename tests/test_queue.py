@@ -0,0 +1,87 @@
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import arxiv
+
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "queue.db"
+        self.queue = arxiv.WorkQueue(self.path)
+        self.search = arxiv.Search(query="testing", max_results=None)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_add_ranges(self):
+        ids = self.queue.add_ranges(self.search, 25, 10)
+        self.assertEqual(len(ids), 3)
+        units = [self.queue.claim("w") for _ in ids]
+        self.assertListEqual([(u.start, u.end) for u in units], [(0, 10), (10, 20), (20, 25)])
+        self.assertIsNone(self.queue.claim("w"))
+        self.assertEqual(self.queue.counts()["leased"], 3)
+
+    def test_claim_is_exclusive(self):
+        self.queue.add(self.search)
+        other = arxiv.WorkQueue(self.path)
+        unit = self.queue.claim("a")
+        self.assertIsNotNone(unit)
+        self.assertIsNone(other.claim("b"))
+        self.assertFalse(other.complete(unit, "b"))
+        self.assertTrue(self.queue.complete(unit, "a"))
+        self.assertEqual(other.counts()["done"], 1)
+        self.assertEqual(other.unfinished(), 0)
+
+    def test_expired_lease_reclaimed(self):
+        self.queue.add(self.search)
+        unit = self.queue.claim("a")
+        with patch("time.time", return_value=time.time() + 3600):
+            reclaimed = self.queue.claim("b")
+            self.assertEqual(reclaimed.id, unit.id)
+            self.assertEqual(reclaimed.attempts, 2)
+            self.assertFalse(self.queue.heartbeat(unit, "a"))
+            self.assertTrue(self.queue.heartbeat(reclaimed, "b"))
+
+    def test_max_attempts(self):
+        queue = arxiv.WorkQueue(self.path, lease_duration=timedelta(0), max_attempts=2)
+        queue.add(self.search)
+        for now in [1, 2]:
+            with patch("time.time", return_value=time.time() + now):
+                self.assertIsNotNone(queue.claim("a"))
+        with patch("time.time", return_value=time.time() + 3):
+            self.assertIsNone(queue.claim("a"))
+        self.assertEqual(queue.counts()["failed"], 1)
+
+    def test_worker_run(self):
+        expected = list(arxiv.Client(page_size=10).results(arxiv.Search("testing", max_results=30)))
+        self.queue.add_ranges(self.search, 30, 10)
+        got = []
+        worker = arxiv.Worker(self.queue, arxiv.Client(page_size=10), name="w")
+        self.assertEqual(worker.run(lambda unit, r: got.append(r)), 3)
+        self.assertListEqual(got, expected)
+        self.assertEqual(self.queue.counts()["done"], 3)
+
+    def test_worker_resumes_from_checkpoint(self):
+        expected = list(arxiv.Client(page_size=10).results(arxiv.Search("testing", max_results=30)))
+        self.queue.add(self.search, 0, 30)
+        worker = arxiv.Worker(self.queue, arxiv.Client(page_size=10), name="a")
+        got = []
+
+        def crash(unit, result):
+            if len(got) == 15:
+                raise RuntimeError("crash")
+            got.append(result)
+
+        with self.assertRaises(RuntimeError):
+            worker.run(crash)
+        self.assertEqual(self.queue.counts()["pending"], 1)
+
+        resumed = []
+        worker = arxiv.Worker(self.queue, arxiv.Client(page_size=10), name="b")
+        worker.run(lambda unit, r: resumed.append(r))
+        self.assertListEqual(got[:10] + resumed, expected)
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import approx
+
+import arxiv
+from tests.test_client import empty_response
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_abstract(self):
+        class Incomplete(arxiv.RateLimiter):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestInMemoryRateLimiter(unittest.TestCase):
+    def test_reserve(self):
+        limiter = arxiv.InMemoryRateLimiter()
+        self.assertEqual(limiter.reserve(3.0), 0)
+        self.assertEqual(limiter.reserve(3.0), approx(3.0, abs=0.1))
+        self.assertEqual(limiter.reserve(3.0), approx(6.0, abs=0.1))
+
+    def test_zero_interval(self):
+        limiter = arxiv.InMemoryRateLimiter()
+        for _ in range(3):
+            self.assertLessEqual(limiter.reserve(0), 0)
+
+
+class TestSQLiteRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "limiter.sqlite"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_shared_between_instances(self):
+        # Separate instances stand in for separate processes.
+        first = arxiv.SQLiteRateLimiter(self.path)
+        second = arxiv.SQLiteRateLimiter(self.path)
+        self.assertEqual(first.reserve(3.0), 0)
+        self.assertEqual(second.reserve(3.0), approx(3.0, abs=0.1))
+        self.assertEqual(first.reserve(3.0), approx(6.0, abs=0.1))
+
+    def test_persists_last_request(self):
+        arxiv.SQLiteRateLimiter(self.path).reserve(3.0)
+        # A fresh process must not fire early...
+        self.assertEqual(arxiv.SQLiteRateLimiter(self.path).reserve(3.0), approx(3.0, abs=0.1))
+        # ...nor wait for a request made long ago.
+        with patch("time.time", return_value=10**10):
+            self.assertEqual(arxiv.SQLiteRateLimiter(self.path).reserve(3.0), 0)
+
+    def test_keys_are_independent(self):
+        arxiv.SQLiteRateLimiter(self.path, key="a").reserve(3.0)
+        self.assertEqual(arxiv.SQLiteRateLimiter(self.path, key="b").reserve(3.0), 0)
+
+    @patch("requests.Session.get", return_value=empty_response(200))
+    @patch("time.sleep", return_value=None)
+    def test_clients_share_budget(self, mock_sleep, mock_get):
+        limiter = arxiv.SQLiteRateLimiter(self.path)
+        clients = [arxiv.Client(rate_limiter=limiter), arxiv.Client(rate_limiter=limiter)]
+        url = clients[0]._format_url(arxiv.Search(query="quantum"), 0, 1)
+        clients[0]._parse_feed(url)
+        mock_sleep.assert_not_called()
+        clients[1]._parse_feed(url)
+        mock_sleep.assert_called_once_with(approx(3.0, abs=0.1))
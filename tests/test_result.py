@@ -2,9 +2,19 @@ import arxiv
 import unittest
 import re
 import time
+import pickle
 from datetime import datetime, timezone
 
 
+def is_set(result, name):
+    """Whether a result has attribute `name` set, without decoding it."""
+    try:
+        object.__getattribute__(result, name)
+    except AttributeError:
+        return False
+    return True
+
+
 class TestResult(unittest.TestCase):
     def assert_nonempty(self, s):
         self.assertIsNotNone(s)
@@ -134,3 +144,92 @@ class TestResult(unittest.TestCase):
         result = next(client.results(arxiv.Search(id_list=["1605.08386"])))
         for author in result.authors:
             self.assertEqual(author.affiliation, [])
+
+
+class TestLazyResult(unittest.TestCase):
+    def test_lazy_matches_eager(self):
+        search = arxiv.Search("testing", max_results=100)
+        eager = list(arxiv.Client().results(search))
+        lazy = list(arxiv.Client(lazy=True).results(search))
+        self.assertListEqual(lazy, eager)
+        for a, b in zip(lazy, eager):
+            self.assertEqual(repr(a), repr(b))
+            self.assertEqual(a.pdf_url, b.pdf_url)
+
+    def test_decodes_on_first_access(self):
+        result = next(arxiv.Client(lazy=True).results(arxiv.Search("testing", max_results=1)))
+        # Comparison and short IDs don't decode anything.
+        self.assertEqual(result, arxiv.Result(result.entry_id))
+        result.get_short_id()
+        self.assertFalse(is_set(result, "authors"))
+        authors = result.authors
+        self.assertIs(result.authors, authors)
+        self.assertFalse(is_set(result, "links"))
+        self.assertIsNotNone(result.pdf_url)
+        self.assertTrue(is_set(result, "links"))
+        with self.assertRaises(AttributeError):
+            result.nonexistent
+
+
+class TestProjectedResult(unittest.TestCase):
+    def test_projection_matches_eager(self):
+        search = arxiv.Search("testing", max_results=100)
+        eager = list(arxiv.Client().results(search))
+        projected = list(arxiv.Client().results(search, fields=["updated", "pdf_url"]))
+        self.assertListEqual(projected, eager)
+        for a, b in zip(projected, eager):
+            self.assertEqual(a.updated, b.updated)
+            self.assertEqual(a.pdf_url, b.pdf_url)
+            self.assertEqual(
+                repr(a),
+                "arxiv.Result(entry_id={}, updated={}, pdf_url={})".format(
+                    repr(b.entry_id), repr(b.updated), repr(b.pdf_url)
+                ),
+            )
+
+    def test_unrequested_fields(self):
+        search = arxiv.Search("testing", max_results=1)
+        result = next(arxiv.Client().results(search, fields=["title"]))
+        self.assertEqual(
+            {name for name in arxiv.Result.__slots__ if is_set(result, name)},
+            {"_fields", "entry_id", "title"},
+        )
+        with self.assertRaisesRegex(AttributeError, "requested fields"):
+            result.summary
+        with self.assertRaises(ValueError):
+            arxiv.Client().results(search, fields=["title", "abstract"])
+
+
+class TestCompactResult(unittest.TestCase):
+    def test_no_instance_dict(self):
+        result = next(arxiv.Client().results(arxiv.Search("testing", max_results=1)))
+        for o in (result, result.authors[0], result.links[0]):
+            self.assertFalse(hasattr(o, "__dict__"))
+        with self.assertRaises(AttributeError):
+            result.nonexistent = 1
+
+    def test_pickle(self):
+        search = arxiv.Search("testing", max_results=1)
+        for client, kwargs in (
+            (arxiv.Client(), {}),
+            (arxiv.Client(lazy=True), {}),
+            (arxiv.Client(), {"fields": ["title", "links"]}),
+        ):
+            result = next(client.results(search, **kwargs))
+            restored = pickle.loads(pickle.dumps(result))
+            self.assertEqual(restored, result)
+            self.assertEqual(repr(restored), repr(result))
+            self.assertEqual(restored.links, result.links)
+
+    def test_unpickle_dict_state(self):
+        # The state of a result pickled before `Result` had slots.
+        author = arxiv.Result.Author.__new__(arxiv.Result.Author)
+        author.__setstate__({"name": "A. Author", "affiliation": []})
+        result = arxiv.Result.__new__(arxiv.Result)
+        template = arxiv.Result("http://arxiv.org/abs/2107.05580v1", authors=[author])
+        result.__setstate__(
+            {name: getattr(template, name) for name in template.__slots__ if name[0] != "_"}
+        )
+        self.assertEqual(result.get_short_id(), "2107.05580v1")
+        self.assertEqual(result.authors[0].name, "A. Author")
+        self.assertIsNone(result.pdf_url)
@@ -0,0 +1,70 @@
+import unittest
+
+import arxiv
+
+
+def result(short_id):
+    return arxiv.Result("http://arxiv.org/abs/" + short_id)
+
+
+class TestResultSet(unittest.TestCase):
+    def test_hashable(self):
+        a, b = result("2107.05580v1"), result("2107.05580v1")
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual({a: 1}[b], 1)
+        self.assertNotEqual(hash(a), hash(result("2107.05580v2")))
+
+    def test_lookup(self):
+        results = arxiv.ResultSet(
+            result(i)
+            for i in ("2107.05580v1", "2107.05580v3", "quant-ph/0201082v1", "2107.05580v2")
+        )
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results.get("2107.05580v1"), result("2107.05580v1"))
+        self.assertEqual(results.get("2107.05580"), result("2107.05580v3"))
+        self.assertEqual(results.get("quant-ph/0201082"), result("quant-ph/0201082v1"))
+        self.assertIsNone(results.get("2107.05580v4"))
+        self.assertIsNone(results.get("2107.05581"))
+        self.assertEqual(results.get("arXiv:2107.05580v2"), result("2107.05580v2"))
+        self.assertIsNone(results.get("not an id"))
+        self.assertListEqual(
+            [r.get_short_id() for r in results.versions("2107.05580")],
+            ["2107.05580v1", "2107.05580v2", "2107.05580v3"],
+        )
+        self.assertEqual(
+            set(results.latest()), {result("2107.05580v3"), result("quant-ph/0201082v1")}
+        )
+        results.discard(result("2107.05580v3"))
+        self.assertEqual(results.get("2107.05580"), result("2107.05580v2"))
+        self.assertNotIn(result("2107.05580v3"), results)
+
+    def test_non_arxiv_entry_ids(self):
+        other = arxiv.Result("https://example.org/x")
+        results = arxiv.ResultSet([other, result("2107.05580v1")])
+        self.assertIn(other, results)
+        self.assertEqual(set(results.latest()), set(results))
+        results.discard(other)
+        self.assertEqual(len(results), 1)
+
+    def test_same_id_different_entry_ids(self):
+        a = arxiv.Result("http://arxiv.org/abs/2107.05580v1")
+        b = arxiv.Result("http://export.arxiv.org/abs/2107.05580v1")
+        results = arxiv.ResultSet([a, b])
+        self.assertEqual(len(results), 2)
+        self.assertIs(results.get("2107.05580v1"), a)
+        results.discard(a)
+        self.assertIs(results.get("2107.05580v1"), b)
+        self.assertListEqual(results.versions("2107.05580"), [b])
+        results.discard(b)
+        self.assertIsNone(results.get("2107.05580"))
+
+    def test_merge_overlapping_searches(self):
+        client = arxiv.Client(page_size=10)
+        search = arxiv.Search("testing", max_results=10)
+        first = arxiv.ResultSet(client.results(search))
+        shifted = list(client.results(arxiv.Search("testing", max_results=15), offset=5))
+        self.assertEqual(len(first.union(shifted)), 15)
+        self.assertEqual(len(first.difference(shifted)), 5)
+        self.assertEqual(len(first & arxiv.ResultSet(shifted)), 5)
+        self.assertEqual(len(first | arxiv.ResultSet(shifted)), 15)
+        self.assertListEqual(list(first), list(client.results(search)))
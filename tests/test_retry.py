@@ -0,0 +1,111 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+from pytest import approx
+from requests import Response
+
+import arxiv
+from arxiv._retry import _parse_retry_after
+
+URL = "https://export.arxiv.org/api/query"
+
+
+def error_response(code: int, retry_after: str | None = None) -> Response:
+    r = Response()
+    r.status_code = code
+    r._content = b""
+    if retry_after is not None:
+        r.headers["Retry-After"] = retry_after
+    return r
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_default_waits_only_for_rate_limit(self):
+        policy = arxiv.RetryPolicy()
+        for try_index in range(5):
+            self.assertEqual(
+                policy.wait_before_retry(arxiv.HTTPError(URL, 0, 500), try_index, 0), 0
+            )
+
+    def test_exponential_backoff(self):
+        policy = arxiv.RetryPolicy(backoff=2.0, backoff_factor=3.0, max_backoff=50.0)
+        err = arxiv.HTTPError(URL, 0, 503)
+        waits = [policy.wait_before_retry(err, i, 0) for i in range(4)]
+        self.assertListEqual(waits, [2.0, 6.0, 18.0, 50.0])
+
+    def test_jitter(self):
+        policy = arxiv.RetryPolicy(backoff=10.0, jitter=0.5)
+        err = arxiv.HTTPError(URL, 0, 503)
+        for _ in range(100):
+            wait = policy.wait_before_retry(err, 0, 0)
+            self.assertGreaterEqual(wait, 5.0)
+            self.assertLessEqual(wait, 10.0)
+
+    def test_retry_after(self):
+        policy = arxiv.RetryPolicy(backoff=1.0)
+        self.assertEqual(policy.wait_before_retry(arxiv.HTTPError(URL, 0, 429, 30.0), 0, 0), 30.0)
+        ignoring = arxiv.RetryPolicy(backoff=1.0, respect_retry_after=False)
+        self.assertEqual(ignoring.wait_before_retry(arxiv.HTTPError(URL, 0, 429, 30.0), 0, 0), 1.0)
+
+    def test_rules(self):
+        policy = arxiv.RetryPolicy(
+            retry_statuses={429, 503}, retry_empty_pages=False, retry_connection_errors=False
+        )
+        self.assertIsNotNone(policy.wait_before_retry(arxiv.HTTPError(URL, 0, 503), 0, 0))
+        self.assertIsNone(policy.wait_before_retry(arxiv.HTTPError(URL, 0, 400), 0, 0))
+        empty = arxiv.UnexpectedEmptyPageError(URL, 0, None)
+        self.assertIsNone(policy.wait_before_retry(empty, 0, 0))
+        self.assertIsNone(policy.wait_before_retry(ConnectionError(), 0, 0))
+
+    def test_time_budget(self):
+        policy = arxiv.RetryPolicy(backoff=10.0, max_elapsed=30.0)
+        err = arxiv.HTTPError(URL, 0, 503)
+        self.assertEqual(policy.wait_before_retry(err, 0, 15.0), 10.0)
+        self.assertIsNone(policy.wait_before_retry(err, 0, 25.0))
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertEqual(_parse_retry_after(" 120 "), 120.0)
+        later = datetime.now(timezone.utc) + timedelta(seconds=60)
+        self.assertEqual(_parse_retry_after(format_datetime(later, usegmt=True)), approx(60, abs=2))
+
+
+class TestClientRetries(unittest.TestCase):
+    @patch("time.sleep", return_value=None)
+    def test_honors_retry_after(self, mock_sleep):
+        client = arxiv.Client(num_retries=1, delay_seconds=0)
+        with patch("requests.Session.get", return_value=error_response(503, "17")):
+            with self.assertRaises(arxiv.HTTPError) as ctx:
+                client._parse_feed(URL)
+        self.assertEqual(ctx.exception.retry_after, 17.0)
+        mock_sleep.assert_called_once_with(17.0)
+
+    @patch("time.sleep", return_value=None)
+    def test_backoff(self, mock_sleep):
+        policy = arxiv.RetryPolicy(backoff=1.0)
+        client = arxiv.Client(num_retries=3, delay_seconds=0, retry_policy=policy)
+        with patch("requests.Session.get", return_value=error_response(500)):
+            with self.assertRaises(arxiv.HTTPError):
+                client._parse_feed(URL)
+        self.assertListEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0, 4.0])
+
+    def test_non_retryable_status(self):
+        client = arxiv.Client(retry_policy=arxiv.RetryPolicy(retry_statuses={503}))
+        with patch("requests.Session.get", return_value=error_response(400)) as mock_get:
+            with self.assertRaises(arxiv.HTTPError):
+                client._parse_feed(URL)
+        mock_get.assert_called_once()
+
+    def test_iterative(self):
+        # More retries than the recursion limit allows.
+        client = arxiv.Client(num_retries=2000, delay_seconds=0)
+        mock_get = MagicMock(return_value=error_response(500))
+        with patch("requests.Session.get", mock_get), patch("time.sleep") as mock_sleep:
+            with self.assertRaises(arxiv.HTTPError) as ctx:
+                client._parse_feed(URL)
+        self.assertEqual(ctx.exception.retry, 2000)
+        self.assertEqual(mock_get.call_count, 2001)
+        mock_sleep.assert_not_called()
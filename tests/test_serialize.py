@@ -0,0 +1,94 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import arxiv
+
+
+def fetch(client=None, **kwargs):
+    search = arxiv.Search("testing", max_results=100)
+    return list((client or arxiv.Client()).results(search, **kwargs))
+
+
+class TestResultDict(unittest.TestCase):
+    def assert_same(self, a, b):
+        self.assertEqual(repr(a), repr(b))
+        self.assertEqual(a.pdf_url, b.pdf_url)
+        self.assertEqual([link.title for link in a.links], [link.title for link in b.links])
+        self.assertEqual(
+            [author.affiliation for author in a.authors],
+            [author.affiliation for author in b.authors],
+        )
+
+    def test_roundtrip(self):
+        for result in fetch():
+            self.assert_same(arxiv.Result.from_dict(result.to_dict()), result)
+
+    def test_lazy(self):
+        for lazy, eager in zip(fetch(arxiv.Client(lazy=True)), fetch()):
+            self.assertEqual(lazy.to_dict(), eager.to_dict())
+
+    def test_projected(self):
+        result = fetch(fields=["updated"])[0]
+        data = result.to_dict()
+        self.assertEqual(set(data), {"version", "entry_id", "updated"})
+        restored = arxiv.Result.from_dict(data)
+        self.assertEqual(repr(restored), repr(result))
+        with self.assertRaisesRegex(AttributeError, "requested fields"):
+            restored.title
+
+    def test_version(self):
+        data = fetch()[0].to_dict()
+        data["version"] = 0
+        with self.assertRaises(ValueError):
+            arxiv.Result.from_dict(data)
+
+    def test_constructed(self):
+        result = arxiv.Result("http://arxiv.org/abs/2107.05580v1")
+        restored = arxiv.Result.from_dict(result.to_dict())
+        self.assertEqual(restored.updated, result.updated)
+        self.assertIsNone(restored.updated.tzinfo)
+
+
+class TestResultPickle(unittest.TestCase):
+    def test_skips_pdf_url(self):
+        for results in (fetch(), fetch(arxiv.Client(lazy=True)), fetch(fields=["pdf_url"])):
+            expected = [r.pdf_url for r in results]
+            data = pickle.dumps(results)
+            with patch.object(arxiv.Result, "_get_pdf_url", side_effect=AssertionError):
+                restored = pickle.loads(data)
+            self.assertListEqual(restored, results)
+            self.assertListEqual([r.pdf_url for r in restored], expected)
+
+
+class TestResultFiles(unittest.TestCase):
+    def test_roundtrip(self):
+        results = fetch()
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("r.jsonl", "r.jsonl.gz", "r.msgpack", "r.msgpack.gz"):
+                path = Path(tmp) / name
+                with arxiv.ResultWriter(path) as writer:
+                    self.assertEqual(writer.write_all(results), 100)
+                with arxiv.ResultReader(path) as reader:
+                    restored = list(reader)
+                self.assertListEqual(restored, results)
+                self.assertListEqual(
+                    [r.to_dict() for r in restored], [r.to_dict() for r in results]
+                )
+
+    def test_append(self):
+        results = fetch()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "r.jsonl"
+            with arxiv.ResultWriter(path) as writer:
+                writer.write_all(results[:10])
+            with arxiv.ResultWriter(path, append=True) as writer:
+                writer.write_all(results[10:])
+            with arxiv.ResultReader(path) as reader:
+                self.assertListEqual(list(reader), results)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            arxiv.ResultWriter("r.csv", format="csv")
@@ -0,0 +1,119 @@
+import re
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+import arxiv
+from arxiv._feed import FeedHeader, ParsedFeed
+
+# The suite patches `requests.Session.get` to serve recorded fixtures; the
+# stand-in test talks to a real (local) server instead.
+_session_get = requests.Session.get
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+END = datetime(2020, 1, 2, tzinfo=timezone.utc)
+
+
+def submissions(n: int) -> list[datetime]:
+    """`n` submission times, bunched towards the start of `START`'s day."""
+    return [START + timedelta(minutes=(i * i) % (24 * 60)) for i in range(n)]
+
+
+def counting_parse_feed(dates: list[datetime]):
+    """Fakes `Client._parse_feed`, counting `dates` within a query's window."""
+    calls = []
+
+    def parse_feed(url: str, first_page: bool = True) -> ParsedFeed:
+        query = parse_qs(urlparse(url).query)["search_query"][0]
+        lo, hi = re.search(r"submittedDate:\[(\d{12}) TO (\d{12})\]", query).groups()
+        lo_dt = datetime.strptime(lo, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+        hi_dt = datetime.strptime(hi, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+        calls.append(query)
+        total = sum(1 for d in dates if lo_dt <= d <= hi_dt)
+        return ParsedFeed(header=FeedHeader(total_results=total))
+
+    return parse_feed, calls
+
+
+class TestShardPlanner(unittest.TestCase):
+    def test_plan(self):
+        dates = submissions(500)
+        client = arxiv.Client()
+        parse_feed, calls = counting_parse_feed(dates)
+        planner = arxiv.ShardPlanner(client, target_size=100, start=START, end=END)
+        with patch.object(client, "_parse_feed", side_effect=parse_feed):
+            shards = planner.plan(arxiv.Search(query="cat:hep-th", max_results=None))
+
+        self.assertEqual(sum(s.total_results for s in shards), len(dates))
+        for shard in shards:
+            self.assertLessEqual(shard.total_results, 100)
+            self.assertTrue(shard.search.query.startswith("(cat:hep-th) AND submittedDate:["))
+            self.assertIsNone(shard.search.max_results)
+        for before, after in zip(shards, shards[1:]):
+            self.assertLessEqual(before.end, after.start)
+        self.assertTrue(all("cat:hep-th" in q for q in calls))
+
+    def test_unsplittable_window(self):
+        dates = [START] * 5
+        client = arxiv.Client()
+        parse_feed, _ = counting_parse_feed(dates)
+        planner = arxiv.ShardPlanner(client, target_size=2, start=START, end=END)
+        with patch.object(client, "_parse_feed", side_effect=parse_feed):
+            shards = planner.plan(arxiv.Search(query="all:electron"))
+        self.assertEqual(len(shards), 1)
+        self.assertEqual(shards[0].end - shards[0].start, timedelta(minutes=1))
+        self.assertEqual(shards[0].total_results, 5)
+
+    def test_halves_short(self):
+        client = arxiv.Client()
+        parse_feed, calls = counting_parse_feed(submissions(500))
+
+        def lossy_parse_feed(url: str, first_page: bool = True) -> ParsedFeed:
+            # Only the first request, for the whole range, counts anything.
+            return parse_feed(url, first_page) if not calls else ParsedFeed(header=FeedHeader())
+
+        planner = arxiv.ShardPlanner(client, target_size=100, start=START, end=END)
+        with patch.object(client, "_parse_feed", side_effect=lossy_parse_feed):
+            with self.assertLogs("arxiv._shard", "WARNING") as logs:
+                self.assertListEqual(planner.plan(arxiv.Search(query="x")), [])
+        self.assertIn("halves only 0", logs.output[0])
+
+    def test_requires_query(self):
+        with self.assertRaises(ValueError):
+            arxiv.ShardPlanner(arxiv.Client()).plan(arxiv.Search(id_list=["1605.08386"]))
+
+    def test_results_union(self):
+        client = arxiv.Client()
+        planner = arxiv.ShardPlanner(client)
+        queries = ["first", "second", "third"]
+        shards = [arxiv.Shard(arxiv.Search(query=q), START, END, 2) for q in queries]
+        by_query = {
+            "first": [arxiv.Result("a"), arxiv.Result("b")],
+            "second": [arxiv.Result("b"), arxiv.Result("c")],
+            "third": [arxiv.Result("c"), arxiv.Result("d")],
+        }
+        with patch.object(client, "results", side_effect=lambda s: iter(by_query[s.query])):
+            results = planner.results(arxiv.Search(query="x", max_results=None), shards=shards)
+            self.assertListEqual([r.entry_id for r in results], ["a", "b", "c", "d"])
+            limited = planner.results(arxiv.Search(query="x", max_results=2), shards=shards)
+            self.assertListEqual([r.entry_id for r in limited], ["a", "b"])
+
+    def test_empty_pages(self):
+        with (
+            patch.object(requests.Session, "get", _session_get),
+            arxiv.StandInServer(total_results=5000, empty_page_rate=0.2, seed=3) as server,
+        ):
+            client = arxiv.Client(page_size=500, delay_seconds=0, num_retries=5)
+            client.query_url_format = server.query_url_format
+            planner = arxiv.ShardPlanner(
+                client, target_size=1000, start=datetime(2000, 1, 1), end=datetime(2000, 3, 1)
+            )
+            search = arxiv.Search(query="x", max_results=None)
+            shards = planner.plan(search)
+            self.assertEqual(sum(s.total_results for s in shards), 5000)
+            results = list(planner.results(search, shards=shards))
+        self.assertEqual(len({r.entry_id for r in results}), 5000)
+        self.assertGreater(client.stats.retries["empty_page"], 0)
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import requests
+
+import arxiv
+
+# The suite patches `requests.Session.get` to serve recorded fixtures; these
+# tests talk to a real (local) server instead.
+_session_get = requests.Session.get
+
+
+class TestStandInServer(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(requests.Session, "get", _session_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def client(self, server: arxiv.StandInServer, **kwargs) -> arxiv.Client:
+        client = arxiv.Client(delay_seconds=0, **kwargs)
+        client.query_url_format = server.query_url_format
+        return client
+
+    def test_paging(self):
+        with arxiv.StandInServer(total_results=250) as server:
+            client = self.client(server, page_size=100)
+            results = list(client.results(arxiv.Search(query="anything", max_results=None)))
+        self.assertEqual(len(results), 250)
+        self.assertEqual(len({r.entry_id for r in results}), 250)
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(results[0].get_short_id(), "0001.0001v1")
+        self.assertEqual(results[0].primary_category, "cs.LG")
+        self.assertEqual(results[0].published, datetime(2000, 1, 1, tzinfo=timezone.utc))
+
+    def test_sort_order(self):
+        with arxiv.StandInServer(total_results=50) as server:
+            client = self.client(server)
+            newest = next(
+                client.results(arxiv.Search(query="x", sort_by=arxiv.SortCriterion.SubmittedDate))
+            )
+            oldest = next(
+                client.results(
+                    arxiv.Search(
+                        query="x",
+                        sort_by=arxiv.SortCriterion.SubmittedDate,
+                        sort_order=arxiv.SortOrder.Ascending,
+                    )
+                )
+            )
+        self.assertGreater(newest.published, oldest.published)
+
+    def test_filters(self):
+        with arxiv.StandInServer(total_results=6 * 24 * 30) as server:
+            client = self.client(server, page_size=1000)
+            query = "cat:hep-th AND submittedDate:[200001020000 TO 200001022359]"
+            results = list(client.results(arxiv.Search(query=query, max_results=None)))
+            self.assertEqual(len(results), 24)
+            self.assertTrue(all(r.primary_category == "hep-th" for r in results))
+            self.assertTrue(all(r.published.day == 2 for r in results))
+
+            ids = [results[3].get_short_id(), "9912.0001", "0001.0002", "0001.00002"]
+            by_id = list(client.results(arxiv.Search(id_list=ids)))
+            self.assertListEqual([r.get_short_id() for r in by_id], [ids[0], "0001.0002v1"])
+
+    def test_errors(self):
+        with arxiv.StandInServer(total_results=100, error_rate=0.5, seed=1) as server:
+            client = self.client(server, page_size=10, num_retries=10)
+            results = list(client.results(arxiv.Search(query="x", max_results=None)))
+        self.assertEqual(len(results), 100)
+        self.assertGreater(client.stats.retries["http_503"], 0)
+
+    def test_empty_pages(self):
+        # With seed 0, the first page isn't empty (which would end the search).
+        with arxiv.StandInServer(total_results=100, empty_page_rate=0.3, seed=0) as server:
+            client = self.client(server, page_size=10, num_retries=10)
+            results = list(client.results(arxiv.Search(query="x", max_results=None)))
+        self.assertEqual(len(results), 100)
+        self.assertGreater(client.stats.retries["empty_page"], 0)
@@ -0,0 +1,104 @@
+import io
+import unittest
+from unittest.mock import patch
+
+import requests
+
+import arxiv
+from arxiv import _feed
+
+
+def fixture_body(id: str) -> bytes:
+    client = arxiv.Client()
+    return client._session.get(client._format_url(arxiv.Search(id_list=[id]), 0, 100)).content
+
+
+class TestFeedStream(unittest.TestCase):
+    def test_matches_parse(self):
+        client = arxiv.Client(page_size=100)
+        body = client._session.get(
+            client._format_url(arxiv.Search(query="testing"), 0, 100)
+        ).content
+        parsed = _feed.parse(body)
+        stream = _feed.FeedStream(body[i : i + 1000] for i in range(0, len(body), 1000))
+        results = list(stream)
+        self.assertEqual(len(results), 100)
+        self.assertListEqual(results, parsed.results)
+        self.assertEqual([r.title for r in results], [r.title for r in parsed.results])
+        self.assertEqual(stream.header, parsed.header)
+        self.assertEqual(stream.size, len(body))
+        self.assertFalse(stream.malformed)
+
+    def test_yields_before_end_of_input(self):
+        body = fixture_body("astro-ph/0601001")
+        end_of_entry = body.index(b"</entry>") + len(b"</entry>")
+        chunks_read = []
+
+        def chunks():
+            for chunk in (body[:end_of_entry], body[end_of_entry:]):
+                chunks_read.append(chunk)
+                yield chunk
+
+        first = next(iter(_feed.FeedStream(chunks())))
+        self.assertEqual(first.get_short_id(), "astro-ph/0601001v1")
+        self.assertEqual(len(chunks_read), 1)
+
+    def test_empty_document(self):
+        stream = _feed.FeedStream([])
+        self.assertListEqual(list(stream), [])
+        self.assertTrue(stream.malformed)
+
+
+class TestStreamingClient(unittest.TestCase):
+    def test_same_results(self):
+        search = arxiv.Search(query="testing", max_results=55)
+        expected = list(arxiv.Client(page_size=10).results(search))
+        got = list(arxiv.Client(page_size=10, stream=True).results(search))
+        self.assertListEqual(got, expected)
+
+    def test_offset(self):
+        search = arxiv.Search(query="testing", max_results=10)
+        client = arxiv.Client(page_size=10, stream=True)
+        default = list(client.results(search))
+        self.assertListEqual(list(client.results(search, offset=5)), default[5:])
+
+    def test_empty_first_page(self):
+        client = arxiv.Client(stream=True)
+        self.assertListEqual(list(client.results(arxiv.Search(id_list=["0000.0000"]))), [])
+
+    def test_retry_skips_yielded_results(self):
+        body = fixture_body("astro-ph/0601001")
+        truncated = body[: body.index(b"</entry>") + len(b"</entry>")]
+
+        class BrokenStream(io.BytesIO):
+            def read(self, *args, **kwargs):
+                chunk = super().read(*args, **kwargs)
+                if not chunk:
+                    raise requests.exceptions.ChunkedEncodingError("connection reset")
+                return chunk
+
+        def response(raw):
+            resp = requests.Response()
+            resp.status_code = 200
+            resp.raw = raw
+            return resp
+
+        client = arxiv.Client(stream=True)
+        with patch.object(
+            requests.Session,
+            "get",
+            side_effect=[response(BrokenStream(truncated)), response(io.BytesIO(body))],
+        ):
+            results = list(client.results(arxiv.Search(id_list=["astro-ph/0601001"])))
+        self.assertEqual([r.get_short_id() for r in results], ["astro-ph/0601001v1"])
+
+    @patch("requests.Session.get")
+    def test_http_error(self, mock_get):
+        resp = requests.Response()
+        resp.status_code = 503
+        resp.raw = io.BytesIO(b"")
+        mock_get.return_value = resp
+        client = arxiv.Client(stream=True, num_retries=1)
+        with self.assertRaises(arxiv.HTTPError):
+            list(client.results(arxiv.Search(query="quantum")))
+        self.assertEqual(mock_get.call_count, 2)